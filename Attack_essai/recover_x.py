@@ -1,10 +1,14 @@
 import subprocess
 import re
 import os
+import sys
 from sympy.ntheory.residue_ntheory import discrete_log
 from sympy.ntheory.modular import crt
 from sympy import factorint
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from multiplicative_order import multiplicative_order
+
 def extract_public_key():
     """Extract the DH public key (y_A) from OpenSSL and convert it to an integer."""
     
@@ -47,8 +51,14 @@ with open("dh_values.txt", "r") as f:
 g = 2  # Generator
 
 print(f"Loaded values: p = {p}, q = {q}, g = {g}")
-print(f"Factorization of p-1: {factorint(p - 1)}")
-print(f"Factorization of q-1: {factorint(q - 1)}")
+p_factors = factorint(p - 1)
+q_factors = factorint(q - 1)
+print(f"Factorization of p-1: {p_factors}")
+print(f"Factorization of q-1: {q_factors}")
+
+# Order of g in each group, reusing the factorizations above
+print(f"Order of g mod p: {multiplicative_order(g, p, group_order_factors=p_factors)}")
+print(f"Order of g mod q: {multiplicative_order(g, q, group_order_factors=q_factors)}")
 
 def pohlig_hellman(y, g, p):
     """Computes discrete log x in g^x ≡ y (mod p) using Pohlig-Hellman."""
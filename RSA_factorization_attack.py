@@ -1,6 +1,7 @@
 import sympy
 import random
 import math
+from perfect_power import perfect_power
 
 # Step 1: Generate a small Multiprime RSA Key (for testing)
 def generate_multiprime_rsa_key(bits=40):
@@ -44,6 +45,10 @@ def factorize_N(N):
         if sympy.isprime(N):  # If N is prime, stop
             factors.append(N)
             break
+        power = perfect_power(N)
+        if power is not None and sympy.isprime(power[0]):  # N = p^e, rho would only find p slowly
+            factors.extend([power[0]] * power[1])
+            break
         factor = pollards_rho(N)
         if factor is None:
             break  # Give up if Pollard's fails (would need QS or GNFS)
@@ -10,8 +10,8 @@ def generate_large_prime(bits, test_function, iterations=10):
 
 # Example: RSA Key Generation
 bits = 1024  # Key size
-p = generate_large_prime(bits, miller_rabin_test)  # Using Miller-Rabin
-q = generate_large_prime(bits, miller_rabin_test)
+p = generate_large_prime(bits, bpsw_test)  # Using Baillie-PSW
+q = generate_large_prime(bits, bpsw_test)
 n = p * q
 phi = (p - 1) * (q - 1)
 e = 65537  # Common public exponent
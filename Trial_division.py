@@ -1,20 +1,29 @@
+import itertools
 import math
 import random
 import time
-import psutil
-import tracemalloc
 from gmpy2 import powmod, jacobi
 from math import gcd, log, isqrt
 from random import randint
 from sympy import mod_inverse, isprime, symbols, expand, Mod
 
 from math import gcd, isqrt, log, ceil
-from sympy import symbols, Poly
+from aks_ring import CyclicPolyRing
+from aks_parallel import parallel_polynomial_mod_check
 from testEC import ecpp_certificate
+from bpsw import bpsw_test
+from measurement import BudgetedRun, measure, run_with_budgets
+from combined_tests import combined_probable_prime_tests
+from small_prime_filter import small_prime_prefilter
+from perfect_power import is_perfect_power
+from multiplicative_order import find_r, euler_totient
+from verdict_cache import method_key
 
 # Trial division algorithm
 def Trial_division(n):
-    """Return True if n is prime, False if composite, ignoring small corner cases."""
+    """Return True if n is prime, False if composite."""
+    if n <= 3:
+        return n >= 2
     if n % 2 == 0 or n % 3 == 0:
         return False
     a = math.isqrt(n)
@@ -32,6 +41,11 @@ def fermat_primality_test(n, k):
     if n % 2 == 0:
         return False
 
+    # Reject numbers with small prime factors before any exponentiation
+    verdict = small_prime_prefilter(n)
+    if verdict is not None:
+        return verdict
+
     for _ in range(k):
         # Choose a random base `a` coprime to `n`
         while True:
@@ -52,6 +66,10 @@ def miller_rabin_test(n, k):
     if n % 2 == 0:
         return False
 
+    verdict = small_prime_prefilter(n)
+    if verdict is not None:
+        return verdict
+
     s = 0
     t = n - 1
     while t % 2 == 0:
@@ -79,6 +97,10 @@ def solovay_strassen_test(n, k):
     if n % 2 == 0:
         return n == 2
 
+    verdict = small_prime_prefilter(n)
+    if verdict is not None:
+        return verdict
+
     for _ in range(k):
         a = random.randint(2, n - 2)
         gcd = math.gcd(a, n)
@@ -95,80 +117,31 @@ def solovay_strassen_test(n, k):
     return True
 
 # AKS Algorithm
-# first check if n is perfect power
-def is_perfect_power(n):
-    """
-    Checks if n is a perfect power (n = a^b for a > 1 and b > 1).
-    linear search over all exponents b from 2 to sqrt(n)
-    """
-    for b in range(2, isqrt(n) + 2): # for better speed
-        a = round(n ** (1 / b))
-        if a ** b == n:
-            return True
-    return False
-
-def find_r(n):
-    """
-    Finds the smallest r such that the order of n modulo r is greater than log(n, 2)^2.
-    """
-    max_k = ceil(log(n, 2) ** 2)
-    for r in range(2, n):
-        order = 1
-        while pow(n, order, r) != 1 and order <= max_k:
-            order += 1
-        if order > max_k:
-            return r
-    return n
-
-def euler_totient(r):
-    """
-    Computes Euler's Totient function φ(r).
-    """
-    result = r
-    p = 2
-    while p * p <= r:
-        if r % p == 0:
-            while r % p == 0:
-                r //= p
-            result -= result // p
-        p += 1
-    if r > 1:
-        result -= result // r
-    return result
-
-def poly_mod_exp(base, exp, mod_poly, modulus):
-    """
-    Modular exponentiation for polynomials.
-    """
-    result = Poly(1, symbols('x'), modulus=modulus)
-    base = base % mod_poly
-    while exp > 0:
-        if exp % 2 == 1:
-            result = (result * base) % mod_poly
-        base = (base * base) % mod_poly
-        exp //= 2
-    return result
+# is_perfect_power, find_r and euler_totient live in perfect_power.py and multiplicative_order.py
 
-def optimized_polynomial_mod_check(n, r):
+def optimized_polynomial_mod_check(n, r, processes=None, progress=None):
     """
     Optimized polynomial congruence check:
     Verifies (x + a)^n ≡ x^n + a (mod x^r - 1, n) for 1 ≤ a ≤ √φ(r) log(n).
+    With processes > 1 the range of a is sharded across a process pool.
     """
-    x = symbols('x')
-    mod_poly = Poly(x ** r - 1, x, modulus=n)
+    ring = CyclicPolyRing(n, r)
     max_a = ceil(isqrt(euler_totient(r)) * log(n, 2))
-    
+    if processes is not None and processes > 1:
+        return parallel_polynomial_mod_check(n, r, max_a, processes, progress)
+
     for a in range(1, max_a + 1):
-        base = Poly(x + a, x, modulus=n)
-        lhs = poly_mod_exp(base, n, mod_poly, n)
-        rhs = Poly(x ** n + a, x, modulus=n) % mod_poly
+        lhs = ring.pow_x_plus_a(a, n)
+        rhs = ring.x_power_plus_a(n, a)
         if lhs != rhs:
             return False
     return True
 
-def aks_primality_test(n):
+def aks_primality_test(n, processes=None, progress=None):
     """
     AKS primality test implementation.
+    processes > 1 runs the polynomial congruence checks in parallel,
+    progress(worker_id, checked, total) reports how far each worker got.
     """
     if n < 2:
         return False
@@ -187,7 +160,7 @@ def aks_primality_test(n):
     
     # Step 4: Polynomial congruence check
     if n > r:
-        if not optimized_polynomial_mod_check(n, r):
+        if not optimized_polynomial_mod_check(n, r, processes, progress):
             return False
     
     # Step 5: If all checks pass, n is prime
@@ -196,71 +169,75 @@ def aks_primality_test(n):
 
 
 
-def measure_memory_time(func, *args):
-    """Measure memory and time usage of a function."""
-    tracemalloc.start()
-    start_time = time.perf_counter()
-    start_mem = psutil.Process().memory_info().rss  # Corrected access to memory info
-
-    result = func(*args)
-
-    end_time = time.perf_counter()
-    peak_mem = tracemalloc.get_traced_memory()[1]  # Corrected function call syntax
-    tracemalloc.stop()
-
-    time_taken = end_time - start_time
-    memory_used = peak_mem / (1024 * 1024)  # Convert bytes to MB
-
-    return bool(result), time_taken, memory_used
-
-
-
-def compare_algorithms(n, k, a, b, m, q):
-    """Compare the execution time of Trial Division, Fermat Primality Test, Miller-Rabin Test, AKS. ECPP and Solovay-Strassen Test."""
-    print("Calculations may take some time. Please wait...\n")
-
-    # Timing Trial Division
-    print("Running Trial Division...")
-    trial_result, trial_time, trial_mem = measure_memory_time(Trial_division, n)
-    print(f"Trial Division: {'Prime' if trial_result else 'Composite'}")
-    print(f"Time taken: {trial_time:.9f} seconds | Memory used: {trial_mem:.6f} MB\n")    
-    print("Trial Division completed.\n")
-
-    # Timing Fermat Primality Test
-    print("Running Fermat Primality Test...")
-    fermat_result, fermat_time, fermat_mem = measure_memory_time(fermat_primality_test, n, k)
-    print(f"Fermat Primality Test: {'Probably Prime' if fermat_result else 'Composite'}")
-    print(f"Time taken: {fermat_time:.9f} seconds | Memory used: {fermat_mem:.6f} MB\n")    
-    print("Fermat Primality Test completed.\n")
-
-    # Timing Miller-Rabin Primality Test
-    print("Running Miller-Rabin Primality Test...")
-    miller_rabin_result, miller_rabin_time, miller_rabin_mem = measure_memory_time(miller_rabin_test, n, k)
-    print(f"Miller-Rabin Primality Test: {'Probably Prime' if miller_rabin_result else 'Composite'}")
-    print(f"Time taken: {miller_rabin_time:.9f} seconds | Memory used: {miller_rabin_mem:.6f} MB\n")    
-    print("Miller-Rabin Primality Test completed.\n")
-
-    # Timing Solovay-Strassen Test
-    print("Running Solovay-Strassen Test...")
-    solovay_strassen_result, solovay_strassen_time, solovay_strassen_mem = measure_memory_time(solovay_strassen_test, n, k)
+def measure_memory_time(func, *args, raw_result=False, repetitions=1, memory="traced"):
+    """
+    Measure time and memory usage of a function (raw_result keeps non-boolean results).
+    The time is the median of untraced runs, the memory is measured in a separate pass
+    (see measurement.measure for the memory modes).
+    """
+    result, time_taken, memory_used = measure(func, *args, repetitions=repetitions, memory=memory)
+    return (result if raw_result else bool(result)), time_taken, memory_used
 
-    print(f"Solovay-Strassen Test: {'Probably Prime' if solovay_strassen_result else 'Composite'}")
-    print(f"Time taken: {solovay_strassen_time:.9f} seconds | Memory used: {solovay_strassen_mem:.6f} MB\n")    
-    print("Solovay-Strassen Test completed.\n")
 
-    # ECPP Primality Test
-    print("Running ECPP Test...")
-    ecpp_result, ecpp_time, ecpp_mem = measure_memory_time(ecpp_certificate, n)
-    print(f"ECPP Test: {'Prime' if ecpp_result else 'Composite'}")
-    print(f"Time taken: {ecpp_time:.9f} seconds | Memory used: {ecpp_mem:.6f} MB\n")
 
-    # Timing AKS
-    print("Running AKS Test...")
-    aks_result, aks_time, aks_mem = measure_memory_time(aks_primality_test, n)
-    print(f"AKS Test: {'Prime' if aks_result else 'Composite'}")
-    print(f"Time taken: {aks_time:.9f} seconds | Memory used: {aks_mem:.6f} MB\n")   
-    print("AKS Test completed.\n")
- 
+# (name, cache method, function, takes k, verdict when True) for every algorithm compare_algorithms runs
+COMPARED_ALGORITHMS = [
+    ("Trial Division", "trial_division", Trial_division, False, "Prime"),
+    ("Fermat Primality Test", "fermat", fermat_primality_test, True, "Probably Prime"),
+    ("Miller-Rabin Primality Test", "miller_rabin", miller_rabin_test, True, "Probably Prime"),
+    ("Solovay-Strassen Test", "solovay_strassen", solovay_strassen_test, True, "Probably Prime"),
+    ("Baillie-PSW Test", "bpsw", bpsw_test, False, "Probably Prime"),
+    ("Combined Fermat / Solovay-Strassen / Miller-Rabin Test", "combined", combined_probable_prime_tests, True, None),
+    ("ECPP Test", "ecpp", ecpp_certificate, False, "Prime"),
+    ("AKS Test", "aks", aks_primality_test, False, "Prime"),
+]
 
+def compare_algorithms(n, k, a, b, m, q, time_budget=60, memory_budget=2048, processes=None, cache=None):
+    """
+    Compare the execution time of Trial Division, Fermat Primality Test, Miller-Rabin Test, Solovay-Strassen Test,
+    Baillie-PSW, ECPP and AKS. Every algorithm runs in its own process, concurrently with the others, and is
+    stopped once it spends time_budget seconds or grows by memory_budget MB. Results are printed as they arrive.
+    With a verdict_cache.VerdictCache, algorithms already run on n report their stored verdict and cost instead.
+    """
+    methods = {name: method_key(method, k if takes_k else None) for name, method, _, takes_k, _ in COMPARED_ALGORITHMS}
+    results = {}
+    tasks = []
+    for name, method, func, takes_k, _ in COMPARED_ALGORITHMS:
+        entry = cache.get(n, methods[name]) if cache is not None else None
+        # A proven verdict reused from another method is a single one, which the combined test cannot report
+        if entry is not None and (method != "combined" or isinstance(entry.verdict, list)):
+            # Another method's cost says nothing about this algorithm's, so only the verdict is reused
+            seconds = entry.seconds if entry.method == methods[name] else None
+            results[name] = BudgetedRun(name, "cached", entry.verdict, seconds, None,
+                                        f"{entry.confidence}, by {entry.method}")
+        else:
+            tasks.append((name, func, (n, k) if takes_k else (n,)))
 
+    print(f"Running {len(tasks)} algorithms concurrently, "
+          f"each within {time_budget} seconds and {memory_budget} MB. Please wait...\n")
 
+    verdicts = {name: verdict for name, _, _, _, verdict in COMPARED_ALGORITHMS}
+    for run in itertools.chain(list(results.values()), run_with_budgets(tasks, time_budget, memory_budget, processes)):
+        results[run.key] = run
+        if run.status == "exceeded budget":
+            print(f"{run.key}: exceeded budget ({run.detail})\n")
+            continue
+        if run.status == "error":
+            print(f"{run.key}: failed ({run.detail})\n")
+            continue
+        if run.status == "ok" and cache is not None:
+            verdict = [bool(r) for r in run.result] if verdicts[run.key] is None else bool(run.result)
+            cache.put(n, methods[run.key], verdict, run.seconds)
+        if verdicts[run.key] is None:
+            # The combined test returns one verdict per test
+            for name, result in zip(("Fermat", "Solovay-Strassen", "Miller-Rabin"), run.result):
+                print(f"{name} (shared bases): {'Probably Prime' if result else 'Composite'}")
+        else:
+            print(f"{run.key}: {verdicts[run.key] if run.result else 'Composite'}")
+        if run.status == "cached":
+            cost = f", time taken when computed: {run.seconds:.9f} seconds" if run.seconds is not None else ""
+            print(f"Cached ({run.detail}){cost}\n")
+        else:
+            print(f"Time taken: {run.seconds:.9f} seconds | Memory used: {run.memory:.6f} MB\n")
+    print("All algorithms completed.\n")
+    return results
@@ -0,0 +1,119 @@
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from bpsw import bpsw_test
+from combined_tests import combined_probable_prime_tests, TEST_NAMES
+from compute_accuracy import accuracy_metrics, print_results
+from measurement import completed_results
+from numberset import DEFAULT_CHUNK_SIZE, iter_number_chunks, numbers_file_size
+
+# Partial confusion matrix of one test over one chunk; merge_counts adds two of them,
+# so chunks can be evaluated anywhere and combined in any order
+ConfusionCounts = namedtuple("ConfusionCounts", ["TP", "FP", "TN", "FN"])
+NO_COUNTS = ConfusionCounts(0, 0, 0, 0)
+
+PIPELINE_TESTS = TEST_NAMES + ("bpsw",)
+
+def merge_counts(a, b):
+    return ConfusionCounts(*(x + y for x, y in zip(a, b)))
+
+def merge_partials(a, b):
+    """Merge two {test name: ConfusionCounts} dictionaries."""
+    return {name: merge_counts(a.get(name, NO_COUNTS), b.get(name, NO_COUNTS)) for name in a.keys() | b.keys()}
+
+def evaluate_chunk(chunk, are_primes, tests, k):
+    """
+    Run the tests on a chunk whose numbers are all prime (are_primes) or all composite.
+    Returns ({test name: ConfusionCounts}, {test name: false positives}, len(chunk)).
+    """
+    combined = [name for name in tests if name in TEST_NAMES]
+    positives = dict.fromkeys(tests, 0)
+    false_positives = {name: [] for name in tests}
+
+    for n in chunk:
+        verdicts = {}
+        if combined:
+            verdicts.update(zip(TEST_NAMES, combined_probable_prime_tests(n, k)))
+        if "bpsw" in tests:
+            verdicts["bpsw"] = bpsw_test(n)
+        for name in tests:
+            if verdicts[name]:
+                positives[name] += 1
+                if not are_primes:
+                    false_positives[name].append(n)
+
+    size = len(chunk)
+    if are_primes:
+        counts = {name: ConfusionCounts(positives[name], 0, 0, size - positives[name]) for name in tests}
+    else:
+        counts = {name: ConfusionCounts(0, positives[name], size - positives[name], 0) for name in tests}
+    return counts, false_positives, size
+
+def print_progress(done, bytes_read, total_bytes, start):
+    """Numbers tested, rate and an ETA from the share of the input files read so far."""
+    elapsed = time.perf_counter() - start
+    fraction = bytes_read / total_bytes if total_bytes else 1
+    eta = elapsed * (1 - fraction) / fraction if fraction > 0 else float('inf')
+    sys.stdout.write(f"\r{done} numbers, {done / max(elapsed, 1e-9):.0f}/s, "
+                     f"{100 * fraction:.1f}% read, ETA {eta:.0f}s   ")
+    sys.stdout.flush()
+
+def stream_accuracy(primes_file, composites_file, tests=PIPELINE_TESTS, k=40, processes=None,
+                    chunk_size=DEFAULT_CHUNK_SIZE, spill_prefix="false_positives", progress=True):
+    """
+    Accuracy of each test over the two files (CSV or number sets), without loading either of them.
+    Chunks are tested in a process pool, partial counts are merged as they arrive and
+    false positives are appended to "<spill_prefix>_<test>.txt" instead of kept in memory.
+    Returns {test name: compute_accuracy-style tuple}, with the spill file path in place
+    of the list of false positives.
+    """
+    tests = tuple(tests)
+    processes = processes or os.cpu_count()
+    total_bytes = numbers_file_size(primes_file) + numbers_file_size(composites_file)
+    spill_paths = {name: f"{spill_prefix}_{name}.txt" for name in tests}
+    spill_files = {name: open(path, 'w') for name, path in spill_paths.items()}
+
+    read_so_far = [0]
+
+    def chunk_arguments():
+        # The prime file is read before the composite one, so its size offsets the second
+        offset = 0
+        for file_path, are_primes in ((primes_file, True), (composites_file, False)):
+            for chunk, bytes_read in iter_number_chunks(file_path, chunk_size):
+                read_so_far[0] = offset + bytes_read
+                yield chunk, are_primes, tests, k
+            offset += numbers_file_size(file_path)
+
+    totals, done, start = {}, 0, time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for counts, false_positives, size in completed_results(executor, evaluate_chunk, chunk_arguments(),
+                                                                   2 * processes):
+                totals = merge_partials(totals, counts)
+                for name, numbers in false_positives.items():
+                    spill_files[name].writelines(f"{n}\n" for n in numbers)
+                done += size
+                if progress:
+                    print_progress(done, read_so_far[0], total_bytes, start)
+    finally:
+        for file in spill_files.values():
+            file.close()
+    if progress:
+        print()
+
+    return {name: accuracy_metrics(*totals.get(name, NO_COUNTS), spill_paths[name]) for name in tests}
+
+def main():
+    primes_file = sys.argv[1] if len(sys.argv) > 1 else 'primes.csv'
+    composites_file = sys.argv[2] if len(sys.argv) > 2 else 'composites_with_carmichaels.csv'
+
+    results = stream_accuracy(primes_file, composites_file, k=40)
+    titles = {"fermat": "Fermat", "miller_rabin": "Miller-Rabin",
+              "solovay_strassen": "Solovay-Strassen", "bpsw": "Baillie-PSW"}
+    for name, result in results.items():
+        print_results(f"{titles[name]} Primality Test", result)
+
+if __name__ == "__main__":
+    main()
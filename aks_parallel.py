@@ -0,0 +1,95 @@
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from math import ceil, isqrt, log
+from aks_ring import CyclicPolyRing
+from multiplicative_order import euler_totient, find_r
+
+# Set by the parent as soon as one congruence fails, so every worker stops early
+_cancel_event = None
+_progress_queue = None
+
+def _init_worker(cancel_event, progress_queue):
+    global _cancel_event, _progress_queue
+    _cancel_event = cancel_event
+    _progress_queue = progress_queue
+    # A worker must be able to exit while updates it queued are still unread; the
+    # parent drains whatever arrived once the pool has shut down
+    if progress_queue is not None:
+        progress_queue.cancel_join_thread()
+
+def _check_shard(n, r, a_values, worker_id):
+    """
+    Check (x + a)^n ≡ x^n + a (mod x^r - 1, n) for every a of one shard.
+    Returns the first failing a, or None if the shard passed or was cancelled.
+    """
+    ring = CyclicPolyRing(n, r)
+    for checked, a in enumerate(a_values, 1):
+        if _cancel_event.is_set():
+            return None
+        if ring.pow_x_plus_a(a, n) != ring.x_power_plus_a(n, a):
+            _cancel_event.set()
+            return a
+        if _progress_queue is not None:
+            _progress_queue.put((worker_id, checked, len(a_values)))
+    return None
+
+def print_progress(worker_id, checked, total):
+    print(f"AKS worker {worker_id}: {checked}/{total} congruences checked")
+
+def parallel_polynomial_mod_check(n, r, max_a, processes=None, progress=None):
+    """
+    Polynomial congruence check of AKS for 1 ≤ a ≤ max_a, sharded across a process pool.
+    Shards are interleaved so that every worker gets the same amount of work.
+    progress, if given, is called as progress(worker_id, checked, total).
+    """
+    processes = min(processes or os.cpu_count() or 1, max_a)
+    context = multiprocessing.get_context()
+    cancel_event = context.Event()
+    progress_queue = context.Queue() if progress is not None else None
+
+    def drain():
+        while progress_queue is not None:
+            try:
+                update = progress_queue.get_nowait()
+            except queue.Empty:
+                return
+            progress(*update)
+
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context,
+                             initializer=_init_worker, initargs=(cancel_event, progress_queue)) as executor:
+        pending = {executor.submit(_check_shard, n, r, range(worker_id + 1, max_a + 1, processes), worker_id)
+                   for worker_id in range(processes)}
+        failed = False
+        while pending:
+            done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+            drain()
+            if any(future.result() is not None for future in done):
+                failed = True
+                cancel_event.set()
+    # Every worker has exited: read the last updates, then release the queue
+    drain()
+    if progress_queue is not None:
+        progress_queue.close()
+        progress_queue.join_thread()
+    return not failed
+
+def main():
+    # python aks_parallel.py [n] [processes]: time the congruence checks sequentially and in parallel
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 12 + 39
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    r = find_r(n)
+    max_a = ceil(isqrt(euler_totient(r)) * log(n, 2))
+    timings = {}
+    for workers in sorted({1, processes}):
+        start = time.perf_counter()
+        passed = parallel_polynomial_mod_check(n, r, max_a, workers)
+        timings[workers] = time.perf_counter() - start
+        print(f"n = {n}, r = {r}, {max_a} congruences, {workers} processes: {timings[workers]:.2f} s ({passed})")
+    print(f"Speedup with {processes} processes on {os.cpu_count()} CPUs: {timings[1] / timings[processes]:.2f}x")
+
+if __name__ == "__main__":
+    main()
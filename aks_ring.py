@@ -0,0 +1,70 @@
+try:
+    from gmpy2 import mpz
+except ImportError:  # plain Python ints still work, only the big products are slower
+    mpz = int
+
+class CyclicPolyRing:
+    """
+    The ring Z_n[x]/(x^r - 1) used by the AKS congruence check.
+    Elements are coefficient lists of length r (index i holds the x^i coefficient).
+    Products go through Kronecker substitution: both operands are packed into one
+    big integer, multiplied once, unpacked and folded back modulo x^r - 1.
+    """
+
+    def __init__(self, n, r):
+        self.n = n
+        self.r = r
+        # A product coefficient is a sum of at most r terms below n^2
+        self.slot_bytes = (2 * n.bit_length() + r.bit_length() + 7) // 8
+
+    def one(self):
+        return [1] + [0] * (self.r - 1)
+
+    def x_plus_a(self, a):
+        """The element x + a."""
+        f = [0] * self.r
+        f[0] = a % self.n
+        f[1 % self.r] = (f[1 % self.r] + 1) % self.n
+        return f
+
+    def x_power_plus_a(self, e, a):
+        """The element x^e + a, reduced modulo x^r - 1."""
+        f = [0] * self.r
+        f[0] = a % self.n
+        f[e % self.r] = (f[e % self.r] + 1) % self.n
+        return f
+
+    def _pack(self, f):
+        return mpz(int.from_bytes(b"".join(c.to_bytes(self.slot_bytes, "little") for c in f), "little"))
+
+    def _unpack(self, value, length):
+        data = int(value).to_bytes(length * self.slot_bytes, "little")
+        size = self.slot_bytes
+        return [int.from_bytes(data[i * size:(i + 1) * size], "little") for i in range(length)]
+
+    def mul(self, f, g):
+        """Product of f and g in Z_n[x]/(x^r - 1)."""
+        r, n = self.r, self.n
+        if f is g:
+            product = self._pack(f) ** 2
+        else:
+            product = self._pack(f) * self._pack(g)
+        coeffs = self._unpack(product, 2 * r - 1)
+        # x^(r + i) = x^i: fold the upper half onto the lower half
+        return [(coeffs[i] + coeffs[i + r]) % n for i in range(r - 1)] + [coeffs[r - 1] % n]
+
+    def mul_x_plus_a(self, f, a):
+        """Product of f and x + a, done in O(r) without a big multiplication."""
+        n = self.n
+        return [(f[i - 1] + a * f[i]) % n for i in range(self.r)]
+
+    def pow_x_plus_a(self, a, e):
+        """(x + a)^e by left-to-right square-and-multiply."""
+        if e == 0:
+            return self.one()
+        result = self.x_plus_a(a)
+        for bit in bin(e)[3:]:
+            result = self.mul(result, result)
+            if bit == '1':
+                result = self.mul_x_plus_a(result, a)
+        return result
@@ -0,0 +1,142 @@
+import os
+import random
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from gmpy2 import mpz, powmod, jacobi, gcd
+from bpsw import bpsw_test
+from small_prime_filter import small_prime_prefilter, get_prefilter_bound
+from vector_primality import MAX_VECTOR_MODULUS, vector_fermat, vector_miller_rabin
+
+METHODS = ("fermat", "miller_rabin", "solovay_strassen", "bpsw")
+
+def draw_bases(k, seed=None):
+    """Draw k random bases once so they can be shared by every number of a batch."""
+    rng = random.Random(seed)
+    # Bases must fit a uint64 for the vectorised kernels
+    return [rng.randint(2, 2 ** 64 - 1) for _ in range(k)]
+
+def _fermat(n, bases):
+    for a in bases:
+        a %= n
+        if a < 2 or a == n - 1:
+            continue
+        if powmod(a, n - 1, n) != 1:
+            return False
+    return True
+
+def _miller_rabin(n, bases):
+    # n - 1 = 2^s * t, computed once for every base
+    s = ((n - 1) & -(n - 1)).bit_length() - 1
+    t = (n - 1) >> s
+    for a in bases:
+        a %= n
+        if a < 2 or a == n - 1:
+            continue
+        b = powmod(a, t, n)
+        if b == 1 or b == n - 1:
+            continue
+        for _ in range(s - 1):
+            b = powmod(b, 2, n)
+            if b == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def _solovay_strassen(n, bases):
+    e = (n - 1) >> 1
+    for a in bases:
+        a %= n
+        if a < 2 or a == n - 1:
+            continue
+        if gcd(a, n) > 1:
+            return False
+        if powmod(a, e, n) != jacobi(a, n) % n:
+            return False
+    return True
+
+def _bpsw(n, bases):
+    # BPSW uses its own fixed bases
+    return bpsw_test(n)
+
+KERNELS = {
+    "fermat": _fermat,
+    "miller_rabin": _miller_rabin,
+    "solovay_strassen": _solovay_strassen,
+    "bpsw": _bpsw,
+}
+
+# Kernels that run on a whole numpy array at once when every number is below 2^63
+VECTOR_KERNELS = {
+    "fermat": vector_fermat,
+    "miller_rabin": vector_miller_rabin,
+}
+
+def _fits_vector_kernels(chunk):
+    if len(chunk) == 0:
+        return False
+    if isinstance(chunk, np.ndarray):
+        return int(chunk.min()) >= 0 and int(chunk.max()) < MAX_VECTOR_MODULUS
+    return min(chunk) >= 0 and max(chunk) < MAX_VECTOR_MODULUS
+
+def _test_chunk_vectorised(chunk, method, bases, bound):
+    verdicts = VECTOR_KERNELS[method](np.asarray(chunk, dtype=np.uint64), bases, trial_division=False)
+    # The prefilter can only overturn a positive verdict, so only those are checked
+    for i in np.flatnonzero(verdicts):
+        if small_prime_prefilter(int(chunk[i]), bound) is False:
+            verdicts[i] = False
+    return verdicts.astype(np.uint8).tobytes()
+
+def _test_chunk(chunk, method, bases, bound):
+    """Test one chunk of numbers and return the verdicts packed as bytes."""
+    if method in VECTOR_KERNELS and _fits_vector_kernels(chunk):
+        return _test_chunk_vectorised(chunk, method, bases, bound)
+    kernel = KERNELS[method]
+    verdicts = bytearray(len(chunk))
+    for i, n in enumerate(chunk):
+        n = mpz(int(n))
+        verdict = small_prime_prefilter(n, bound)
+        if verdict is None:
+            verdict = kernel(n, bases)
+        verdicts[i] = verdict
+    return bytes(verdicts)
+
+def _chunks(numbers, chunk_size):
+    if isinstance(numbers, np.ndarray) and numbers.dtype.kind in "iu":
+        # Integer arrays are sliced as they are, ready for the vectorised kernels
+        for i in range(0, len(numbers), chunk_size):
+            yield numbers[i:i + chunk_size]
+        return
+    chunk = []
+    for n in numbers:
+        chunk.append(int(n))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def batch_is_probable_prime(numbers, method="miller_rabin", k=10, processes=None, chunk_size=4096, seed=None,
+                            prefilter_bound=None):
+    """
+    Test every number of an iterable or array and return a numpy boolean array.
+    The k bases are drawn once per call and shared by all numbers; chunks are
+    spread across a process pool. Numbers with a prime factor up to
+    prefilter_bound are rejected before any exponentiation.
+    """
+    if method not in KERNELS:
+        raise ValueError(f"Unknown method {method!r}, expected one of {METHODS}")
+    bases = draw_bases(k, seed)
+    # Resolved here so worker processes use the caller's bound
+    bound = prefilter_bound or get_prefilter_bound()
+    processes = processes or os.cpu_count() or 1
+
+    if processes == 1:
+        results = [_test_chunk(chunk, method, bases, bound) for chunk in _chunks(numbers, chunk_size)]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [executor.submit(_test_chunk, chunk, method, bases, bound)
+                       for chunk in _chunks(numbers, chunk_size)]
+            results = [future.result() for future in futures]
+
+    return np.frombuffer(b"".join(results), dtype=np.uint8).astype(bool)
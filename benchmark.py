@@ -0,0 +1,156 @@
+import argparse
+import importlib
+import json
+import multiprocessing
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+import numpy as np
+
+DEFAULT_RESULTS_FILE = "benchmark_results.json"
+
+# The primes the comparison plots are drawn over: (label, log10 position, value)
+LADDER = [
+    ("109", 3, 109),
+    ("1097", 4, 1097),
+    ("10313", 5, 10313),
+    ("100207", 6, 100207),
+    ("10¹³+37", 13, 10 ** 13 + 37),
+    ("10¹⁵+91", 15, 10 ** 15 + 91),
+    ("10²⁰+151", 20, 10 ** 20 + 151),
+    ("10⁵⁰+447", 50, 10 ** 50 + 447),
+    ("10⁷⁰+33", 70, 10 ** 70 + 33),
+    ("10¹⁰⁰+949", 100, 10 ** 100 + 949),
+    ("10²⁰⁰+1849", 200, 10 ** 200 + 1849),
+    ("10⁵⁰⁰+3229", 500, 10 ** 500 + 3229),
+    ("10¹⁰⁰⁰+4351", 1000, 10 ** 1000 + 4351),
+]
+
+K_VALUES = (40, 80)
+
+# name: (module, function, whether it takes the number of rounds k)
+ALGORITHMS = {
+    "trial_division": ("Trial_division", "Trial_division", False),
+    "fermat": ("Trial_division", "fermat_primality_test", True),
+    "miller_rabin": ("Trial_division", "miller_rabin_test", True),
+    "solovay_strassen": ("Trial_division", "solovay_strassen_test", True),
+    "combined": ("combined_tests", "combined_probable_prime_tests", True),
+    "bpsw": ("bpsw", "bpsw_test", False),
+    "aks": ("Trial_division", "aks_primality_test", False),
+    "ecpp": ("testEC", "ecpp_certificate", False),
+}
+
+def _run_cell(connection, algorithm, n, k, runs):
+    """Child process: time `runs` calls, sending each duration (warmup included) as it ends."""
+    module, function, takes_k = ALGORITHMS[algorithm]
+    func = getattr(importlib.import_module(module), function)
+    args = (n, k) if takes_k else (n,)
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(*args)
+        connection.send(time.perf_counter() - start)
+    connection.close()
+
+def summarise(times):
+    """Median, quartiles and extremes of a list of durations."""
+    q1, median, q3 = np.percentile(times, [25, 50, 75])
+    return {"median": median, "q1": q1, "q3": q3, "iqr": q3 - q1, "min": min(times), "max": max(times)}
+
+def benchmark_cell(algorithm, n, k, warmup=1, repetitions=5, timeout=60.0):
+    """
+    Time one algorithm on one number in a fresh process, so that a run exceeding timeout
+    seconds can be killed. Returns a dict with the status, the measured times and their summary.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_run_cell, args=(sender, algorithm, n, k, warmup + repetitions))
+    process.start()
+    sender.close()
+    times, status = [], "ok"
+    try:
+        for _ in range(warmup + repetitions):
+            if not receiver.poll(timeout):
+                status = "timeout" if process.is_alive() else "error"
+                break
+            times.append(receiver.recv())
+    except EOFError:
+        status = "error"
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        receiver.close()
+
+    times = times[warmup:]
+    cell = {"status": status, "times": times}
+    if status == "ok":
+        cell.update(summarise(times))
+    return cell
+
+def run_benchmarks(algorithms=tuple(ALGORITHMS), ladder=LADDER, k_values=K_VALUES, warmup=1, repetitions=5,
+                   timeout=60.0, output=DEFAULT_RESULTS_FILE):
+    """
+    Benchmark every algorithm over the ladder, for each k when it takes one. Once an
+    algorithm times out or fails, the larger numbers are skipped for it. The results are
+    rewritten to output after every cell, so an interrupted run keeps what it measured.
+    """
+    results = {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "warmup": warmup,
+            "repetitions": repetitions,
+            "timeout": timeout,
+        },
+        "results": [],
+    }
+    for algorithm in algorithms:
+        takes_k = ALGORITHMS[algorithm][2]
+        for k in (k_values if takes_k else (None,)):
+            given_up = False
+            for label, position, n in ladder:
+                if given_up:
+                    cell = {"status": "skipped", "times": []}
+                else:
+                    cell = benchmark_cell(algorithm, n, k, warmup, repetitions, timeout)
+                    given_up = cell["status"] != "ok"
+                cell.update({"algorithm": algorithm, "k": k, "label": label, "log10": position})
+                results["results"].append(cell)
+                summary = f"{cell['median']:.6f}s (IQR {cell['iqr']:.6f}s)" if cell["status"] == "ok" else cell["status"]
+                print(f"{algorithm:<17} k={k if k is not None else '-':<4} {label:<14} {summary}")
+                with open(output, "w") as file:
+                    json.dump(results, file, indent=1, ensure_ascii=False)
+    return results
+
+def load_results(path=DEFAULT_RESULTS_FILE):
+    with open(path) as file:
+        return json.load(file)
+
+def series(results, algorithm, k=None):
+    """(labels, log10 positions, medians, q1s, q3s) of one algorithm, NaN where it was not measured."""
+    cells = [cell for cell in results["results"] if cell["algorithm"] == algorithm and cell["k"] == k]
+    nan = float("nan")
+    return ([cell["label"] for cell in cells],
+            [cell["log10"] for cell in cells],
+            [cell.get("median", nan) for cell in cells],
+            [cell.get("q1", nan) for cell in cells],
+            [cell.get("q3", nan) for cell in cells])
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the primality tests over the standard ladder of primes.")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(ALGORITHMS))
+    parser.add_argument("--k", nargs="+", type=int, default=list(K_VALUES))
+    parser.add_argument("--max-log10", type=int, default=1000, help="skip the numbers above 10^max_log10")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=60.0, help="seconds allowed for each run")
+    parser.add_argument("--output", default=DEFAULT_RESULTS_FILE)
+    args = parser.parse_args()
+
+    ladder = [step for step in LADDER if step[1] <= args.max_log10]
+    run_benchmarks(args.algorithms, ladder, args.k, args.warmup, args.repetitions, args.timeout, args.output)
+    print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+from math import isqrt
+from gmpy2 import mpz, powmod, jacobi
+from small_prime_filter import small_prime_prefilter
+
+def strong_probable_prime(n, a):
+    """Strong (Miller-Rabin) probable prime test of odd n > 2 to the single base a."""
+    s = ((n - 1) & -(n - 1)).bit_length() - 1
+    t = (n - 1) >> s
+    b = powmod(a, t, n)
+    if b == 1 or b == n - 1:
+        return True
+    for _ in range(s - 1):
+        b = powmod(b, 2, n)
+        if b == n - 1:
+            return True
+    return False
+
+def selfridge_parameters(n):
+    """
+    Selfridge's method A: first D in 5, -7, 9, -11, ... with (D/n) = -1, P = 1, Q = (1 - D) / 4.
+    Returns None if some D shares a factor with n (n is then composite).
+    """
+    D = 5
+    while True:
+        j = jacobi(D, n)
+        if j == -1:
+            return D, 1, (1 - D) // 4
+        if j == 0 and abs(D) != n:
+            return None
+        D = -D - 2 if D > 0 else -D + 2
+
+def _half(x, n):
+    """Divide x by 2 modulo odd n."""
+    return (x + n if x & 1 else x) >> 1
+
+def lucas_sequence(n, P, Q, D, k):
+    """Return (U_k, V_k, Q^k) modulo n for the Lucas sequences with parameters P, Q."""
+    U, V, Qk = mpz(1), mpz(P) % n, mpz(Q) % n
+    for bit in bin(k)[3:]:
+        # Doubling: U_2k = U_k V_k, V_2k = V_k^2 - 2 Q^k
+        U = (U * V) % n
+        V = (V * V - 2 * Qk) % n
+        Qk = (Qk * Qk) % n
+        if bit == '1':
+            U, V = _half(P * U + V, n) % n, _half(D * U + P * V, n) % n
+            Qk = (Qk * Q) % n
+    return U, V, Qk
+
+def strong_lucas_probable_prime(n):
+    """Strong Lucas probable prime test of odd n > 2 with Selfridge parameters."""
+    params = selfridge_parameters(n)
+    if params is None:
+        return False
+    D, P, Q = params
+
+    # n + 1 = d * 2^s
+    s = ((n + 1) & -(n + 1)).bit_length() - 1
+    d = (n + 1) >> s
+
+    U, V, Qk = lucas_sequence(n, P, Q, D, d)
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        Qk = (Qk * Qk) % n
+        if V == 0:
+            return True
+    return False
+
+# Baillie-PSW primality test
+def bpsw_test(n, k=None):
+    """
+    Return True if n is probably prime, False if composite.
+    k is accepted for compatibility with the k-round tests and ignored:
+    BPSW is a strong base-2 test followed by a strong Lucas test.
+    """
+    verdict = small_prime_prefilter(n)
+    if verdict is not None:
+        return verdict
+    n = mpz(n)
+    if not strong_probable_prime(n, 2):
+        return False
+    # Selfridge's search for D never ends on perfect squares
+    if isqrt(n) ** 2 == n:
+        return False
+    return strong_lucas_probable_prime(n)
@@ -0,0 +1,343 @@
+# Hilbert class polynomials H_D(X) for the fundamental discriminants D with class number h(D) <= 8.
+# Coefficients are listed from the constant term up to the leading 1.
+# Generated once from the reduced forms (a, b, c) of discriminant D as
+# H_D(X) = prod (X - j((-b + sqrt(D)) / 2a)), evaluated with mpmath at enough
+# precision for every coefficient to round to an exact integer.
+
+HILBERT_CLASS_POLYNOMIALS = {
+    -3: [0, 1],
+    -4: [-1728, 1],
+    -7: [3375, 1],
+    -8: [-8000, 1],
+    -11: [32768, 1],
+    -15: [-121287375, 191025, 1],
+    -19: [884736, 1],
+    -20: [-681472000, -1264000, 1],
+    -23: [12771880859375, -5151296875, 3491750, 1],
+    -24: [14670139392, -4834944, 1],
+    -31: [1566028350940383, -58682638134, 39491307, 1],
+    -35: [-134217728000, 117964800, 1],
+    -39: [20919104368024767633, 109873509788637459, -429878960946, 331531596, 1],
+    -40: [9103145472000, -425692800, 1],
+    -43: [884736000, 1],
+    -47: [16042929600623870849609375, -14982472850828613281250, 5115161850595703125, -9987963828125, 2257834125, 1],
+    -51: [6262062317568, 5541101568, 1],
+    -52: [-567663552000000, -6896880000, 1],
+    -55: [-18577989025032784359375, 172576736359017890625, -20948398473375, 13136684625, 1],
+    -56: [10064086044321563803648, 2257767342088912896, 2059647197077504, -16220384512, 1],
+    -59: [374643194001883136, -140811576541184, 30197678080, 1],
+    -67: [147197952000, 1],
+    -68: [-2089297506304000000000000, -318507038720000000000, -75843692160000000, -178211040000, 1],
+    -71: [737707086760731113357714241006081263, -425319473946139603274605151187659, 5138800366453976780323726329446, -823534263439730779968091389, 98394038810047812049302, -3091990138604570, 313645809715, 1],
+    -79: [5458041030919737322344464663391, -5859423003994491322155950334, 1793441424178093483069839, -6366718450945836, 1339190283240, 1],
+    -83: [549755813888000000000, -41490055168000000, 2691907584000, 1],
+    -84: [-5133201653210986057826304, 88821246589810089394176, -5663679223085309952, -3196800946944, 1],
+    -87: [549806430204864490157810211181640625, 432181202257616392838287353515625, 497577733884372638735595703125, 28321090578679361484375000, 85585228375218750, 5321761711875, 1],
+    -88: [15798135578688000000, -6294842640000, 1],
+    -91: [-3845689020776448, 10359073013760, 1],
+    -95: [107789694576540010002976771996177148681640625, 2110631639116675267953915424764056884765625, -1437415939871573574572839010971248046875, 352163322858664726762725228294921875, -13089776536501963407329479984375, 395013575867144519258203125, -688170786018119250, 19874477919500, 1],
+    -103: [28826612937014029067466156005859375, 13355527720114165506172119140625, 4941005649165514137656250000, 85475283659296875, 70292286280125, 1],
+    -104: [65437179730333545242323676123103232, -25735039642229334200564710375424, 1378339984770204584193868955648, 31013571054009020830449664, 739545196164376195072, -82028232174464, 1],
+    -107: [337618789203968000000000, -6764523159552000000, 129783279616000, 1],
+    -111: [27524793815819191410861831167197250556510894417, -64773995403104720702864091375403035855442761, 88953282358528708595648019437144660946708, -25675269514993965918445147228203062874, 2987537813865962860773420720531252, 56129700127461627298044206619, 12257744369763349962, 236917342626795, 1],
+    -115: [130231327260672000, 427864611225600, 1],
+    -116: [-100730316193548175256338136121783353344, 143376986667050616958401264069115904, -66527716583835083670963399688192, -835102260960042427461140480, -11056847669496432594944, -495202728828032, 1],
+    -120: [4934510722321469030006784000000, -2588458316335175909376000000, 26329406807264910336000, -883067971104000, 1],
+    -123: [148809594175488000000, 1354146840576000, 1],
+    -127: [319730671478833667491273673675537109375, -64331030949386896516600669921875000, 5642626198092219066070054687500, -30614197896114609375, 2375421230598750, 1],
+    -131: [144530638394690224075155326369792, -60354680538951673475558801408, 107205484283838454093053952, -671177121829224448000, 4130485792112640, 1],
+    -132: [1656636925108948992000000000000, 54984539729717250048000000000, -325211610485778048000000, -4736863498464000, 1],
+    -136: [2422829169428572504087521656832, -1834607111282472051029311488, 735960027609078992953344, -8151279336430848, 1],
+    -139: [67408489017571610198016, -53041786755137667072, 12183160834031616, 1],
+    -148: [-7898242515936467904000000, -39660183801072000, 1],
+    -151: [3269200340379000902458720113257045278788199227087, 271248134304567044479896903675912851345002767, 779394774943277357155375818745718823538863, 69605133153244389737334180535377491802, 3399966616467533664248409155353722, 1107018219296858557941, 58309232586862950, 1],
+    -152: [472390748138731280269312000000000000000000, -1380504171426125758791680000000000000000, 2783058624787093614292992000000000000, 6854544294799483688960000000000, 17024071380555203520000000, -66246265919280000, 1],
+    -155: [37425860028464856284790784000000, 20396251654725321097216000000, -44477871096357453824000, 96905542950912000, 1],
+    -163: [262537412640768000, 1],
+    -164: [-852636173252919999445568788749874942641540406706176, 716292304882512928715138362472485709784740265984, 58876580988711431943771690012552346623541248, -82923859178811827895415538602091992842240, -72018009354152588972347870534871023616, -107971538556531472065498397540352, -161936389233870440957755392, -296853791160440320, 1],
+    -168: [496644064976895846912000000000000000, -264691184105480095991808000000000, 336511679671210230144000000, -483435712076832000, 1],
+    -179: [69366107283027836458026686806432415744, -23408814596997033103434472837087232, 2672564790656716736213209317376, -2200273236852299356176384, 1795194552944492544, 1],
+    -183: [30451733341148937584624248315225887141980230808258056640625, -26922618461790759850037872887492462842807292938232421875, 18238748993199475597203528068101439981700897216796875, 655855629401644394905657823337825299835205078125, 12093440927683360441327407340610611816406250, 8201294924243209292049624110812500000, 4218620940804013154578125, 2863790268422945625, 1],
+    -184: [114574710497270997578522590458150912, 38705419208160503264676104110080, 5767007465145198439020847104, -3215890895076912384, 1],
+    -187: [-3845689020776448000000, 4545336381788160000, 1],
+    -195: [-233490285492432753672585216000000, 104773100319600336175104000000, 25349140792043819237376000, 11284411506057216000, 1],
+    -203: [31913605837856413057024000000000000, 250634002097696556449792000000000, -83053272156952592384000000, 27502410406723584000, 1],
+    -211: [5310823021408898698117644288, 277390576406111100862464, 65873587288630099968, 1],
+    -212: [-67450134022842979455115194007552000000000000000000, 39924086528997881772669622484992000000000000000, -11008353578715780277672803110912000000000000, -2630171369254890916959016960000000000, -628986407384453487358016000000, -73387074029381328000, 1],
+    -219: [110979720274963942538198675506593792, -15979705448736682450562851012608, 831039118453558669939310592, 155212323706544357376, 1],
+    -223: [2606386098587221959562486420442180281995713710784912109375, -3017942224498278012503966427816688964673110961914062500, 904981240117595334764254951261845701135925292968750, -10118589468858067354789356763548186038818359375, 56100625266918564788759127557586158203125, -43072684586065004589140625, 236855705574161972250, 1],
+    -227: [5085472193216544027705344000000000000000, -2111118203460821622718464000000000000, 18227340807938993794580480000000000, -2562327002832961536000000000, 360082897644683264000, 1],
+    -228: [120020259495560805847424176128000000000000, 58827548670433207062445836288000000000, -7985216535621460489954944000000, -399605224650084576000, 1],
+    -232: [14871070713157137145512000000000, -604729957849891344000, 1],
+    -235: [11946621170462723407872000, 823177419449425920000, 1],
+    -244: [-9815190670232173018201554731440614047465078784, -24417475317780070950649666808040757791817728, -31292753080096691789898512325924416913408, -2691275293785918359227938328726732800, -92973717558373200586964869091328, -2052295773725248986240, 1],
+    -247: [-407336295332190846580777495118233696120388820648193359375, 400348022833121004028281794619328068026346954345703125, 2475076441475565987510057965501956793452880859375, 7686260773063033411724550958439950781250000, 888629892547516768433109375, 2772410642909877080250, 1],
+    -248: [1323449723347621474969758725859966976000000000000000000000000, -1093432823745012115729536788054671360000000000000000000000, 271994089256402280576009987295281152000000000000000000, -27750969592459084458872706174812160000000000000000, 35762831246449484056560587036188672000000000000, 2461626754066908714341150658560000000000, 169518269276842782112073472000000, -3063517083860376640000, 1],
+    -251: [1937587239465703269672056660685864050152464252403712, -1791911545705841840084320427251134859220759871488, 416131608793437401577832999781610387970981888, 7966552994949346594041401247164174172160, 1062008880270126105976008028408774656, -66204185373144403998280777728, 4128446190315309498368, 1],
+    -259: [4384296738486457527093398159228928, 5493320206929896679139197321216, -368189472100537894019530752, 9068999694311625523200, 1],
+    -260: [-3302947505675715028946774256661472679426359558144000000000000, 305486088367929951707960768526477860306636557516800000000000, -85980083235988029405783249092189509918128078848000000000, 14865557804649865113150034077076664167379763200000000, -463238908732347767153420578775505775886336000000, -21507054600723946274941348498171494400000, -999896161895842101863690217472000, -9997874035270492198400, 1],
+    -264: [327886345447155202813840576100201205111813144244435638288384, -171749422417263603359883069647289043394815149890303164416, 189771022593359719599623857042603680684355481140985856, -19114071480061200751208790258848908645703796916224, -1576759051947634872250887243973927048713338880, -43813781353344480858785503406172212822016, 1789885567319176457551625511223296, -14739806897587232709120, 1],
+    -267: [531429662672621376897024000000, 19683091854079488000000, 1],
+    -276: [11579958468886822266431515535986431304105856851373387044356096, -6523546308273811582074020329970859860219102556953002377216, 767440733750724125562378402812781678248671343699558400, 407334970460053160180107543216439671099066662518784, -7594738933192260668250057199680097904322674688, 359684269203806519420937768802377441214464, -10000254249186327541943559851360256, -46421840776490384352768, 1],
+    -280: [1775168961518724506399346503073398784000000, -708555761206745670461365038563328000000, 17602516524144666384420962098176000, -67667966893419063840000, 1],
+    -283: [201371843156955365376000000000, 90839236535446929408000000, 89611323386832801792000, 1],
+    -291: [21782000952710117887925312635418808680448, 285389231946718842181542553187254272, 10786588141336392324590050738176, 188155567079341753466880, 1],
+    -292: [-380259461042512404779990642688000000000000, 45521551386379385369629968384000000000, -93693622511929038759497066112000000, -206287709860428304608000, 1],
+    -295: [822204343689207610829131926678660596532719371553249925736718994140625, -1122282566856104887683461567415963897525574528336611314070556640625, 1811885751513084753220927364888013159601085995323528927843750000, 41940062336716757201181279559382045880935056981401849609375, 78688417471647009524122019473588050719938852358765625, 73767807010599056699488845989197941140892890625, 289315392383740839332561391375, 271602295664902418108250, 1],
+    -299: [-18273883965326272223717626628647422907813731016193733558272, 45797528808215150136248975363201860724351225694802411520, -19207839443594488822936988943836177115227877227364352, 6417141278133218665289808655954275181523718111232, -186547260770756829961971675685151791296544768, 2094055410006322146651491130721133658112, -28635280874816126174326167699456, 391086320728105978429440, 1],
+    -307: [8987619631060626702336000000000, -5083646425734146162688000000, 805016812009981390848000, 1],
+    -308: [-2165234140612455295554925190568825369657344000000000000000000000000, 3577524548867479876566112791807107740467200000000000000000000000, -1171071469575324412445157804913269173911552000000000000000000, 118013359737143520552180913373061918228480000000000000000, -7587984891492127439982947268653129637888000000000000, -79176840236445969178233162764226560000000000, -826239775451714421096341416192000000, -880456353881469533120000, 1],
+    -312: [1698899690981885675579246225669492736000000000000, -152340504750882110373595179663329280000000000, 1411168483733488619338991640960000000, -1258031100283439093280000, 1],
+    -323: [-121974636783103604190112617857024000000000000, 73804562114102168041788801024000000000000, -494846073292941121091010560000000, 3317765887009185280000000, 1],
+    -328: [88955608603044673650138130944000000000000000, 54802167111836784369290132453376000000000, 11610744584144462730131436503424000000, -5127512346913614444576000, 1],
+    -331: [56176242840389398230218488594563072, 368729929041040103875232661504, 6647404730173793386463232, 1],
+    -339: [419198194184232019280311537075670994855640493457408, 114053138969457254141239955759498317338331054080, 33494559320437814886965525300815718579699712, -527926973475401681480399895797881110528, 3119834163056249586908843992940544, 13207870721923966705729536, 1],
+    -340: [43039377624755967291385639037347037184000000, 5906485031594874833231597894020684185600000, -54548817402421378465247510316573696000, -14383245771217510630675200, 1],
+    -347: [184912732321277851630780880519168000000000000000, -76862513895106262259943954448384000000000000, 2286617351979618165608274471157760000000000, -7715358558261498003922616320000000, 26032472194627246481408000, 1],
+    -355: [167490001660588917859010199158784000000, -24013762453779394698078584832000000, 6828932041616339922516443136000, 50912008581334742581248000, 1],
+    -371: [6481710157163553710911373989049976082636826853040877396933214208, -9437193278662036228901778588613351480444207439554487798202368, 7955226967369897728024063900920070991817063643388946939904, 2070241046195436172786577952290406334822086904677138432, 7172240473520895634328741679079956332987799306240, 63021516974791355216056421758428516701962240, -109540453196503351362058007909236736, 190434010944411944081817600, 1],
+    -372: [41393149892607462736698558825033501904896000000000000, 1755509254864401819594526832548625909760000000000, -2969541010382978868435960918595200000000, -206603714804587147622880000, 1],
+    -376: [80898104235942224796361592859684324800100361568262519760355328, -797108085258416768239159045199404096196155929498778840596480, 6354570979875197989882015972560265130690833840153389170688, 179932812124131487070187094018692086667311846447382528, 184827248158834773720244437191295069873105813897216, -586249792527212606449056068824115539869696000, 4834578472269821416642158436559525756928, -285916404518354292888918528, 1],
+    -379: [15443600047689011948024601807415148544, -121567791009880876719538528321536, 364395404104624239018246144, 1],
+    -388: [-1121692648948590091501551223636881408000000000000, 208224136957169320201407896480139264000000000, -20542159225989612130996373047535232000000, -750062398364686994581728000, 1],
+    -395: [75842586946704938664020551497033224470255633910726656000000000000, -65554873109416897528089562414278300430987083907072000000000000, 9302488005249450440540192118814845845056811696128000000000, 1711401607152157535896445361731998420396146688000000000, 419520145342308306493930293009244561902403584000000, 1563027318051423630273876232667142291456000000, -1429395109545314884513819323793408000, 1307506076380207488835584000, 1],
+    -403: [-108844203402491055833088000000, 2452811389229331391979520000, 1],
+    -408: [13375974716483932888129605820405217248677888000000000000, -334918514756463762318006309600841904719872000000000, 218066148024051247931306674050097536000000, -3622859125108878497350176000, 1],
+    -411: [73029635693775668009059727434983158067960210151050313728, -4679673657864301179943258144578870967000652618661888, 870431545791433602355093719805848213678257602560, 1544633353160505212381702428744859800043520, 7591033806233449501451135280463478784, 4572839098768838399956942848, 1],
+    -420: [-6774993267880302065499271589077244607702692106378720313344000000000000, 3322057458803342041196516880396913435501050824830746624000000000000, 343101579425550237027264306100046973285019210099445465088000000000, -25522767602086427249222314481632218756271917729054720000000000, -654322371647418124227660658480955270871337023307776000000, 1830759213424837201179800381566577321252585472000000, -875149953790588830141513408467102803968000, -9149442836345200514625984000, 1],
+    -424: [256124659472476156429866214718645776584030123766932075184128, -473081446853521752764184578414407578553597912291215409152, 236813677534123887255838256365810161940182080793083904, 926676088876656917610604147887399839119029829632, 1384659323070129593431064385863072408432640, -12423061195029429537745759104, 1],
+    -427: [155041756222618916546936832000000, 15611455512523783919812608000, 1],
+    -435: [-12512019875237835915942574589201734434816000000, 42866222697779107335351550466659555737600000, 87465379468169320817492479772196864000, 28597298728131202056826060800, 1],
+    -436: [-3309564689920675611841021602429307330976712868047012658937856, 4190391048071364469026866970440363614326632840014231240704, -1352721253689086960917768809906285566915367850230153216, 1693419722764462128370611200560660741876060520448, -5414046507161941300684943471721179845005312, -30832919939688372877918428288, 1],
+    -443: [1580383899632304069192804677639613710336000000000000000, -645677619572710007907896290848702201856000000000000, 726664457760516471225292785548752060416000000000, -194566138410048201097018632830976000000, 52095503201744864610381824000, 1],
+    -451: [248738232385414940352605447987918942762879391105024, 6538354632239239965706431356575791482338510110720, 584470709556329910881460450936625902429143040, 37281139264035594329231801543794366611456, 37732368326837192349624395555143680, 94391735188170044104985346048, 1],
+    -452: [-11416662004233744365076104225688575806170783104288948224000000000000000000000000, 7142314818334140879780574556716393873385301585470423040000000000000000000000, -3434757541245962455455585314121174603013951177855336448000000000000000000, 50734273795448900729776882856979627119952543763660800000000000000000, -705631739214792579865177249718891252289626202677248000000000000, -151206805620428018201992258723610356612075520000000000, -32401499673044080264344593618377378048000000, -101634035376709591598457280000, 1],
+    -456: [1248918496784071679311916182672622781361979369435685895809476427409602379776, 1730649898406031932128295806424087269049881796875556937979523821750714368, 8467038189461862871498232972810788205187612911555813330439126242033664, -124954167491964417442632961316458508327590070661699479522814984192, 126925519715783333920705563880368538661948026476491698077696, -259658556171402414149211575300863604618960575238504448, 50427256223409204218353800554361001892364288, -136491683486572922249812990464, 1],
+    -463: [401958201191385930754881386234468149942131409474710541242526229371547698974609375, 179283783979941926953411418372928305162361740552420304242063526283264160156250, 24803663967697771228357110388585262448987981420325448447373551971435546875, -1605693344451100703401166090336916249468909839632742598689941406250, 51970685983805377333634014414418185665726831476030496093750, -7043755690400037749354220629309859375, 227970800726332644342287312625, 1],
+    -467: [27129499991079414558992889588446791284555776000000000000000000000, -20525778000912907436431434169493188780228608000000000000000000, 4482616421350859015252361421040804018782208000000000000000, -193391929303001486531692307095910239698944000000000000, 13826267033925954485102766290610323193856000000000, -2053828567675288331297977498861568000000, 305086080876305722343886848000, 1],
+    -472: [609118140629014547427739243406522843136000000000000000000, 7782762847555792408664371720856640749568000000000000000, 89663269021650272593765224657345386704896000000000000, -6621978932864958986465185964976874629120000000000, 290243510038159955925726906822209766336000000, -438370860938320369278668592000, 1],
+    -483: [-296241507936739247491345278560108544000000000000, 160587932046974848398336021151875072000000000, 9557426544972522152310585774047232000000, 966618711103413979025620992000, 1],
+    -487: [57421135565132223891557098632397533770305157302819821962919612248361110687255859375, 5588885680608056383304285092512678508996655379519917655702570596500396728515625, 1874757683029108665155742485334477560543463641951079278616042397338867187500, 78730410932026586018656083147661205139415494421562037554789062500000, 1653192694311607617535078467802284855790125398437544355468750, 61230417235420005106633643915668500000, 1285765411850702320617829512000, 1],
+    -499: [4671133182399954782798673154437441310949376, -6063717825494266394722392560011051008, 3005101108071026200706725969920, 1],
+    -515: [44195318902652537887832280872617801166384771408066510848000000000, -3107115217734912014460860938978340298227921413210112000000000, 6259740439766871889137441931457556788367376087252992000000, 4021108268646819914222211212116150442157670400000000, -192074704335054414490094597558883057664000, 9175438450996787302014492672000, 1],
+    -520: [171517475891022372428505519185548559222346497654784000000, -78006534528871949845908360976579586206001479680000000, 46650003139146307922421888174845453223975936000, -12958889442406058296422344736000, 1],
+    -523: [3397618365767017867913805692928000000000000000, -8335801454396454796105214853120000000000000, 13395061255385032931309223149568000000000, -236957616665436077155248242688000000, 15928926361335375229020229632000, 1],
+    -532: [-19077542993352945680961028994697271308288000000000000, 5131537740610192962070880163006969643272192000000000, -160054212938390343773833947283393690785408000000, -29478909019098139074177479136000, 1],
+    -547: [83303937570678403968635240448000000000, -139712328431787827943469744128000000, 81297395539631654721637478400000, 1],
+    -548: [-590518364908089997157788286780557493338263451790244315136000000000000000000000000000000, -369511718934717082008120249435842871162487306630914113536000000000000000000000000000, -68969925509725263658955759656306082347381966434548077950926848000000000000000000, 328860467798330152026138277690382532201612700511391601917952000000000000000, -1590986068171697316090499222810749646317714109166272880640000000000000, -35913514563962808407375283139347172053211266813952000000000, -810679935679825582353227029639493628299520000000, -86942389891535571387895159232000, 1],
+    -552: [4014753581735003605099707048940053282890161311449088000000000000000000000000000, -1491869338681587120775123496943489151278113693267656704000000000000000000000, 17960043006420077918365652794024303539913763116393955328000000000000000000, 784981509198717408666378173537115910201562782880759808000000000000000, 9038247293573332903169489007252044529427146881654784000000000000, -58691611938818455012339509695021606047668420243456000000000, 1211661287326221121647888045036795713947392000000, -113654378836535352053072666688000, 1],
+    -555: [-532755731205331063356397364951543957176713216000000, 19282254568556435196991625190065063388512256000000, 7191013406366483381037450688276469907456000, 138859536630220704987259502592000, 1],
+    -564: [1410539124587286819594160671955922149433268352692068786895315904358800938785996537856, -186423153957074627217818566668875191535626845784427349342910228378668486478528512, 579473691440252779828924728815673313990523698707440360772339652903654316310528, 2625550468143840642133580169868794560581148602007440852444168880344006656, 1302812260970235447356611686844899893591737005827828144605136683008, 253450842651286374093742999966154467299881141887690283679744, -4010633301324997153376681649711556335962683097088, -252431252389499030278869212407296, 1],
+    -568: [17903747548118085544966894162888109264474112000000000000, -20244861194040338252021384794239225557256192000000000, 5960215994584814927107650154330552605647232000000, -328731508303364809994652861984000, 1],
+    -571: [15283054453672803818066421650036653646232315192410112, -16319730975176203906274913715913862844512542392320, 4398250752422094811238689419574422303726895104, 818520809154613065770038265334290448384, 400497845154831586723701480652800, 1],
+    -579: [464793232343043366687149097962066772372436476624601281935812010755227648, 889018614566106780555955520613217606148244526529209723237842473189376, 1935790582495037184837110530204500965567499242790121844765060235264, -19228720281929478997861296918696489205537963466212473355370496, 813252088012203280786637779721301238218392085073489821696, -355122564397718134453623922597744991048394816356352, 59369596213670280006060371111787973029396480, 676387026992113450418827441373184, 1],
+    -580: [198368107463433017941006791366516074514256704929312208800710656000000000000, -83739778810631947586278845749607438058966141170065086611456000000000000, 26471525240640094299611509783726774850968702835808962347008000000000, 173217007083074231180921840492523500694094885049440665600000000000, 6306662778286541896224720215753687993996186318789935104000000, 70673010179850126682628372153395761510501489672192000000, -19399954774822931642109937778300582467033049088000, -721994371141654983621057960384000, 1],
+    -583: [1590143082415425099832376722791937259208120703181660837720379331722520166770040988922119140625, 3847861626831776140177907944066571604742540817163324687287108373890033208510875701904296875, 205213621872793706956814679926046328336330763376698513972794088442834571449279785156250, 22831652887675839809425610107112362235050044467123090293579232129459071014404296875, 187579563689438993078275012426193351931475823977067311551061949434570312500, 770559803726795588490479801073714416794993586323673088060339843750, 213687783014367910404538221903981315562500, 877815358561694090436309899526375, 1],
+    -587: [748765079750903678495365866324569504346756859559936000000000000000000000, -19523831231348384917508345284946898016410494042112000000000000000000, 35495224444423948749828541418253640332882575622144000000000000000, -1196192801910538190537501166807952753551892021248000000000000, 12408121464739840095494810222119511810092564480000000000, -118840621090042353846268441242275676160000000, 1138212574651782271861893763072000, 1],
+    -595: [-91399742601830803813322386656934773129216000000, 483054636550112292687021684688517332992000000, 8752111455147508300981595950899265536000, 1908606683491595666107623383040000, 1],
+    -616: [11560940605988608775021317978622345492706919224700295857630419662012226685894656, 2700677818868483334143493918654373479601273935130176142170749678205435641856, -735940732480031475341295570292750267451601629452483959056301009848500224, -1509969588210077671850355610553825063590552171300597114606956539019264, 22015145396000446122535780492386767387477172709823430101437513728, -2324270361846276694520289144246063962274570610361713557504, 622867749031723592493894650264766096595528541257728, -7293408905015292299958781016209920, 1],
+    -619: [1646062182335949197810917415545902866747444946845936123904, 28493830345553696446401792570748375365356507652685824, 326238883724948585436745550058572488040138145792, -87016716912343398450728998742124757254144, 8816350462749494490997859322396672, 1],
+    -627: [-1261687189208313891495979730091871567872000000000000, 526326624169690832922357632213666758656000000000, 3563858169242172480409901737583233204224000000, 14586137722924213400310156521472000, 1],
+    -628: [-193480668290139827978551941260794168997079416832000000000000000000, 2244973573297457770564792736595644257458378178560000000000000000, -11306325980421358690756668239288149306045473558528000000000000, -62749081242237832118702516655452609031428167680000000000, -1935352780955944330159655079539039563020333120000000, -15530070499668424480113373087440000, 1],
+    -632: [2455690780734897158024652314220420994123935277811138917072713665216512000000000000000000000000, -205488254882956257205479218794806299367131414053420769060690765807616000000000000000000000, 55724235915610201148663635533333380165079185083147643595058601525248000000000000000000, 106829316722129775247627565895561429417067966526797538786508275712000000000000000, 207218464905915998193116571927979322720373108284183824226869248000000000000, 764066324240903098557942341866117792957681012391972864000000000, 2817303777314491542198439675939656413173827328000000, -19947555143901432297225495030848000, 1],
+    -643: [308052554652302847380880841299197952000000000, -6300378505047247876499651797450752000000, 39545575162726134099492467011584000, 1],
+    -651: [-837262586007462653261909466967763200588899395236480392253092673936032792576, 1560118463031527141221515438671888287954223071567667616115946475371888640, -912999388135258927743103857780845055354520225412727777466772650721280, 194061545533182518530854613232829236130187347228804642343458177024, 2201746287081394599531696187598856165332862423537538188705792, 149807147439202860005904946308171008696904675005300736, 26034366770144460869683948058018263181668909056, 64812026197729426550178459657240576, 1],
+    -660: [-956825222980306326585980265538528042697197583016225087193752883841407647744000000000000, 802614337824902100615094698396471270494041411707339702383464010676279705600000000000, 145752537220577621057671362142160834897197172505227599866968670493212672000000000, -129459690207405843746931738609689674381742368424208527099314604448153600000000, -174143430251936272102859349073539136097610895959350576901027004416000000, 18239982511248258426444458529164454527146102008187866100531200000, -37774101659997423005408109970789812947961704097792000, -112580501740220781071235722688652800, 1],
+    -667: [-278701754438991300992352387072000000000000000, -147087485221823269890900432519168000000000, -3737847346141410401145461932032000000, 172524940705544715709707399634944000, 1],
+    -683: [26166115688569819428666837825663510027688881422336000000000000000000, -5025162304773332210314910428254527856822229389017088000000000000, 268100148999161642690747540961044577891601065443328000000000, -348849132150121827613917484442174019862528000000, 453918858809750227974703697494016000, 1],
+    -691: [2881012171895295750002031701073564303892269058276549227184128, -9744515674227833316204230178037052905354521396539031552, 162256308439015306053871060497929160439748974608384, 6703571995070311798431761340831465046278144, 733155214316421345930476736919437312, 1],
+    -707: [45650758520764343599531218962600327069641099781865472000000000000000000000, 6903373536375246004273099602846064408758831459747233792000000000000000, 483991714896097062009964822901019056444300864589398016000000000000, 2906768622940702048127349597557735037973448835989504000000000, -2348163642809062173079548581285822944247808000000, 1896908196134808026819028803674112000, 1],
+    -708: [4046686423378034814414234559373865948538701215210194862739456000000000000, 3603887011528002652771717224491220641587422892784070051840000000000, -2854565250565963840094617979015298078098347812480000000, -2012303924332635494819557244440800000, 1],
+    -712: [648241567076450859966234852141519010761029802805690368000000000000000000000000, -1145543789950432126531816380596120320711223446238920704000000000000000000000, 785817223009850352446749662671181156471363221427585024000000000000000000, -344229835327193328453009390255310533401770044568633344000000000000000, 101406901678845248734425825236242472665257177466036224000000000000, 267549782848128597871924625562997820500018126688256000000000, 4065864582832242011994655020099723505337949767424000000, -2547428128763396947913203000755264000, 1],
+    -715: [13189879204176058896562640516998642620432384000000, 94657547256854352451418607502680693669888000000, 60156378344564221943954774472086041657344000, 3038922093329613647424771157499904000, 1],
+    -723: [43799003445375960815587788104700084092928000000000000000, -17437817166277457429521660531780027831812096000000000, 8222450770908698023546828197247145547399168000000, 4855690107103225136120718536060928000, 1],
+    -739: [70879256868963610140332287398622548391739243260758328344576, -39465098292737222691630856494517926607508369968554049536, 8435175478606501944760514102198191107943823755444224, -521202850366310037383168135322581564217360384, 12301647126979210892135760009684713472, 1],
+    -760: [57390991709103678336339431944416743303984993656228540622045184000000, -8762694788548498478760416933120597566268079681131589510758400000, 262960509575258849119050573504013616920976671774792704000, -41045008988631123111685822548134227200, 1],
+    -763: [1212202634617724845661254714392576000000000000000, 3730143008151395358758986101112700928000000000, 11764579526453656222964578511153528832000000, 48688224497542950284157258615128064000, 1],
+    -771: [1158874532512529823117839025885691033242715995831907669464960496690003968, -1429554314369800014560099942657739809600837745393128794016090721091584, 463885955604298483342404429131145213835946162203272517583917547520, 7594080830144514531813778205972493677835173653113137528832, 325572209586735477136602675439314988370753017085952, 76644978500101583982634373055498485760, 1],
+    -772: [-4039979678479578220330132982722340932044073244946432000000000000, -1654219429424921222911088262751088404746562249930752000000000, -730409189972766569984362477406681962614314316392064000000, -81104350841312411963776730201270496000, 1],
+    -787: [121799441042213268250468077932063490048000000000000000000, 17969534868961880720450029518624242270208000000000000, 16295872719960594906811990015695057321984000000000, 69003057677093510781188231291411103744000000, 188607826190137802296622247543103488000, 1],
+    -795: [1580866394929445594613317271657673734190830966521462784000000, 96989374802114211792220362019627433906928110027145216000000, 1962512368737475150054890329369747830206508302336000, 294853904675299611949375562546552832000, 1],
+    -808: [47935532966149606407423899542710890275091793038645919744000000000000000000, 181128288867528862366782440535423928657211618498508029952000000000000000, 1803501184045414415458226074594817032543094739149616377856000000000000, -6485648984910606765832741139482781395227930706015758336000000000, 14938062448136132459695331800504856899108496990798784000000, -606544748743842831563632744122859056000, 1],
+    -811: [3952215468738319514208754467324345971628622588902185420060055573551382528, -800651781208977500867676974252244833555687753006234188380537794592768, 319996596219961348581003665482834034884511040424887266928167485440, -1602886981400187091839127350649694061166802105702833188765696, 2476190510453623046511601604479343457848144109936574464, 25645222687092338722305478236341654296989794304, 715803850277269060143337898717986062336, 1],
+    -820: [204637330106600513741387631240141531344900447928153860219989040516038656000000000000, -209206135951926489244947052191419600060571429945927215378285293731840000000000000, 326685341487801693986861349083668135208043197693638468385037204062208000000000, -49385838859794684578617903350009352542131555885099985549832224768000000000, 5921762429084184504482281276631533175886519613599247856347643904000000, 2622032066129308298911642413719025994246636501871201799733248000000, -40242920602555180754171145386354425306546394747775756288000, -1174337676197029514663257641696326592000, 1],
+    -827: [2445553702661102418981136764326445223258766539896504908251136000000000000000000000, -1076015162843768992957043985457154345188464247512545705852928000000000000000000, 212605001857755402367927910894529265872742648535302639976448000000000000000, -12601837950859481738652073800208712904901629097618505203712000000000000, 247552058473310741374898566702532407246283982086317539328000000000, -20650626601662469145660884497034859290382303232000000, 1722661406174248169173628838770601984000, 1],
+    -835: [4891900660599003311385391904709529453654625325416448000000000, -7042823494828064970531335733824610561942964980940800000000, 6664997136310346124828673949691089890037414756352000000, -2065662052326646805861259358837766884548201676800000, 204438038298621794574204160089592858008354816000, 2663908095665787906008140453642906828800, 1],
+    -840: [7587169380271379738636919142674280077130439504327732605512510089785122099137867107270656000000000000, -5112159939990146378938499680802637042771646067107417706535388782137560566356569069977600000000000, 454668527671405657965710869144455214652592634921420559367890411545189775674863255552000000000, -1111712812272489788109971969097031933551408742194642794550538731744862298072678400000000, 267678830160178923896641219852982233572924885080172883621331723095220158464000000, -3134769336133353615460866275393209275783941494973163498240275428147200000, 206573882876758009898241769258678546966352946154161788928000, -3494487845306481075093315600749304691200, 1],
+    -843: [158692695909564629221707977026748300372656225517568000000000000000000000, 73075310770259371090473394277205354753774863920398336000000000000000, 13875309039130379123931424254934593471702463886131200000000000000, 37712121952130322350424411490310586953108092354560000000000, 65853429066427465015436329665082314084247928832000000, 4110870386791186329312795254569168896000, 1],
+    -852: [1612367267971475199440710611641385268057869742190282738951898520765857792000000000000000000000000, -2661304063206281188420347972457047853310490375560359790756330900853620736000000000000000000000, 10658653499206182817142966888146260430750861112801078521762505443500883968000000000000000000, 12089889771973566318301723197286312377799073330749870993054354496028672000000000000000, 46846835599092601355288226682492045721779606244807135121664326524928000000000000, 10284821622033602451670634606132066226181623275279140805494861824000000000, -546074483267397728325634259644287686071603927317457152000000, -6680895145643489619062121564880755648000, 1],
+    -856: [595320092985311485518113602681984286078598796937520420636189368159335021853433397248, 100840602675506952168901909673258837400582800529922501097017442693461370191478784, 6991369178933310977728137772066916192262112745060166206505651706920934834176, -44861747133100666670326391171999140977507020813422564697216507707392, 753904043512209705196167696045982334339284730437509446135808, -8283439699523057056710299565708340695936, 1],
+    -859: [60840761437613566888711032177150718357895558969645698306118384015873409024, -62251432058869446795243738839465754101255963512935282057369368685182976, 25687949852570186267052644386825393638247990061761236292055605444608, -22891549188863688130830736915023220430586081481798242357215232, 96605827634631091326644502274552505349352028214078210048, -1567981867819951857438274995475995306493967597568, 9729704930387459982187979811126816866304, 1],
+    -868: [11371446703972153557005184311153593718600725700309629796352000000000000000000000000, 44378942591429771358105182513581760001477784533918208229376000000000000000000000, -25842148695545547358731852874265215585849882892400677879808000000000000000000, -3688512135428749819755387763199836244226650046656053248000000000000000000, 4832336678320186564947698246363596254480056565762808111104000000000000, 1084165259024824617523114514914286804516387861794134945792000000000, -1974950399340297216385036265608215318709613636666722560000000, -15741186408247165829355299967450436032000, 1],
+    -883: [167990285381627318187575520800123387904000000000, -151960111125245282033875619529124478976000000, 34903934341011819039224295011933392896000, 1],
+    -904: [3488838936048965271195721811656374469089896850076042183740021422914461046377929895233514897408, 616215650990935344228967444647916612741560908947286959624098645643452461938810109552492544, 120904883437149580765327208646326712645659926129632069283432742507181066145158590889984, -3267779893984300414470855349561423767762687447234272942677311007916870284603293696, 875108533816120485059399024511676251536750002061840070754648001857591468621824, 8843635213700260530933073494189639108219892487853462140789325306003456, 34136759844202695849676952671984446452103045659278902245179392, -105232090472405843529324874950793760389632, 1],
+    -907: [149161274746524841328545894969274007552000000000, 39181594208014819617565811575376314368000000, 123072080721198402394477590506838687744000, 1],
+    -915: [4778598459304636281822769179464711574701772719392590046424730998308601856000000000000, 43855439221605005920636851848560021956384388384056044083990431408114892800000000000, -10489960107953362378189920112570620718805966517738855799965556081164288000000000, 1191860687224407349325828405512653573945197811392414212685022049075200000000, -683634932911280143877531576013158673185381886359897993983819776000000, 1911117653858213529055899613140385436093019832644473035161600000, 10665182589849263321659594224288888316698204850618368000, 186627311568162254652457351930438621593600, 1],
+    -939: [2024902434669436324739145341733692121629358550134383994031382133501370645111659036672, -7059079382504173607597607915672743790646423785743729469904815061401427183669346304, 10889963956570922788708680325979283701383508794622225517705492599842926451752960, -5504223925677243705210791927479997260528390484447679461056971906317021085696, 2940858355414790924106273619734960462655934355629313592494752959089868800, -20687636271171058530758216980402785183556485984763720433299095552, 55586849969378700008713392929540253523509353365748318208, 643769580989338183909418822153022152835072, 1],
+    -947: [20199776314224058950365890537565315358777099022469188831674368000000000000000000, 138392022610291656780042207674445576504764510661377409324941312000000000000, 9493349427387940653432106335736508248255562379877296382148608000000000, -95925831671373391613819628116008945992178543362048000000, 969285419584981893143448179709100896256000, 1],
+    -952: [493920695006430907709173729054732122181918904423699735755358208000000000000000000000000, -592557041714469241897016906704735355784894422824869937715085312000000000000000000000, 363969630606174800770050152072850567154113014133031225808388096000000000000000000, -122373980350411313421741467080588001304951213611614615927259136000000000000000, 15992247010538127637727164332469124388512242356012692730568704000000000000, -1460506257540279616113180180469936930740753040759099691200512000000000, 1398684197243031487731716900176949010950344385170323392256000000, -1250680692430675587428926155257574505536000, 1],
+    -955: [438953058221654415262613188100773336407392447044238966784000000, 520207875218635547684744626511303352924946915393536000000, 396469707692607651662987973604670339150203846656000, 1456880094856940116294718071366713311232000, 1],
+    -979: [41456720643855288369027026098241251192498301669071928226258093264056046894119387136, -22643568178464477657797831635107226279672744582352200786450999877362565662113792, 2204787059539590582951297575074592196712742441023010756587849923537773002752, 916257787625809004918836254250770296891108887112981767512846720779157504, -1322703982629372572876164117246022193808478202872056584884346421248, 589520179717321952159610085436888408453713173860944032301056, -2745802068956130180697143221825446875143596438192128, 4897095498150258061393918811814252543639552, 1],
+    -987: [-86561080972804089195032732237332898908212644882153472000000000000000000000000000, 1015734896368101959906550405520147975434348570978929344512000000000000000000000, -738865832866383397613300288928804236455666502102906044416000000000000000000, 175519677296813899294782422675994144944294962020854267904000000000000000, -17525372243225465818923603787827275077385860486489178112000000000000, 1871196748851681685262168201856508499939941431304519680000000000, 1419085079338686192332016369584506969346142319411200000000, 7311497286020753098637376411748003504128000, 1],
+    -995: [1281350115758093409346818447390495398325805514140454923517632350610260980827376582656000000000000, -1878797468359099326102323843656108409930138188000048292024138306492722136519540736000000000000, 731848779330132181036381207237516688608618691617197820085107648110602079717818368000000000, 19268761151540238893754846215526934598980038158578487990690668574208551813120000000000, 217029363832203538036010478387856843711248927324436786385626509019021574144000000, 535734097384699985051067999540981151603192088077511541759653445632000000, -2416346836659256769074846469235340589704096371911426048000, 10898583330497937885196343531654435700736000, 1],
+    -1003: [15040125689821293744115482557611348328448000000000000, 1305202673705533598197444367081354312024064000000000, -204493994631228266186213761658603748458496000000, 16219528503217062422459730048347378577408000, 1],
+    -1012: [-204344290478354698106731378125784194576718103432833630334976000000000000, 1243508019466325039942928040075544459231301705571821435488256000000000, -127409933077387882483393397275452601210672521773684542789248000000, -25320300665394312513202440887044222231008000, 1],
+    -1027: [271046093357449955035386983426329999080765259776000000000000, 164592522336657395778809121398601659935044403200000000000, -41547404176734721779832688271619104304005120000000, 52960452958968182770743647384658280611840000, 1],
+    -1032: [9767598321928425111492583219612146446391539403275402158023865702012095558221561856000000000000000000000000, 18232249716341006692552607226253688943255289070298480516647575393886733357060980736000000000000000000000, 15251220060253909185348291123129400341101410322625537860158732516914014007409508352000000000000000000, -11176672597745582211963490041124223121837129395979888490423024920014195575750656000000000000000, 5092740266769801837496770094778606683677580952600811711848099081110874775552000000000000, -226711763353757855159978657258440677997891524237747159643319442395197440000000000, 556400952776314676006618975700322655569830054920023307634432000000, -67648560918371492736413791355417111850048000, 1],
+    -1043: [1956339308201356286000390942634922931524967822148973090751149331087097856000000000000000000000000, -342334436764110490696099633505540022668190509324059731011614391146643456000000000000000000000, 348240844151391894509460622135318068013627093363433794947792822675177472000000000000000000, -7953691320302114896369464108931325271027984915341853835762173323771904000000000000000, 49986940404417396022440635431899967679776934384808700765813197504512000000000000, 27461114260670202910168605900900118416337762630699877212922839040000000000, -56360459319374201851863914055780751336731756439011328000000, 115672705644459069177770774199204617330688000, 1],
+    -1048: [29454477481561065337739645086875288893634262511106481929070989017088000000000000000000, -25621049914343420689392039025367673119179757513095203019197049405440000000000000000, 7452831769125999597702118084128588919955059910743673793703133638656000000000000, 1617853253606236970710953212092360268707670074178388784079001600000000000, 1790943047893740981132390014576016307007148883438139426931648000000, -147475943613655721880897041029867660392240000, 1],
+    -1051: [8743043565409016736756337526364572620943665551429688944132020955512832, 609478936308852703138855519171409018549012233989963733448483930112, 84072685629795186930092590274005854385288302697479331815358464, 74010210743744060468842095314484372058081554805555200, 170566836806239391545422096319774885221433344, 1],
+    -1059: [54749382100303945965938377687131815951613999630363307989951555859309282920971108352, -68467787846615964253889968420566642459854805801826964850746468270218385188454400, 91171383367443129855808350957355408805007188493743297041835744129102880178176, -194474091343506783682373629396296341554933178146702896739203931963392, 158448918014406746129523347274938013298923809932524908445696, 251140984312286759034108048655108324537663488, 1],
+    -1060: [2268948670246012491581730803314685275266118438160652960497740363456259526434970094534656000000000000, -1837066464070996120469895861690624093336322482955377737284336128664641040933608593817600000000000, 363986842303494580753265392002190637000016179641766125133824119048907965365665923072000000000, 15914447848098297080317415374388284095627013115523094658599294529049637930244505600000000, -9013115019628792018231351089598845936684783581209361402393906675416488738816000000, 3288837407053237198260555329634177441823555835772563872061612890148044800000, -4278718050564023344365201219666287230777920229470585743855265792000, -263557742837171682900764257711891814100211200, 1],
+    -1092: [-11399327725494218798737808488898891371555857163161203882074016958512319065701220352000000000000000000000000, 7812160693352835962330966127506219038319484257784013790202419396792420884688142336000000000000000000000, 14147331105803618441787960284346172301266050546136888382416860722817545313985757184000000000000000000, -4114380912031888144184139782379675690399375140970078847729371868187444847401238528000000000000000, 1362719999058592388335992752851672703626579848779924470931866989317688863514624000000000000, 45539601715292538862264980052027187457221547030758023509730728512783118336000000000, -42617815331984530664240019051172769446368789029954440306166016000000, -1220096358687753260204078826101522741473728000, 1],
+    -1099: [1136813185931196805090835221189220662326985354242554724384883589416133767200768, -159957807627155985973845772410270888386713456569958064091773706333780443136, 6031103667311076246161128355928344422120000526076426899664680163213312, 2094712066990559001059860582304843256137699004807572833425162240, -3055628884137026639358575311444074263110618514158780416, 1700869372837689862623335628779192341802188800, 1],
+    -1108: [-247139378620682941452553875146675251081843248745748494049974419456000000000000000000, 49997233345143174809548676197872104879737690613211460200689762304000000000000000, -24353136016851142417213264085768694191955374076583496802241941504000000000000, -12534133693582485709775846498820786514500479100988745457653760000000000, -132814165888453325873288657098806887185672975644361253299515456000000, -2603132450413884702446245024069350283540176000, 1],
+    -1123: [1809906887755628098044099196443063823751970816000000000000000000, -11882827525751670729580856303717922468701235314688000000000000, 60970880543121897498770914917110161705048360353792000000000, 22349204940161721553488598505833419202533261312000000, 5270819845653305357116482008859297909325824000, 1],
+    -1128: [144054188197061114647959975577806552486751522951898092607441434623008249072169517056000000000000000000000000, -62033029791626533178335359418286117742539498742181672586245188539457830384289447936000000000000000000000, 13830220238125982572766496986631239487524316130123904844173241359632236251647574016000000000000000000, -844585485799675867123692988812078131758361010761863389272329693759855439738830848000000000000000, 44391355980699835426894567988595876035361867479015727519849895145154143068643328000000000000, -1022921108500635244812826227071035133165543028174118908244961829374723518464000000000, 543657507354199525771540120622677433276646245037370994327848704000000, -6661165944562850357791223335310365561899072000, 1],
+    -1131: [-415214533284961581532329138210174343300914019928949495967504903585987272066858890314137993216, 595954486881379931582049395595621614220000272430547549206779865785358170889413484915720192, -171310804730507442642317276987078559993324481782628245187237734298768732422145358954496, -74529144850112877516801574743066293838966268038672608570530648925366734908379103232, 34122285055044393017709955545218612952137199292010774758639192875464268435161088, 14033329913206901439195429957687196729229107479433961679975445382037504, 15109868648124674790339937063036605896254712347999635083624448, 7663821188957387585165436096721585940894711808, 1],
+    -1147: [-4910240074893223291872087070464491467225807856861184000000000000000000, 3425558159620577161079728245075966370657307832877056000000000000000, -554591662444162124799867520121911920095650803351552000000000000, 257441396385104084140166784710633455033579349213184000000000, -116130636998144683505156435708506246624239943680000000, 16138529448137876452423420675052001395564544000, 1],
+    -1155: [83347851037168500148480644982979700827573455605987270779845921763214445510656000000000000, -8900615215725314134559469276744109057080931256308383138559489050825505898496000000000000, -9518746549833191407809353203709672284413276783319410082239757655160643387392000000000, 7711851888998550611415837895667386487366740340143356218759041649486069760000000000, 529969159795786169479551056606836273591438303269788897135324287419285504000000, 125802782591288988289501749810981813757267278571203492224824246272000000, 66829784571649628051957299392021041534581719969792169869312000, 23373692778731029019776599932268751032999936000, 1],
+    -1163: [2253676441560869887019558922093618471222049601321413632211588120495586803712000000000000000000000, -43649674649570359595907588018012248122762614401644386915867907324995698688000000000000000000, 7708264450336815403003578588144131383308534443084832229577828269614432256000000000000000, 15393135843276004846584804672322854689862352887630404309934068377583616000000000000, 353501232287940202644216099359748490254664707257983585827727502999552000000000, -109323303260030130590860679220598062851653756095580602368000000, 33809173898726869642841622966118744612888576000, 1],
+    -1171: [601370120287051308534473506959775149743922980556851291866882922737568330022912, -2596454204866777440509932055058092764332749820065126897669189204439176577024, 4698114377323981482920205972316070880254267680044693057537398949902548992, -1131970981574191479074818713186782208548591187139442356404219864416256, 231370094760139736464478222351255733154795266053352013042374672384, 65699179390043860649118809142526564774812370271471665152, 48841767407029519692010033379934438734249951232, 1],
+    -1192: [300736284634655215079871589457449013099582150098887089147485618176000000000000000000, -1080326219153552745696726677082503956413664431573168030185297215488000000000000000, 1470074081213259807708205673552638474266559428801240677240653541376000000000000, -450741055908020775777391148239027791615275928530649110728394483712000000000, 45536837777977555898687922539665926283646055703793757394000675776000000, -127519101991376657036540211752734421820581424000, 1],
+    -1195: [105038454094592276486064109104104502132412363045485369548963913051622342656000000000000, -31765316871382021817225343522178858887213448859273156834962967315349504000000000000, 849870594419732537859817743615962295376282415002685748742378003365888000000000, 252613078475837371445944700597944116868061159721148343537425711104000000000, 11822656134735808985029491078729358731362770157672876149963751424000000, -951626588814501908233831529991745549009183111518917492736000000, 395722801069695660929359296678732437001084110458847232000, 146155494193453197473043349525918973370900480000, 1],
+    -1203: [1082015346905596190388342899749769814037859897015446430092886016000000000000000000, 6914629728705193455053225872669379597837205042406801899446599680000000000000000, 41432297436623760923570057622637550238668775532993425711720038400000000000000, -12963107975090134462022812660336927551359334411701214605475840000000000, 1249014691659202243911946754435591308010786179695192834048000000, 210099810501223851312682035089317344313896960000, 1],
+    -1204: [26236684573345821045481208535113157120024262973142691090411429037014188511150629860367870883268288819899662336, 15347564800403555635653732680202308424880666748809486966892709044831455317159846293585364240691155047546880, 171825091982316566505113639629304861072028027393599726861648358193954430294014651125888418715636072448, 5136332989458424177697219385463626151155495706713724615842869793200957290832600490322290448269312, -888365080573973341129181143524174490938301785748178536518629966534296150991642674109349888, -489794881096237554992254768194398019944518404207392597455445123962946218365026304, -103070675342189898833514071329744658150575745283928094825868657728176128, -219831579883958463189398373780658485003226375680, 1],
+    -1219: [-5842630610265546171446025137462133609903618721117876319915867425085998497792, 86025026984825992238928438037907605220882432118830009032833545345553137664, 18335328381057829127653144709396490133306754981018761537416243921813504, 4903594828850368686510646252265602134391201975822526498112333152256, -2356601808633740746787681334664247878133470139102798020608, 432595789637492816207343163042339197660135358464, 1],
+    -1227: [2513550635275580846572126510888944466103176257943640211456000000000000000, 89252949391959745426288430543461455160950172376987709997056000000000, 5282646588767618158994396140387285593346806931114470408192000000, 619638890847298092963653036606353098743021568000, 1],
+    -1240: [5476188451854495958632605474669826435742271136496375291011556214973391720117242068729856000000000000, 53121242106192681103926681861126043350157259675817864391618498173117338239656119815372800000000000, 164508797470128586227491577980044025935000647406245088950623243558850258210278816612352000000000, -889631393652005295418813742845687562587213744314398942581037469971078089259404492800000000, 279839623777872303202164277375058342637611021164432456666205161220908361713188864000000, -4741437185455099303266383931213196531577753607267932896670680862557656573542400000, 1166739167531951917994308221820716481035064273909202745789667077347328000, -1108279206119763859472986634297184549094197926400, 1],
+    -1243: [30540293156908205255120060127032312602199851008000000000000, -54665859623503521460552388837431864605259333632000000000, 26521598516319200744664388741019144869638045696000000, 1266871605300222128375795939246750405038301184000, 1],
+    -1252: [-31399011381667455964134210833800202428486317927487509408582552562434048000000000000000000000000000000, 411460951447546830555737562448624644472901672839808345597591568242442240000000000000000000000000, -2120265191620962638289499664916021343027383311613851873378531571264314671104000000000000000000, -573084747548303421026138430185214022906808574996871791021599667325321347072000000000000000, -161594809919006961106948722803180714034212994034338739633571745057359241216000000000000, -36923256171633071212393612186609263875904512294802193823596449091424256000000000, -2599233779821048617865353547403668245460580968118754203774692198656000000, -1890442888861114555169420342668193351308827072000, 1],
+    -1267: [41641164811798159687111097207495461601511274727866368000000000000000000, -61457144594568911784638644004143969298883726431748096000000000000000, 25393048043513374925275960224049028869761536870055936000000000000, -1212907169067261713451014962669956980586524568453120000000000, 31680022302665703779281561303635807117209940000768000000, 3671970425506731602488773303126170976367632384000, 1],
+    -1288: [102754479510979755667992775269213271419122203036304057774524162828664832000000000000000000000000000, -135592047329244181563859854029469104322336037648777718984560963161862176768000000000000000000000, 55251219298960274790206059994259244751582364127637923564529862516843479040000000000000000000, -7804977107640328871382321911850312257914473353998094123905830083305930752000000000000000, 1311193655366629122758166415025110581022336555429567526397469192148508672000000000000, -277918356548071200578865270134459984153730463113514232105998649504329728000000000, 28091507215014468589117919400997097994512713378240764256154628916992000000, -9240951570865760045680997346137839650862727232000, 1],
+    -1299: [2348929649130841968898344047976806095930370899632014110641077062769615525451027801841270768866951168, -866529817220891913271235180615993038396282685119617042763192295821169461726309757710417765859328, 905195743060192681447637697984709327358200563330246100164363600882035360517935365698179039232, -233355141236045644875187749134096951524591007453609166725450795134527974986249451492868096, 17201538196064710316480462594106609217615884456684129449592016657542245147647011717120, -4070811489819626917518187041897937109649243608165798387889410378544961290240, 367976141652620610614090478683784827267978580695275869519917088768, 14940491760061197080547019716241030734498519220224, 1],
+    -1315: [31251571605786539236115581037331124154751650014234887030525092761643778048000000000, 788909147853118458299330252176783793816920523835835908921279818131046400000000, 32064230027367107335157347451358070703360770776900834007428662034432000000, -4948610872256928975405274872974679679022101245074504200853913600000, 234624683948394811777250424962648197903308562001408557056000, 29942115328974511819983335920363596143051602329600, 1],
+    -1320: [97393688378575070484102609772364748569437702720422138019614918281329114615938477076822153891382147228847046656000000000000, -38039887135901201776740554544943720383598953324261921806673528172358159163524934578063481550048308706148352000000000000, 1440564325039592709845067874877463044088141586574151125929003856830996185412289341320527503606330769276928000000000, -11346725453301019241313454803369930713744430991711423923070736653179704868794839532252190334016028672000000000, 63448588042551212367314599642690745398746089936036428003699736173360732007940703292533161590784000000, -7564848369936329757748832158280770921137664340570303183861640564358996428548474241024000000, 226663670534475149680772726035193159902547895822786263994560472042657792000, -37175310962524209402711325090684825397858189376000, 1],
+    -1339: [7411492215583335406680386069134177507659532824196141067868149520003916182006602391355392, 30968649615572598010925895093718487729759169307879587390159292214365614142488972361728, 63295766811549416137966612025648637420755933874154121676075308926549426826385555456, 8892504506105006144683448068330523213124695791708010852438086533025296977756160, -36304267265821874004680153060868693016741916286217400353769301909153251328, 7871005940017915035836790215106102653780420644393131990026640483680256, -1317863830876503015866836087126626066961888763091916475596800, 84282150364912367553633118527949722501471285018624, 1],
+    -1347: [967532855310961934347875936063699390475423017669252414977217524662272000000000000000000, -1456374759760488414800362195901333580223450443497197790164374100377600000000000000000, 1183528878500783495853618069837929217014996033765883119985965119045632000000000000, 103639283096178207036911521742511340431747893774436991103674613760000000000, 5837261284776421148760695036466761809536118049097250473246720000000, 118756352448741769642769440612484278574983434240000, 1],
+    -1348: [-205233637351402671829166709514995268961396870255929205484761826182823936000000000000000000000000, -7005331189623551300018194757420977733082442861061117431244227484357492736000000000000000000000, -108187583835179393700112402594423046456149469597911874410489089289148694528000000000000000000, 27980828322472250690823326318083787083822983317437137789778209393608491008000000000000000, -2491127180202617183517663397050355909303021112011092960318072397429186560000000000000, 62575221355828397175179551683922687994271877639779115313739348036808704000000000, -1379943528861977205449890617002860891430178388941937988560603446905088000000, -123948386055710779819634738004266793471976178112000, 1],
+    -1363: [-61478122816559617874801094004621892133458751449853660758016000000000000000000, 89683555152843744472071241545062362107730983259913431547904000000000000000, -4349577227353230343210559398325533683875804151269484920832000000000000, 58060208975832929889852651167990014185834763388951986176000000000, -1660322544422636423379846230243523338529861638553600000000, 235059877328812462787270454241538268504455626752000, 1],
+    -1380: [-1043717434674580402717419972320183214179349425352220925666143898343059593202965992203361417535941416422257721344000000000000, 1515672488750192406755322903951442203568732081884436967876801416160928484351453665061090181618261938610896896000000000000, -359450962870172070183849496024185547533350025952232695319442086650832640411793554090144649654068466818220032000000000, -3204053117604554451212581049183434081694096098503753773217096642404791036731056991709579306948808933376000000000, -11198719491880226077458851730219954432641563194866892969956474394228580008323634692847376865427456000000, 834210097027380610396492239537077265364446379760873874291185809535255620499245325451264000000, -10629137536424828578817878065952562448875253668798815309065879486385563648000, -483428242454398634463543323663456033879150969280000, 1],
+    -1387: [2052723014407052457647477199445183281503328534528000000000000, 36686449491372953371348633076156538920834099576832000000000, 8421392423043512311845823062070841518683467022336000000, 649705640341533249055461232040056199884943609856000, 1],
+    -1411: [259898672030231371072634921991495299708204070671565541211890306346215538688, 563159340355333157360236566159729674583227014555157757651685811744145408, 19568314960219288785284224576189610670941760495017044362657792, 1780126746705689756102562231651060896708610079948800, 1],
+    -1428: [-3711489744391505840909265987948679379016518570689838859089537543927618911465409927842627584000000000000000000000000000000, 3456839501734300594235950152209592698750414128946811077602647076913638860503714431187067863040000000000000000000000000, -187852796407105234735480351477265459845155497818612689401274425061640747631666840894423310532608000000000000000000, -303386981784522159659729731008790456216922186724680934591752863711575979381177651000980311113728000000000000000, 12303208205702120460701668812255683079036859290282157017127878896492104050452329313939251200000000000000, 33379850139585632155557058810145064423499658538072264572138227867514574381239272501248000000000, -217468476883849476852145600742611039750726891957499097582953392796739840000000, -3616297983752590489170592931739244329043525804992000, 1],
+    -1432: [1017363994814577240421026817418452807179749062333264460033172733502588977152000000000000000000, -1098704264123732131212193591122149705387769398148232104895611176277060550656000000000000000, 638138760721657920366751035779504520066933841824249493685737521692929486848000000000000, 17166275542357183852220728407748455306244780065346610129475027465524828160000000000, 279020588065753321124597808265400844031464533956585302760260064754467776000000, -4269963537479460404026062619741702395527185137456000, 1],
+    -1435: [-4009811510734177961140258455491639109235283276327883374802990268416000000, 2539970793779946148723473087883821948343643667859030533390886502400000, 105161502065491843193116493512870644772977750388041962225664000, 4835907878329132222450395857259654466718969836339200, 1],
+    -1443: [-40121431686111497107438694301588095660424226808243356275191121444864000000000000000000000000, 36588900024092959214287670379032341515077411319217339485496610390016000000000000000000000, -58921214019502688220627382578989797334628684856811176849124609753088000000000000000000, 25376376872103630476913309563818126873011493179044338750905202507776000000000000000, 2804882657599803905961113861619489484496874584629733544395223859200000000000000, -78821894638824193833493666440221145954189657256628410269762060288000000000, 1271924565380917081210267685888550317016839228476875701829500928000000, 6735130520807277676895557698068701680318487707648000, 1],
+    -1483: [6870938060226957278431611659432080124005133614045290427318272000000000000000000000, -5983127083630888407007205561356930289691293391265374293458944000000000000000000, 5008469925229175131759057638332360377210649970749868324421632000000000000000, -376421614944123477105798679337666203760274925144628992671744000000000000, 35808686496201036344310676698591209807816679863512090017792000000000, -2011756811987005488751821886072011140151603715305897984000000, 34815875634155562113301067877087243139098717233152000, 1],
+    -1507: [946755971011460406830147750660957594274801022094278656000000000000, -131730022847167071512725748945146741381253488296591360000000000, 3693591679022156272138192761442250249057420055674880000000, 92304656744815388412175046838197961483773831208960000, 1],
+    -1523: [2314123724434909685785654086800322061690046225438002028660927632777371172208522559488000000000000000000000, -961085139072891786755934408585494655262395547218838265894064215450937234238914691072000000000000000000, 37581718392000292350872411069636893113927876115921108386082469022500051483279759507456000000000000000, 15751883021683135238392657004483180133954400951494482627373610379681259991896948736000000000000, 55303233788138929604623500985560011289728848253544057985769545161183030629367808000000000, -98673474639121782081117549681135815498329331906463660201740337152000000, 176055791505098728943225496211146954292845720272896000, 1],
+    -1528: [354575195374461844246948169302330676593475440368426716439789752420588738052096000000000000000000000000, -1330434855055626709489147347810897660163606036675159746155342268003326531469312000000000000000000000, 2534914232367418849248517663550828594607243865920257083888881891887274349559808000000000000000000, -1627456670209388101210115630889329822101953361875062144548551446440017449975808000000000000000, 440965705781341613340051370543735443449794646350475924862081008378403105300480000000000000, 13024372828329947544607341382751063933651799451598218667912113136795507920896000000000, 99878477524954402165551224499432669308893034482769366038671830373023991552000000, -215268892142320585480835263642311079363564257459264000, 1],
+    -1540: [35393772430126097929846875535887051112083338397643764824010316117729858709536249792898603024023289856000000000000, 46787441786732458820488281906991541116619282261319097960218235215598040810357936414042690370937867468800000000000, 7427862043816793225887839351921172697648972542206102972589825511255238923000003268762243855770714112000000000, -73560169330053609039053599079825580643757504375974892764340262860363008316091765380340603735244800000000, -466360079075241326995156571883638104758296725599974536329327058285603153961495639931946008576000000, 10513992728337323857474607080214044088440240805433393995398011461565738649957200239001600000, -205585092816139405052854352895728829746651659435621725196337548174692722092032000, -348332834308833141926080575603441539337630931347494400, 1],
+    -1555: [179277385817055839939036171839607344168985308854293076933328502784000000, -153802169705179237851782806689208034512876098346328765182771200000000, 36521008026523717023567141651588968008073653196177682701746176000, 634043412248649501919536531936002831564519413161984000, 1],
+    -1563: [911117845086375875023097329777601952853998940113375012207584134299648000000000000000000, -759085032445061540449808744300679851794433087689797198590650890584064000000000000000, 160751816249029592886668561036804121827461172730387368506958851080192000000000000, -2314021489973021006909674633799769456496976796530529153284887805952000000000, 832630358471054404769157558327998916860657859855158261373751787520000000, 871644072641038723271254278753152228012083268861952000, 1],
+    -1588: [-752137845086560071769242284465766606476342485056636077644022839057445394584272893640704000000000000000000, 60195369717995194299765194704687291551287615796192537870780377606698912826370781544448000000000000000, -12280966359713199719188969559666103539924037476829303011261871571442431686156252155904000000000000, -378335315410755116980846930665131165808873272109042275761349284670644093689845760000000000, -3589374606091040963085179205989698322613665725980213008521504909876182609984000000, -2344296418042625602896648055533516832503437774872272000, 1],
+    -1603: [627109133600030028142177582970827323412605557499695827255296000000000000000000000, -60480669410529354812812065502423560797385816674962705427202048000000000000000, 2568459135239962459516949268334734895309288870551797782020096000000000000, -14263511902167067342306592426922483809118337482052432035840000000000, 268886131223053886910893524650123111359741795969122959360000000, 4228577613077642052745258882473091413893367342170112000, 1],
+    -1627: [295733725023439585719866308804178367489089418921586342730749968384000000000000000000000, -547023624034990816249416316919376969544953055437388783990849142784000000000000000000, 598771417557219170413097345877883075205528802350385266869093269504000000000000000, -11184103908396275712991620071369234967801980963700026254842396672000000000000, 57020173939152264591401728828543469521559778443285209823576064000000000, 978279656855049666545615412384782135249382850167035658240000000, 10804502039601285960801782808177853141315827252215808000, 1],
+    -1635: [49276199578905457845102573562747225935362693654898618135337655669177929822508545164691799801856000000000000, 16043575465481243110101477319672824496307598176085040524226450503095803336920572865041714380800000000000, 1185588917565204896903467156749052980062785088793963546202418814735307992599908533342830592000000000, 58083943160701156490657320186359495682972997660477330280450645897910745265012978430771200000000, 763487798228608245665681588689408967028390633457036644160039940866436715782659375104000000, 3909023240926865657331063331027713854833000410357627622106797397664367472384409600000, 36167589002951478828770452769752290877803027612573264454125976905842688000, 14748221610324576161365059254275292279323081493780889600, 1],
+    -1651: [216220344049743586117132124524430080596519876722987925617581330275633769111282557592997239136046632927232, -114611534166920842587960894629119122029833245000886555708869559472552401058428998644032285067446321152, 42871825134148753313679327641923674906784437280526767670553741874480765592431242145904472996446208, 2834843470900478592559231789682794766373920093108816181241013651032618892555652710827038867456, -61453432759599254472258307451257744729140306642012680190624380972303723778506854760448, 410110862453001242693445224785991388012252106680219869479795820053153814937600, 2069077842669089250944860377500325918322079610874033363077455413248, 27417083397248154476202712265428875552070001373905092608, 1],
+    -1659: [187459606686726562914275562207638348322531465366390866446463579473250894737277794805235272023450107995790765981696, 4342859304564535095042702292602775558581959331335294564433926193299584409072266800867072926888092810399646220288, 314571548882093771261282046120453990924273718104695891208642727461843353698311279081359366436321067354030080, 183647945801252310584296428931380015830637803812233477092735985592566096720599486953887258209683337379840, 2111689753800117550462681010811129703668984276691189746364574778117395533942197640879599136014336, -26270800232649708051749867466345962801065777767454913161312807307262209032189315645440, 124804514092043993920588314502834201574437325706873969007128707772029337600, 37339864774832663986948622408100112420432744772428824576, 1],
+    -1672: [84167329691923140076193507169334139598140227194773815009110465270031301158938285601380630528000000000000000000000000, -43190494397179273049688575501882805164460160313753285064008131911720769240692356550267764736000000000000000000000, -119893361548661338130215673616512245939410748219524093019630785480172185426740305367924736000000000000000000, -495529611552460246729081107629228214824438456692432376850245676095088945815585838434353152000000000000000, 4198344167877930464612816644953997068009100594886625432557406188264179713288439064715264000000000000, 81204269056320560967578569311530944131259719490504958732080350520763364611189673984000000000, 483305082310639983155419912275235577939644104117915287583215431001599349769984000000, -61585845488050596381864858204056796734820954451125312000, 1],
+    -1723: [22117636276671147862840290439621705704748794677800451702784000000000000000, -25585666741501267588751437947480472614496645764581393694720000000000000, 8147352112441079339114932116215629522948839835223967399936000000000, 100007681683305113853711203615180993147700655452479029248000000, 430473126428685627917807961121230497816202334067122176000, 1],
+    -1731: [5023154833403628731590712240742726436850496418832518391720058914852335112337908602980801264802154767328175194112, -3350507801591761313761014069179418367015961504458915097741685795668262992120837154989939427980032451203301376, 11783987048066530155248483932336319378594515045089107015958756265978762640870431107918255007247901439033344, -2861982024021086595914418940528632264778880620779428599388756688019247064016119050353085695894877110272, 247250357411666586786620624423715520998979417863847733455713632653679383501230581869787923888472064, 677789783175040280464772599790660356013727504349199309095239259070912019720473621299200, 4864390422592523528949214363415261246344830264681514614178422512837877301248, 582466983797392283978013940777319014543526676620651593728, 1],
+    -1747: [10972276008883064285080011870718249401446538792690253824000000000000000, 490532026749899358428380180583698110640057609931980800000000000000, -5035877279568158128379680839999923826224948571172503552000000000, -1073980648086639795645379984231813344252858982220169216000000, 1064178758997417055856124713452790702387631331694727168000, 1],
+    -1752: [8784104114151950543870965017364390186153896739161199386801574467379103878664015995729741508511668883161088000000000000000000000000, -5618451238484624829288312721125305115323085123317611460582254550454556172796580574820005601411993119490048000000000000000000000, 1299742473031598843617950277127833138760319151348746149681947050548889500392557542029139546011789075415040000000000000000000, -56999665746957089228559212347786087948427803429102941315879309278172511068691675530438260771715486056448000000000000000, 1648660879565696324395789554116594739406087568620902721408254798972245411301438545746728330696304386048000000000000, -500072290522287298493437051524780341981635149883364054616310019345014143732986037961394220527616000000000, 46009234809638558926795075126335929285203951897146281453699757122222467643459328000000, -1283995022690977380746041844501471412370679672985205824000, 1],
+    -1768: [6972506166996326005668602109398642804238680403398752117366309964308538393538123005952000000000000000000000000, -81288959010056057481593493665488831374698391287179614983994580979194302783517246881792000000000000000000000, 286872452486958155746462042320177542329601464669616047696468743478392567854302648860672000000000000000000, -91213107282611886328242129572761452365192020295527418234678497178769222083301382815744000000000000000, 2899084560391260080285208961045589884517868114041548821693965402743033447667191799808000000000000, 1707323624444471636384624452363577927660563983908973767756318716331101311890853888000000000, 113008357183335295512468973203170025881565986073053233234313232827242628475455232000000, -2337439476036560922839276285432493182071557115439083584000, 1],
+    -1771: [21172633006876103241693523195029149321305822158883025087050318468530057009207904187986751112184137252864, 4317513117338886371066489129580028033688132899396745335498131555436812520580140862168907189017489965056, 56861295866549883841686576483309011910783273685748314744289057129031106313179618204114135661150208, 6563630811082422991462283459369585305023550992794734851421175582685002111590555808767772983296, 38662928657565906333516325398928284525676337108866928394685515957369747125705540194271232, 242376166691000759506893832445286954466738743746706882585691805884283901670588416, 492324347300657649362903200694486764244934893397527306084246467117056, 2614522107508201896224113844957293524905956330315793301504, 1],
+    -1780: [12858703576150165442872138454389112052505221669376607813578883133089254703852777017049785394148758997958656000000000000, 6927725192413068189831290646693890707967815306093486307216981210414688532594925298122399721237579300864000000000000, 28358246739184972369507420785666250906823746531142012928715184561908908409625698386032634275221783707648000000000, 2131920630965960046829466142138117883532150493912576475645481827762028949965789784058778553145098240000000000, 44675973532546488256683786051390141790335907483670753953480198060766634755143978950386063299313664000000, 71989905415596407272360588321224179570900100727998432650598130457439373081877117896422162432000000, -221132280110904282349580852715014209778181695565277045568074014366450991480249264128000, -3656801861190984837107498501181529008270633865017945024000, 1],
+    -1787: [64543164987089262213697750136635232209963099023049721095782858989420319721370537551417655164928000000000000000000000, -25237571320078485794201715802461746323364504422441091431091004924907421127646903650207366381568000000000000000000, 8768947288403174551948630149189980838267090254569383966225258733648144946782067547753576136704000000000000000, 5250794244278974834648940452736724249089423584779718825091795022717751035275017121479786496000000000000, 1339554553226394174553611437572006718020120134382658117570059999593515316428727614701568000000000, -79720189784112180746539843280355241727002604470459947136655480909201408000000, 4744344785293901943219880280306328338444647230832717824000, 1],
+    -1795: [1975363495575590489082132982742621821282593929112144493817174221518244248071717044501302214656000000000000, -67241999569014329652787591169360247491362161583445656361212215008513002466973491939770368000000000000, 2924513295836839579134542930733031072273376059963840856531811474546345345568381870276608000000000, -19669528887826644065767740183064652514793035744327319144306223631279459403472830464000000000, 76056694764463627435025086849395044366064639879216867180868932934720968934293504000000, 524286991295186900868889708592874276048060201124123703041715068395847680000000, 2325035420593243193336642737998263727919003643069993711246940045312000, 6384600935170665514043470986931256443946434696356175872000, 1],
+    -1803: [20098755686034016693939765554551228674948613342025236024467466047050348654231552000000000000000000000000, 12431099082752332287240163903349018450148337456691773084431706791603697675665408000000000000000000000, 5339552182571690503750705300170745370291548852529531519274266557636421407997952000000000000000000, 255936761911580214009989960075992762190960288476376884794019770776490463985664000000000000000, 2980065220478929740671471824848481298954158468434623735968090680021428994048000000000000, -53544285852786010205176722393916933944859431776616967065134864224349061120000000000, 175821626335149220389208523228761676152767188142677624297656952020795392000000, 8586263647806690299995234077948434023520359932608237568000, 1],
+    -1828: [-71959859564387520925812967140138623597874691536758471718786118985298519625305270779904000000000000000000000000, 396331802328486833321754042710906110096129036102681228323991807981051159335073461829632000000000000000000000, -533723035561374273182322280309516831529565748280646156467960963817196890346687885737984000000000000000000, -159839184329762409323332563126720149460333613853625816734802063453803824041752350949376000000000000000, -128438825936674412329972144970735472512613104814304844506107200167121099341122219515904000000000000, -833591115789130037848257656111132636521499493723149089748788518231788877523672240128000000000, -3170335694293098002240168280982690550402293505418616712937123088143962764144118016000000, -21580930539330992514717511322557295141033968574732392896000, 1],
+    -1843: [1022305665261405789362573887281623554836961835601464130879356928000000000000000000, 1703315687836999454462902705544451532759249442114228547496181760000000000000000, 65803232285668613475104046006381373299270829927678317718142976000000000000, 1933896614861732326681521305766136783111159908701140030586880000000000, 7838335171913679781647841420995122015074838433940560150528000000, 37403894180202678155356755976563481526943814605112504320000, 1],
+    -1848: [2938880477054936063934166814222358958437520288529000102386327055109822715435266509343580669929125733754288484646912000000000000000000000000, -1882356204774046171576660675348691009084885293720571366092494536234534269652885480282987062900161050358966317481984000000000000000000000, 112686396603605581488195360789983050759006793584078593601068787305714468706147259532864454886327005631932498182144000000000000000000, -483032986373707186467046509820584981104360833138097316324470196311679727060369680591237093328362643773359652864000000000000000, 2097675736199370987230892333044091148920381864118519451847121706571707876016631500981130944564050109161472000000000000, -338256708485605522726290891966565571718828403690835075348938558322631209551561508276725929313136640000000000, 9516436245479571768057813268908710281867928899384121705783749545414246835457738496000000, -44907225947994667664211013610763873589182456351030606912000, 1],
+    -1864: [15708825836075130048472208775281230276406749524010796985690492864579539455976596279153971776804818741159173588756825976573230317568, -15251032535754076477509401246713013140677891916060861388972283651849656960024834969796742494390023298852498338680541589327052800, 5049206342605041078137005265806574527172857455410100131852980177137743489647210683935725351726350503499075723486798576353280, -4040384007042304719843254404007471014289056879447437070162627679812491472419070637960028605283832041541184761683247104, 8332632164436790450386480019440057949599754645420635562511403541156956514778492697424752495228150300053348548608, 22316966976004787927475637445451565457454493945976489607409263421639138769760843766352478072182145024, 22830357786431699026866819703206831574879797519703685909299973936433509723002363898216448, -80477623844269624322446500505858925376767863475438052874752, 1],
+    -1867: [328043617100733300406098627198236644161849525109185520718517210187825152000000000000000, -417666456716082105125094342082637063107409343852345940493085161029632000000000000, 6263821649035332499821670679192496191611885050408415035156766654464000000000, -10557876447102477661186151238644596127207141266739286333456384000000, 89755014833202823144487504645057894143187931042124775424000, 1],
+    -1912: [8533744906522299379568964249672297401480188986151807569450858264130141094296237463568384000000000000000000000000, -1973035119672326875552599794849030041452003331555546458715084703322270288886806626697216000000000000000000000, 227014265214024216163677814903627688424814463291186979032377907166440845948316273344512000000000000000000, 871167039998947214039871615717955531152005242340488945501146558376921470255422719131648000000000000000, 473974708772805989855697078559423157995965724958714892213655712224087381793634171248640000000000000, 8615704067438965486190359131256771540938138566548669238345848831658801146147337048064000000000, 308279587235171748518552469818141365437891350083538025136448461778355250285182895872000000, -456348379360215549897508684309886836152114522668603214912000, 1],
+    -1915: [456054159537444194212412319784978746670466288075756158380806269073727997083648000000000, 955039752175865038518068452582314127774856229032417567234553777376498129305600000000, 663390741827053666634329253765141561972318116625293027983875501308124332032000000, -26067037587498062947818338641678342777412546888862528797003763522365030400000, 443913529284034310464735952592501145675272880020032207103765780627456000, 508255408855221387252483812965750096617531678810798573158400, 1],
+    -1939: [25168994119206510380956088584331547798512188240852103437146012650389796583243491737767259070931803308032, -347015126715812627188811406779371212703576706539508605220149278867816671029506968839381382514566234112, 4032067249840249953876706860726529827445338139377438942536347489040990320447611843541278114623520768, 1760480250252994720272497369132313449911676198266619367286870088609818540080660020668687026487296, 493629846123531339870634086533823263449976203516464885973806360118360339624455065455193751552, 1289486632909008153868952630798853712361986453109781387700691633550877365053807394816, -2012583395225375388164793228433404906628752633485834271033913601238761472, 1199649546897419949721286727141564553761375754459369401090048, 1],
+    -1947: [-708754387150477906258898481288241167074056377419203417482180134060613361874239488000000000000000000000000, 1793612415581137291777152291808015847540569073698047312801604537949255905038041088000000000000000000000, -560978584019371606449697977681910033269557798330925826069066218960215332249141248000000000000000000, 81994076822059328052805945290639146483694047057376289254590868083628947659554816000000000000000, 2542514753896367146063368303814220376128471886516922974219317357940071158775808000000000000, 62879490394833310365216362802035708378238956132005566324877016974098608160768000000000, 186417520111832869856276238369237172768580252979149213900510785182464212992000000, 1595383311249443628495540825415110864762065678771340005376000, 1],
+    -1963: [422574183089897680993341868384579111278985397481264634217306904003084288000000000000000000, -168280159147819662631541114368157506731851183877818745600964405588131840000000000000000, 19059668030708404214628089603489170588607044373819525852869528551161856000000000000, 526162909745086246983617441331479464568236789741451254071906942320640000000000, 1518056825015932290654595442833580616566509313889830333734453248000000, 2816602747966722384292456109932330141692178657723659018240000, 1],
+    -1987: [2152711710460113053454361551481127980899754626177153469301210633086911381504000000000000000000000, 354767736420196788341083494859294966727170608589666215527197435153235312640000000000000000000, 179963463985257891728398235767398012843929190313858757148260720926626152448000000000000000, 890517685903235689953875667141889963831705427594807695660313138203459584000000000000, 1562557420774935520840278664946610330799534895639013318206251056758784000000000, -5779660732904696211335224337898125440233946750210367147426709504000000, 6578663875408632130391644198378445881290562481107692638208000, 1],
+    -1992: [731953138148612363200006773690618236635791777404045594505226326541058476059650041402601665221795426481471488000000000000000000000000000, -308540563325234150530294445899496416062338252313902356423304625989479333175413835518385628809127226449567154176000000000000000000000, 144300395576021007554802289763516095072866714885905301963374807594833752520753254277490289850334459477191264567296000000000000000000, -808866852840923608996786103351311825128901733002741646984660426791252242238385279258056544064657248894788042752000000000000000, 61548825903829969549115412252532661196051058398845236147394689389091797730156217217353404626936327722731069440000000000000, -4366341834150210896212499994237814155784873551664836144411269196821900431454410940399808960472136773632000000000, 21974272648765844716043407694203780803861138081980150177219170488878166433047776610048000000, -7845302114898729400939192362548254523399142470783095817280000, 1],
+    -1995: [-2793280578623934055462524935401836387726975747753731724304200142758161004380391213668435519754253369344000000000000, -9492390995020665462583343409318513515487837080038989095059610855656603716668716150284165565548331008000000000000, 7583787138256896036340914197731526406279614642135346044512609265816214875013392826297432572782706688000000000, 15993943008244876723277715962890260649301013109812073265696006930313435935545142727945523178766336000000000, 1405418389316369750731155601214022158479432472665399394391931350212884992870888047689009540890624000000, 2767970419159266385208798347997551824595952578888109911158722719932769753517105526865920000000, 1794440507135061234628935488054861046711402251472375612353624431382279258898432000, 8718600855947368607644625805980861416251107932699191877632000, 1],
+    -2011: [3724345697998400664331198731496978290531557897528995154619748120946305571479729398064716390416252928, -31439269340303078148228220328042261494256082283896860166973369297530113746794449868138882772500480, 113648106726091213901222788439200303371402104192999309947244480427700911848751831420058812284928, 4019743135782898154025673059934798448591221861229553928796974604824506077288962047564840960, 45505523280167527497259908995178896249258874658053628457109501134300067995887255683072, 16300847873399966463232250676579570378903529987299352299708939470043611136, 15287325030838530726060718956632626460288135250496778653237248, 1],
+    -2020: [96618510476101494262326230905015345942137622244445490714230161823031395192395752798660747432604314429635859794886656000000000000, -114547487123454043834286732897330618088919845732945793440217852778093992004535827518587441747221316624920623448064000000000000, 34191722589574393966831482026109621471487590645340391309906435399776676476885292566669299458458444794208198852608000000000, -126635906833390756259248223848378826853267744250592618362284655893908450431114261029737774114402645946925056000000000, 126482005618461671700071041598721624155300799114571228919217796579304386701681471499911206569964094357504000000, 176138175078398975668857889775192190573785077943887276596638345525815510274543362151221330827116544000000, -95859593740017356476608336735898254701107375715173120312705957482694415125000852664690688000, -20945483472992398576760567464640319554324020854303057017280000, 1],
+    -2035: [-20272526749412809823083654113701249456142212389727866328943941716005371104626563987756594233344000000000000, 15388294599000857744143318757566229576494184459768130035160444575649085997438966923407025766400000000000, -4553791528273365823340100486576933335331088745499980126285253838433450610448348173438025728000000000, 10896229812971971671983008109757287513711503514668192133658351218979725801169002306312601600000000, 27741871614211157379858579625651948685563265832063918538688386026812633205437978640384000000, -19866656381335114376540075886706223313405319956556931579063269810193875284787200000, 72103646767357843076571388909583447510575669556261115230586047727403008000, 35346514847400399846346453580055626844947813034275743009996800, 1],
+    -2059: [-56034856684589927078414591358686024427303592021191697501854403158323415669675351642993565296157109470101504, 1824291952089881900027334206261814738869090207478311873577753102655469161007885650926863964874474159865856, -342342670048086209880261896954335258835452878801433679150675349095070316347093698798115959196050522112, 86498199092241089536767712301980297570828593262728170897256449244680855228593363778346517782331392, -265404438026451640991322555394438190750016288796322384211040885419900295058559623516500525056, 472400296402031515614318725961432499823980974605990415354208529387103805312618953965568, -317141747616659344947748020214200609962251521536086891769742607211342856192, 81324504661699411696370065463759236328368250641149867361173504, 1],
+    -2067: [-1048381404250859237960345683954077798415126341231866892467394263961044473599989121024000000000000000000000000, -668970055238116784833531805443697664386487391562054634198653530750179119133232201728000000000000000000000, 536136574847970169413414271304893338857911718699521129945713552651830489441573535744000000000000000000, 573132446960627712075904799997673891353427403590157439665916955283589661007762423808000000000000000, 7173187924990578735062288895592562644568526591237592374659705653729515234259894272000000000000, -39649209022469693446259132924803691874935601942314972471658561483222120627437568000000000, 50952986609128295585968919064626912847948399068930884453924509174603662229504000000, 107245044545088283784195030883785582562392604305814542819328000, 1],
+    -2083: [56106216560188103589087337422639293318133708539713749574270058496000000000000000000000, -24261822031805250493501739349427861853890830942453644737640398848000000000000000000, 22788373070840541263845558779868546271601148638885163292191358976000000000000000, -5278168437052680004607896557147810716175840424729992887405641728000000000000, 693048905406378756456177931319819735393680958729481508859412480000000000, 1079050983332697700114819217544921691043181788643123108249600000000, 186205839479306999525966201308917660820963218042478314958848000, 1],
+    -2139: [-57771122326546737064483150345267326483952386954553744379912486357170043101324249815958900390706948533880537120374725279744, 22089730582886730633299320461534039278428333084249184089158685090706540236576443012701405516263417143165381085495296000, 5988156326278329439835261699042349401793974642032568505429964895394774239767349866442252718354566727418846237660545024, 201338530057281532233366023595687450846199404057413971346259247962330590690914515774449577896697808205281002258432, 23763282725606453391484505513988030448134545515494461252776909718807596233434469041928462651053913700250419200, -9217161108125662254175853475538687031412893753776117291730406543916162896270825261047525752700928, 1365565828749185026713140023904918527341891846190393698826366499277654729373457055744, 1263235967225622798274995475287782721050617768569108440152473600, 1],
+    -2163: [21930996060512693669509222865448586670385717000082799967810659351386787113514530768945152000000000000000000000000000, 45797036945102309772224764907295871238530066024682327207378092955990293523370571651501522944000000000000000000000, 119789605101657535895986455209554301915012365752512903364318458396145461912322216384528384000000000000000000, 1611443147523634084402145043638881489590036013317277636323101941514714454728328867188047872000000000000000, 4623306242820838325644402602447512556123271728765793422411608185331204726789274857373696000000000000, 4691380305439125737919865408088523817408753718317461685980267910709453124365828751360000000000, 4036485341885803653376998461079161888638902204154371225491809758052315576664064000000, 2847754421255434406831084382854294692017686343514257980964864000, 1],
+    -2179: [712527597959059293070805699693521600394216540598041061347929087201923098381806834125889389523932020736, -2141397850576918291751666984549101827680047251446601092669060366120869432472534134557982997285437440, 2258389034399881078068141441393463592947960121440609696654361125351833860687657613511921005232128, -896506111596760103554121634111061765403826433758516443534674821293805613463403580012709806080, 145970527168209719679893830700260646547963981332090546601960027262268491955192616217214976, -43201681248411133404924644637854182450983260008399844068658369300948230078464, 4883833389509877903588796107700053363172382390445121693564600320, 1],
+    -2203: [217049315120963111446606786614831619271467826257075291824999096037895307264000000000000000, -136125812590732504314763782112143869965497676192764476144106058214793019392000000000000, 21640569628318338155418587236281230588430084772239571168625744182002057216000000000, -6844014255307220707700878302398568223491614384979193414938903183360000000, 10928022023566789669783068114819419427253014142627272930054144000, 1],
+    -2212: [14859840370878018942192069785534736609041618993116811454870480459571604797635893173299653640192000000000000000000000000000000, 2836558871281444105023829139714192684715227904751331708206723179225566182622515778993036627804160000000000000000000000000, 3890977187601683986025999074783014862874029146761395187144961451446495921472907167223695808482246656000000000000000000, 328395500347434528480260927061346860624403260645429385348188089057588048606016337122946001032445952000000000000000, 105093300942325379186152642727472890130098478811470395614227057010673223584776083307003660090761216000000000000, 2635398029579912909726297634825126731998624721745568762355601723548084534226951586697900867973120000000000, -1794017495863558121539770794991417630974554033875313142885940850131161183007225432535206144000000, -14764467315169255060799247175327322183255822742333059328696768000, 1],
+    -2227: [28720631316224774123307666252767008222477866535756939624181661696000000000000000000, 261956092796420413099089855619865674232266250871471722047878463488000000000000000, 1117562314448896028873037128320051953679946267733531638662510411776000000000000, 179677092901233078376451780209000783317926213276608629696154828800000000000, -3167872386034517628603508442801962844741316143930251578791952384000000, 24345691790686041024307812988315229670534281342927768410779648000, 1],
+    -2248: [2084393770538271174632110448442782099523036581268606990260702099518651039420326349339448303419392000000000000000000000000, -5111700864575655671821311476793257287436705751661083914552926831329948562556710374566056861630464000000000000000000000, 4254323691588764748812287060309974082965854648421920952814038514593015998995458627389616540352512000000000000000000, -285309659850927630147138833398370620839153631753330889789417698213635383991903932609155657629696000000000000000, 88134361481013862037623721282321456763410990739898215257501213783922976829712180008709697855488000000000000, 1928686970271650129221439194571253201811246109358954538964427552222315038308340385311697309696000000000, 10812459035707397233476655208432997948451828225740320517014125818201161322450738421035747072000000, -48897086573140438367811382998684541126261747074957640329055296000, 1],
+    -2251: [4165008547003759628112118234054515048886256385208424911443416900360120729658811518010622935507689814326509568, -6307827962692401019514460275645177699576708122376245842900388173676879901328864294777028934510181636636672, 2464881623384552032373486896264007208141017518750714231238086180941101646142017809371392435388107718656, 5429620551652337296284510315545277007161774639927390689562927006778011611377558599768391173537792, 4220913458196253389938728795352049508682058289950623471169656768921425837629393101339492352, 295074881153276414431511820211653523303202730826459891885794383918751968919552, 54004897876955992640352042858358069070508875345188259096734531584, 1],
+    -2283: [2785697544136965162387394072420723630688138362481979594882244140111963949043943078887424000000000000000000, 1716198832407149390142230898029767593989849732884797744439502301315597060703112342274048000000000000000, 595720153990123108249414034049306230614826738750085234614994400505924870613277555556352000000000000, 586214303394503164685048660501020600138153720498510345640905849705825978399057772544000000000, 834127837386049541614414002772005990776064591087700696685710203969678685910335488000000, 155211702038184330803145503259654912289657012240057832249131008000, 1],
+    -2307: [1412749382157200587651173463430627593022095337512260704544407030480861162358898692194304000000000000000000000000, 2483523182724276462840362617159334093406959945577855737118632263615153258463394420228096000000000000000000000, 18391044050775961391361238931792273382705484863620339131559223526406061994386510997094400000000000000000000, -7144919420125250617948915451698770424668832111229415217593095047333306025612145950982144000000000000000, 1961358533602121404447657447226129662822667640353509536238051840165359956904582127288320000000000000, -626996636568052494642098765460721199143690474545853784048875792892969080502756573184000000000, 2381865133483501161160556136812180820910829345877586866301686608817038178857779200000000, 340947786559500160124183578739055204802510496739566359983968256000, 1],
+    -2308: [-157727454369160325096917269451231698910192320402807198030882406442048696175437472235895361597037637501114646528000000000000000000000000, 33703942214830888332224446855859562826929810670351680358142233572550592683754012504926919783161719063406706688000000000000000000000, -1627589682059047757488859482396970402222350620520036142916712605753947203683501726408661011385242983473348608000000000000000000, -48640268796821492944205184979956189851804596976508785080863551601865876722648188234499062856477413589909504000000000000000, -1116915376511119833346360365484262725901723504762607767808121100535269203642463333264940109750244273528832000000000000, -215077006587347609435326071805340693578369507481999185679593440353684230656268736385364941459689472000000000, -209090364516198298340935512226113016534090923176795795480454098341062670041807922364951693568000000, -352281102218420735745148169757008158883391113410924856568037824000, 1],
+    -2323: [8783498249734496043068607515313266334294762947629986455609459464079551536251831058432000000000000000000000000, 41482307300058062651249451797562836301715123037057176625260996939891789931727493791744000000000000000000000, 586390130695674037751911352593424003002758410625516360752453971246354013952160038912000000000000000000, 2355614900277067146686975407330771003809876145256382453743263919431045641148563456000000000000000, -3694458185662565363864707856121826719438556347549597400509321809651026448351232000000000000, 3534391218226896568360877967587911402663044321192348194795973348085972598784000000000, -2568061646447128677022846949995897484277899373000227979269714957303808000000, 574835233844737556839255055364769382984597625813154466546343936000, 1],
+    -2347: [901644569922562159908075052673194391591813593885976890680803328000000000000000000, -275005605893225872283528922063608430694556156276885172134243991552000000000000, -3974980164212098708353473429081552320904452727132783329325088768000000000, 3850392729356723089776031377897241173629209744573099844793532416000000, 1254200008892825161202591449810348856556695501877957727675109376000, 1],
+    -2392: [124410439821086008358607603757564827085385830015369381672797870110123542431419771350322006103622491243282432000000000000000000000000000000, -71808862906473472814394102146121380821290881158866990026668566029452210291527171744718668760844487666790563840000000000000000000000000, 2018457765501263336124690942980023568284191954128375844311938307195596105572590413919483528446301945838802305024000000000000000000, -30672574295057310479427470609811347426677433474082768470160190422041956357979018915233511417585646633012166656000000000000000, 144197929203921474272195483414870313808743773282134515459101721548181010409900511434648512065471783222140928000000000000, 18818846337859987063125250589794267670112845200158627410217366715345437821662151515443054759656067072000000000, 12403257016066523884985705407282205692587531571021429715163535373661739954712323938156718409472000000, -5358260562387730184396375024847338881045229800751153102619210816000, 1],
+    -2395: [228616418180049074709350282557829527885362837375879477212616034738822310171430724225083180010438656000000000000, 21274735684631007862638382597263174117333575432683625805805781354781238286904462329865767485440000000000000, 3487049671727184329540591965156127615783919350615727001357138505200483179043721297494705963008000000000, 6088145313009796962427744822933219947827777458744347698214244962467053425656202465902592000000000, 185032440987219672604651625573413611382963075139010145974439130990248550962647325999104000000, -39791635998335145997527055893989556255304536770761603345857366763042514216681472000000, 133360434735208138089733757820276320569763794415147284017898042088860692774912000, 5900052012888604049004973273330975332187234459947124292673159168000, 1],
+    -2419: [-314194214386379898806580397540675612605513580292483042393954362095827278800515491814903686257542094321972913266631901184, 299256045780870182245708482435056848123358443573608156863607397619039854145509819221058448877633374779882751158910976, -1937472185132603372385350601086937234232301749730905636322087766142074289054570948988503046018579772758405677056, 16496024369010396397534135205240293336694461582204651425355202956238838370828496634989625840136809193930752, -22319918758694661128993153155111449465069490473275421887408975683999183311765759093339554837774204928, 8838986644680457974994367912407673123394933696256640998832779166759159683311364572046952497152, -542594573785434538267097853079861041822869416584462036669647426916796479572017152, 12722520234155695340444885429373169449342627695533484393997242400768, 1],
+    -2443: [1091141467717850568672979128010507742016030650424992197403128062629904384000000000000000000000, -1303075637569920638823636626357675640545850735224562636245543475075002400768000000000000000, 2830628238191940143635407775581195163394092966209234143724725659872427769856000000000000, -35392782910988048306790135198049515274150075469203806953714502351930261504000000000, 117601856069354919757831592900055106746498198166118083406444614561824768000000, 27329963093974614764335693952290587215038951361905284668516892672000, 1],
+    -2451: [-4760211488944401636955878152547067630114193329987735449856366133978610812433496605042859940246610959401821823629721564212264462974976, 2282004664186276055103399964008606471999515064221059430191605588118151299479064045444584023756254938867792690696688322679675027456, 1163421081166468839179064417372054479588360940565514021470041714921998542593382577875462473413969885898221173360571969118928896, -62030206832686440126220402493657052744272687330865361455783015755541161411380248016779917120894821008757649881171866157056, 1206162554347534712055603320654516266095273207127827878453452784757316915302438597135936996829020481422476846536065024, 23068811455694279738226442460363360701355835452121728081388741451813107277676715651220633707875225567232, 1155100784243526637003872250125796587728178505619250793032728669787782175601366729890988032, 35234240048945856199743020456691589345410815114528684509614735065088, 1],
+    -2467: [3499654580083513480780442535270906288244245817187967851041301566205480840454601703424000000000000000000000, -218482602063875680231687751041101729826219255439957614269374584996832163538912935936000000000000000000, 34138055642822050993969699125166307824813691951911035039100037773951293368957927424000000000000000, 238528745089758540048406771469424906444240253141860505676549741440515769959972864000000000000, 1346232118527750102324672552680470759598861276724468920118554211262755835478016000000000, 349913759717781640009553198134863073363570193781559525466801009407819776000000, 58489485549827269251653457931226945926008898906244602774295126016000, 1],
+    -2515: [4542025682001712314257239669798903836427850081974322640019291191483010335933953132317007413248000000000, -784644786861482921129467981036881479240730298368490326394432485672646287230039000718979891200000000, 34524264893265272380279321615950864937352546831170702124352655476891149091055251354550272000000, 35508022560279525502093915946881957463667854787274639048203126213271422670327303372800000, 12817452553049467040241755058889739973324654809101647659200465239853072411262976000, 264952534336082861130132854408232794590765653659767680784931099443200, 1],
+    -2563: [102129587663985724287806992489561567577846558863500706855006254743420928000000000000000000, 58864774134339111721427554723408681524548474869863918839124022121201664000000000000000, 274597348065990355539342208212141816548455550122244719825808530813747200000000000000, 45746741444785974725001917837507456131544792405121928160749594381123584000000000, 2274186539352606939662866985000267388597468055648246852970041520947200000000, 1183114456005657497289765152791754822505422898489194494502849581056000, 1],
+    -2587: [66736639466811464486316409211308571080194967611443915406908782127986639896576000000000000000000000000, -54442265883475106765390048942726869236814789244408193629587557789619162447872000000000000000000000, 9865114381921760244056372681154858507519972229288562374312003274710940909568000000000000000000, 7628559835192390873908577700659214627987654432446757572146396454875480195072000000000000000, 2268363442853398159616332893340107720195299265667683407887256419214756413440000000000000, 8849540488014262193082570337941167593099661991915229358330188298113253376000000000, -6085928857069049365337750400177161843048680118970540092114938047234048000000, 2486989942934826375315932161474036024382329866851220006583098433536000, 1],
+    -2611: [1267190080011558249306954319775563369076412717376567619970524325704810905397382904600998793392127573141591069856511295488, -4318659117989107458781452977153748766802574545307888190668851551904116166611533823438546101561997522118909583282929664, 10015138824440559773461469863520185108615885298718619382178631368933079327251317932410772292017579963465681921376256, -2090628219425683945718389585035343275042269941492169572855949745750126667299999164390204819969457408413980950528, 365683968820256812607652768500018049338770188755076883113164008359539651217449388381557971287322807561617408, 40140910161893968804559952319021529042417580813518843970866600150516263160697693651722687301550080, 282669548830199342100998738488921841069290120815275026807551839938311136982631186432, 5209884698349228558037974557708340212707727669564789775363960620974080, 1],
+    -2632: [53820732377877338148316943692651569819153474902347740128879965869894547499800384306371138820186231913054208000000000000000000000000000, -36098023394114637436303306545736328277088938130810913604684366758762456072470482871859544638778985138989563904000000000000000000000, -1760492392388778065071233205185563223990357154860891352332466793585091656922573887309695343383101884580495360000000000000000000, 3842417232610001534693566987841681575858761059551486031920045659123627407918831739293754701283732406711615488000000000000000, 956195387965773050147636135153278804904017397786080921386196041102905188781864882898815422816708595089170432000000000000, -9873395305753088718613001054008056995708079465869897421124339080536957127460539622532758566670869303029760000000000, 988425231479083864224965006969741386094856862472165666799770884364687956750804523585983866768099072000000, -9922685244115451547818924178705378299025706797775657545773063137344000, 1],
+    -2667: [132853645189106925590651674244422952619136322653264600262900146813791586870089913950433053769728000000000000000000000000000, -36915998305913348080516190524465710759024533172587953334344019233154504159946981161531085636501504000000000000000000000, -50672055143637586604261550419961185826970305499365656255306387862085743383958351676925646250967040000000000000000000, 16031882193096882659048592543592625723375959971750567032165592717889757577561592855392850192367616000000000000000, 867799740256509731744043409909017837755668812216542626087679411895750921380022161819032514199552000000000000, 103065289038289033950058830825973135115666391151873677337373599890516350914213195925080680431616000000000, 8857824947997827921656062347224625691626615963181851796308491888581505195222682837188608000000, 28873226649132904235936949268937601124588504994427408999245168050176000, 1],
+    -2683: [401582160082250340418163965666567927009157113311106944233010240700809216000000000000000000, -302940399280383744660448145173115256445404252345773292018673267122565545984000000000000, 332217934831843316166822577187571931306604468831007814954178159155441827840000000000, -239604677226145548257568705238807644964803277307165530139680701834854400000000, 46939054890138039541090570578284916766453800683280728875816043274240000, 1],
+    -2707: [344679577759157623410052688683047786263673857136776402640790931244718124187157794914304000000000000000000000000, 2263108422446549614904503158803251283557837382503587318851149509467007723366390989586432000000000000000000, 1553459658945527108673745399258547941749413502031092951444662400699623057250523639971840000000000000000, 1289019821999213611240033363624395444533643590543012552285552427832398827374069678080000000000000, 18573411615864569013390282240349149185865143360604525964754566944255160714820321280000000000, -597448741247585908022756193255787911076007742625524167613264269596296216576000000, 97032338859143352337572722352757096906871457834580061186819637411840000, 1],
+    -2715: [457992466514370401773976555377631547994834840944162175059940599417674247438957041907116509940121109138552475756716202504598061056000000000000, 193973150930763702952768368946962948577132075091072905398381715517973919685906339224171360643550515665944279719545222957577011200000000000, 116353283630664257956336007259255383486748720052527892186732828891887869347253771018202333571003595866197131584506456233213952000000000, 2085665162499582476060144383984191086495142125310601233830441218919727661146139260970314640105482393583369990058820816076800000000, -262424108946631502975221961073434112998793530315896982425496258918808673102614441920124898130853333218445162971136000000, 10168481381418671848398686488583460535598204088650951988764368156572948870870788530984240850111880914534400000, 61514471165383002759676115958129819734650496205915473722605622949029982739250346370350972928000, 123518773600274895445895334798358510556324806539319013676721095214694400, 1],
+    -2755: [29337028460725238204645944620552999306908548616246029279937886373377190000212972315108374432710656000000000000, 11611058265581699601005176930523733131745596277763670932694382544142282885473137041478657144520704000000000000, 3233088730923734679340576917470263237807045359375755009403099064984281604641604137287865606340608000000000, 231364823053982306837362960050053192282121293513521056984287826162974913102373222137357926400000000000, 7552252618133178954499034484805048203090503181406609174588372192928106112834753239139221504000000, -51824271900003957877105405891933146097485719054095285233737613748126556684714778820608000000, 86340983162829461578532005070353653044059291445937458331686057563344398577473421312000, 410690029169042864116576927553320643969807364252042619871510569230336000, 1],
+    -2787: [15884985100445268357953590178542974707070315641086015871581915377130411370815316912360128512000000000000000000000, -5235644766151628118258097105317029735516395462631368018318018234267002950529128519059000786944000000000000000, 784947499401654518044866033516003257154294406573276984526494194216920292229127924374648651776000000000000, -49440523129472948316992499986015196039816359049791059405468009768469693387316640185053085696000000000, 1090494707028478138412734767068970391852526831578865754532271533947768540600626516003389440000000, 1067130840769367449760459178094245062365277165359712626201706039537664000, 1],
+    -2788: [-95033528128325823466692300216342476916164510511021961424473553690443577307008152935948043561083806416896000000000000000000000000, 2580313639244323216567765502410660048357072940711904615726812223970348255506498659617279951444806324977664000000000000000000000, -2445586198163749201664648734137280358048815940800896869381776663766427547940189563573618049071594186211328000000000000000000, 1007779386783615980887092344562982854987566845018023123785745887911944061683281038999225316789335707353088000000000000000, -118506965758290048488998038336744984084645683656606142588761581564193214241454163816244295525711044648960000000000000, 24661416777126829042727344814927026742011754909126771846307003311736018275555136823715896158780435984384000000000, -1152678081838915209636370046929334032897793935169661561827818139280312347114772111363565804392830339328000000, -1099356858301586342655228334060278223640823240379764725424646968295872000, 1],
+    -2827: [1142902694166254015132760281525989350142483372752252752880122673516373189995510983810875392000000000000000000000000, -637671705266425882857672503375223170342401707332890412250696989269482434527854094605877248000000000000000000000, -28221784736158451293466692467367265058005113476965532758757541491228530357662679373447168000000000000000000, 51925139710443212698210788080112446470350724697557916980818897977712965349938962989318144000000000000000, 7335878227865280731656653701204067962954398472260666730708611419741488908286224559505408000000000000, 1861128749133601316010340871533914531412548367669650901971345775971974168564666990592000000000, -145306591298512610681325452946855343576145910082131589019316355759966821285888000000, 3493520759918244098016953009273004520746211344353624559576644034330624000, 1],
+    -2923: [-107647076004054618899149885041577023508926704841725337605266619477543174918897664000000000000000000, 774363313119818364121689883356346187869427427850739895784313136065600552976777216000000000000000, -66955496044443649365534208670381393264833976438822919881785746085233630904320000000000000000, 1505139645470342989281445816047836400962568733755304379307218827715771646345216000000000, -86792263080787259059639314792679999399343245671650982657822521515082514432000000, 58170379961665933240578203738471180381102882882017892163204624801890304000, 1],
+    -2947: [1823046542509512347074622140405229478402786701625600080374731837413972894037076992986185728000000000000000000000000000, 237819702408901774823392025680542403746122528219782093160770409141734975865362123780370989056000000000000000000000, 32995203827203443524392217671459913138035066690472042803655165815638861820489578644810760192000000000000000000, 103940107979046137960481865323712897085595046003779827265033143129250956085774411852939264000000000000000, 90361381469771317689891291235179048727871953390250128329094022754544088865816786763776000000000000, -42223248731920646665358126020220243779462983332871470345180994525218068503145218048000000000, 4444201883771603308885564596191548426812105572664273460429198981352318715297792000000, 116657940220351621885787823318695896864056416228423819999236238980718592000, 1],
+    -2968: [2409826590352270725428367041942118560420119833085177642681185523736862334970542288754879152549120657243966947087523774464000000000000000000000000, -5249686142219647641666395344633757746600995350999824913913889754157605363068399553413219697971920705706630690765094780928000000000000000000000, 7247236508030807855232821812136162668735241970251165993781216253090370930658565214152392824993065936154084242334388584448000000000000000000, -14560555093340727980451956414353157069386700999155940253792384164982636909102821878157400131489742146447920088605261824000000000000000, -74746635693113342445529283149756496736168556502003182613946513311433805294328194313315363125887330807133633364336640000000000000, -130055176529374289825498482339674839020267113508102921106028422873808306400744780534617702839257655450588236443648000000000, 3129776498013494163163435976303188377202118345986464310758665706092081193792081956748971967843452920612608000000, -213964743132773346609134375855339942007069520484176454243133315522606144000, 1],
+    -2995: [130586054255350151678923728510835519043092543367050494770499219207725717783205622438150620861455636268259429318656000000000000, 19741714183768626420408508463185580917291330366960270184671818109013398612604530682220079383229541606322339840000000000000, 62261160619733084653510543652069947321464025901570867907390134159681572651693808383569651618614934566137233408000000000, 2536085998246704017092327420180722480102040828976549141405492478675250876265297659983506591063273637937152000000000, 860643789562852392049733722498668232423613162100836239809079916628868666914669702265015434417316722376704000000, -33399522499983363473971763499921939456212993541268985162786320072223592895161971327444075937792000000, 399173066342897596847949966472129734002535372580643163421705385082112044454557895360512000, 465232073298926046304225798218910717565066583254291706189245421239943168000, 1],
+    -3003: [1377263853693084600215383132423722327397671021914993399381416614857821048183498500569700268751672781570048000000000000000000000000, -625376114214867902250849965839324449416244977864382810879089659371558032399741658797073928389920190489427968000000000000000000000, 2225214729065000257723654645506038413360354075135086749072291492328299687695596146894555306324971384907759616000000000000000000, 833304306321092399016207413264544745358891270629143885534683416413893475974729669097784933023253316360994816000000000000000, 1604563654219134087033087675084882302615975016471617398123402918789546763985395516131188644446989717602304000000000000, 234896614409226179624726487351512419453852351589271836222981059077395474833475675831113765130235543552000000000, 4895176121652486261709084714790613048483923883076797473133331031904884465981241967245111853056000000, 585229542533205298665355464336826322130880811197264965481319342589566976000, 1],
+    -3019: [622047461587413298161548636573531185738690845550394170295565691992595379257851854241219408182001695544640113693204355743744, -757614391524337402409614645214277576299589227521578719829430476520292532682210719592997684657436648847726552211464912896, 305799635549831190843175900757345380648261282152593597521541608640056125806183774951701910668754722631611706480001024, 122779473231763519648748207149916984334159119429913739274596367608930161941313181060698322489719660711348535296, 896889192568676775514635086184280854840555819187817132392867987804516963786691115873999343641284925456384, -1473933984311586836673998147802708390487020489391310689302768262818796427946096616550694912, 925213569218842324975806320818474220467121184735126399994457869036782256128, 1],
+    -3067: [1404507834833446832519359673125489178654217150167401835466223390328391576059904000000000000000000000, -21848503302288317851731390235282389103158029030396771984431728403075265942519808000000000000000000, 149027186605187248140332763655032262724656423739546724749173398095138059538399232000000000000000, -14649802852741316060711558633510465274929607931930497366082102455568645283119104000000000000, 1575323877003449036503420385357812672032350894340881381101860032998666754064384000000000, -4613785005899746814690174444317768318247646717654372146543156055195776974848000000, 3629504764658524180704682861179672547442126722055194089901389822912540672000, 1],
+    -3172: [1593283483121446720100837232085064662754824668081852433800348635620302479432485021994820414721145221041881088000000000000000000000000000000, 5991296423235621803931409662615035838867404710405975907951816249274654472756501749021057049353276080370298650624000000000000000000000000, 4945406172808025917857530579422055178534854186256662327600184807022582296814352165070249032113417205769666259058688000000000000000000, 2384987314688587787808800036229798372957191447114511808911633353533280478665045911040485183221257989908029954064384000000000000000, 338090920032052057671373154668445513857489623238529543370095509064545747581123357339055591513879191964054060032000000000000000, 14540983725995791601616826238441964442165749537734256661100771757339947486607284192885486359975753383178238029824000000000, -18346824492946514670331778735047570849676160334125041329746253765616250436338248263546372201084668672663456000000000, -69562300741158972481090680508061271606599392341019492891569702854303799744000, 1],
+    -3187: [1655771837192722032567623764098761852391372751861720347250870383269561915987823138177024000000000000000000000, -124918370162549725981109218913471978181809392330663266906654027208195231267837427318784000000000000000000, 16275235324821730991251150008406264025417197350022023286169957486662438517427847299072000000000000000, -668285409013007957252809147339662421804558217395183942573983259602744748987587231744000000000000, 10689811563642182118101960378358904670259263187458737400529013794193579003921563648000000000, -308970705143522686995872571784845434038031989962694717221152088791972277387264000000, 105644949815511308988973459081280798550071485169563498024506612412335882240000, 1],
+    -3235: [647998277128630934905528494533858173315158835269437613982221212986212106082648824126535419035648000000000, -3837772190384174353594620064753582227990053693883014374622919081037929178581133263075623200358400000000, 7192263040462510544812655375963615437295581516389952397571806265542850848275388815305030500352000000, -1387819075502669327057862632006931040282860109225026692976122845038485462488175454823278182400000, 1324523129645399278888833215516503732914293300357951568024517203698141584020004078947926016000, 399683563549932602597361857267169263305032254313922171606427519774243079782400, 1],
+    -3243: [-14834724404405512847694283144338129219275508074718546174846780482805437966998680182934067546209436827648000000000000000000000000, 7146557968681287810485081008847225267861633707180909202170042347320515346881939585747838615301289672704000000000000000000000, 8233836920641619823628803986821938427442905370864190141207308949809102942917044697859821489581396590592000000000000000000, -512055870004333513726756793211141260621392498875592850978278138509162329880455776983355941010217631744000000000000000, 11801138569440364597342140114622745285676726908895367556062433785994510677866551951973248932289445888000000000000, 1994107500305611603266178252501549682004558792709976139338588136154404043536671568361757248516521984000000000, 39519636212040166089720856327690167751699909338636733912268897141188536310211879465817637977587712000000, 498436346036322839633642839462114014146970786108405296943057908957646913536000, 1],
+    -3315: [3601802626117445535276730832145429563648913809759207253585220996497133501662497744409688165581458343830432977755962821420574048256000000000000, -33147525949796438308462887512069581286792960056257195998585644787486670296334313407590040524740121507605621097589637032194762342400000000000, 20961106740004705822533526688072720518325893692218391558535154086108278908525168787837630348597218632395943744306188088793628672000000000, 678312555766110842319417556532462609332191784978014942772874412889060723073332691522655881270813694286897020487000113178214400000000, 3716918372442936184065162790663640807912859650656682372305084807004605114768816135612961002855130331687970363910425411584000000, 2828702418822930996843294479449790080429812426435197241123477933288815261779253574240513467420299273711169815393075200000, 550187428007058813261490027465650045611186810862946741937417177114433103677712309469300241851857502208000, 3592386012824550205005570866713309998317588478583087492891275210303260619571200, 1],
+    -3355: [-25592698231514291929667926212762349831478424558056327866061603283253778706430762156826319584000592992566555705344000000000000, 27171033749250147771376434124542828782059732307154329700579041279120269062931784180899272663925212695601610752000000000000, -9584321815212127915638444289723819796802234454313594186106413974012689776849328959360487686568611937666465792000000000, 1505239249491725864529989313016209598688937500541548023075737907525079092153210174001392824797134980120576000000000, -796151670506579725983005584325533126091197100523409235020845767007811930066764865063617537105614340096000000, 983349879632928387388395146120868106996510726278355537604973210802058773352026704653339905228800000000, 68152377197336095115379712749860884881743675584076672598701794795284480664089042103893491712000, 10663526190057199772194272567471432751981553986262234088701069322374823002112000, 1],
+    -3403: [-45272234210654937613901783738697767633671878692384144076183449167255640625484136448000000000000000000000000000, 233138564863074475221859582571811937458041242584704943012733158684953965598431802032128000000000000000000000, -101317122188995834493256160857455309685170707319412441626960755462601667066703481143296000000000000000000, 8485901066969456775038290353505281039563769455549512150286343942952736960110707867648000000000000000, 546270276089543909978046079808359955056508267733061594926370971968254783435422302208000000000000, 68975336680534724280715445875629472052576680887549694834010210363802687131250327552000000000, 59004419336092819328436390206106579423844429268709035236056022421596976361504768000000, 39013903951887084523808312921162289854426160928453790444784080579002682351616000, 1],
+    -3427: [41005049699615501580262746280591286724756293222611387574463862065355396705771585536000000000000000000000, -75742987193074954549516480887286693177380356034217005450634894194742904001009115201536000000000000000, 15729279929560852321792658248308207792829351873300854574540839722606924653615078440960000000000000, 24743287106170989536231277513205873274644847426761693088916137772188765436824109711360000000000, 1126968954187818624768028444963457171002127403385825530682138868009572090880458752000000, 74368468899753921102357820012319793706917067678323056124160605255662601560064000, 1],
+    -3448: [11482451221507395491833220451168060173167204898064908145618221586717739863882610405130444223657690451722918158401536000000000000000000000000000000, 17176124467297333787032080674360695752497949112877972257659940115902994374560585404973464317798702518964931917554647040000000000000000000000000, 27618609276351300427561068804853391836105221034982628941187041346438592479458702245884460964234458295247127636106535763968000000000000000000, 12272911164227241379106538006358138325772349354689940702630866353646081795405717083306835683626585111191016944142364442624000000000000000, 3154072375191309047732682946089010610947461288345768618737421205226264088955703920831953375419973807440533701594227957760000000000000, -519413105043292826314512321283135781175289932275466077424565569123709563413167447668387327540037686610142172636082176000000000, 1491420362002516927766990504477729176887744470725916408473110477195057674846362024050479469431858547353853823338240000000, -130536925223177235765638170111515997221699735693119864973420188844095238794304000, 1],
+    -3507: [39994459867166719586219709299115913904459003162398935179751030191931502204617088800811497535722229305973848479316836352000000000000000000000000, -5502361292985846135574918452999812154685951020035995646787870458582529307493694957091459779363907873307504430186233856000000000000000000000, 1318923986452679661698998391798889014589954433542617207255664863489610838990154546588231408124156161697782843490435072000000000000000000, 506641875784856351094716852601013405757725755961683119072956251564329223281150779743110742411874423011074508488441856000000000000000, 350414251658794651175602932788786151428671905867188913348825551224480746579981161761625303636893668858580432846848000000000000, 187776107743833454992801970553442815972491415248357878834756063319580653677253445977000212230001743716316872704000000000, 538304338721399513757089603690268590746794730718881395145361954112285245278002303086366507461647532032000000, 628450259900649003897312742976582999686349561909785313119030951600244269449216000, 1],
+    -3523: [1891122806049482188514552149287232310600359993422396227441476042054348032916807401603072000000000000000000, -82247488923287229531150741683142374034907128262139951708980106393835613220752324558848000000000000000, 5739878937845904634249975613339469092974656114656775376299207901959336739709260922880000000000000, -7929778412247870929152470621542619172819940330426296120077327115372385244914122752000000000, 1621093261406839476332521774666989768745148046837678486248143688372406996141342720000000, 960227856952599117407403083978278960265716403943018363363655618844711779688448000, 1],
+    -3595: [17494991106170574706492587921877938123271587411277497578094770274704699104509147680690533570869966979681222656000000000000, -11280918659327229016870778552424815245795421119715508318765538346940999079398258981315645917216109100007424000000000000, -2562913762520736893152363523444611942552982337167732063442534734279671718107720227056828445643327942950912000000000, 868997717407668770853303883165197862534949230756656956287297313257835552705569050669293490097581195264000000000, 608822339744235599620314549395564867141535447881363186555052904720705307240603618939219663822178484224000000, -16233518656228779118031037914998890647857291834602657532099430527910658848924911246464502103801856000000, 146843577106446612250612754082364564242688652382745069087733568025672511912505503050228178092032000, 6393114207568709819379183261394328902924776914213033387470272602995510448087040000, 1],
+    -3763: [-1972044695749344957264022034691792181442667611569357966380899673824002276790894592000000000000000000, 296707598836632495128918950900013013281013148621603981745478288082254158584872960000000000000000, -14491398267845174510353623140065250272686146261309430483935764832447043772694396928000000000000, 18175400898403039692661146938837767165517241925034331232150383316519417685213184000000000000, -5305475799937132710035993540311397319391357209546080621122948378132112502801039360000000, 495841562983804298889512601912220400193253241353593591180400260580212099305840640000, 1],
+    -3787: [1045994035642660482321758624456725378170466994428767220914993845528958854387670254053078245782373531648000000000000000000000000, 41592690553214056181264762017192898049403150994357872928664713352880531318860003584775748492122390528000000000000000000000, 56087210804816358508389001378799176556561362842783413894220422903581192968581537603177821091036921856000000000000000000, 1173845387778258780104960515277986285163406132030137132433003411730436998764867348290280284856778752000000000000000, 6857460001967067751674770445197338695102669291514183771250307301133711114752668351131623750631424000000000000, -3748006894295884750240066454904447948730411893676020951319439225399169119554288904755344310272000000000, 904403522885245992363293259256300682690090325952299052715691132536656618700467217645961216000000, 915837789894948201641356770244991822509089084799676770051033611581373538174083072000, 1],
+    -3883: [242520174922580222539290870794805352824249448826759902664113935595914486114615932475212325205659518913939593232384000000000000000000000000, 107561686413900719175228720792810391969632467785700995238969584490228296773176349573120271926262278687551423250432000000000000000000000, 13220770829610592890608501984516387953046735747668248861737539541848468204851534872450775945000511419335175045120000000000000000000, 6980575619458461989970277007119360000170119851573089918225373628436904054497150784997796873347858076826337280000000000000000, 1221252697595801096969656957948355938638555867733212419605755995768439421197308466513130388594100038270976000000000000, 20446054090768330214643760979953803492090754041141314012914911326270962921771510465801331222853451776000000000, -6506579673369744104516637070082306061689090790053799595019022943411646321938560740587732992000000, 10456091368918749626573610672710378843344945032846386741270556953811418084881334272000, 1],
+    -3907: [1774394015035061148977455899589961337381762775139239824952046882927235058659086163951445082112000000000000000000000000, -400549405567815660608111127094176173234591777559744191269190216501210521750158426829976865079296000000000000000000, 53167553592855880296456403199273248983283677673695213927182453054602454633352958548833067859968000000000000000, 379899551564780991035928273599939820342919617266987216892022171060410012913458169873736663040000000000000, 61294031341895173278102753533017920383134590654218624506860855913013583422505929897769172992000000000, -1418213997913268512302509148449639383476450821562100141731857116691784375206626247835648000000, 19129692117366609853350211252138054247693613821622994858454622645185758091181453312000, 1],
+    -3963: [39516114010267560204228981160659338091099019751247307678588697089331534797342678723265320908323824418757808226304000000000000000000000000, -3279712457882344817358342006792798086964275266886952036522497352709857128499222656677420124936436340358287196160000000000000000000000, 980659743115864136405357137141127642309010890803654561923830995128881710963655392047172692916313584430368765771776000000000000000000, 326957848981478781486747889981239770411318317687803025272133290403065093089764062243529475243923629655834692157440000000000000000, 40829349415958764282906987699243483394005152200935935215433053261998692829486864422189229105381540779580333228032000000000000, -183892735605063623570567137784478895125983864664054444871266428249408292397171856988109734333272708407413964800000000000, 3318592206814472894270685604009669386306911636715355744357066219585922231003925969658146340076870283099635712000000, 77752688844661474215810883444131433325530592590856690221691349230599569533326417920000, 1],
+    -4123: [2974886508012018621852016182396792740485590593485130207144693631997268790497656666084820920616091648000000000000000000000000, 13568980246975703147965783093879123313949120037639439303679061240327262851918566246654559376256270336000000000000000000000, -17952707134067968933122369758977449848493940057829197646447172211978095845047892257622065424394878976000000000000000000, 10543605219989332901233086535165520133595288588401871518029250894658899546250563862447262367788040192000000000000000, 181488196335412495525724941370738711512553360482133424455361698723079929939575787527639112450310144000000000000, -1786448269188516533168170326761153131955492668508662344999419593437460509430303764434487254974464000000000, 13266508070169975496052773076898458384257884638173252123063073591500631297941187370032786571264000000, 4049599396182624920763832895350994113894151856638280728211018127186884793491906158592000, 1],
+    -4195: [20838463204807496526796483070478617200630269970928751385752247633843775891637027614785459778065566354823981333396538130910150656000000000000, 1145779134491270733522506843632963063935038315309071880426471458179164215581361729741272426274584699983745582243907155001344000000000000, 22483236155429132885460774696609185550290831263898991640124476448372040124258982106270707789120698197549848224338655838208000000000, 169687590872188340111123011778310469607718208594814837939977783497228207965561985550968628682116328382816287478251520000000000, 481193369395688616794606010746661431235574674880650675438062834179507555543738687323742489923497281741439216123904000000, 126785236885665064616923209295459616981782728347397029247441952898130160734306868963379905973555840157745152000000, 11037105924261083677297812512777846779024266156855777601939659183927430496355779993847199270129958387712000, 23390850261411775428242833273506422581368646626811806326461820375932358205662521122816000, 1],
+    -4267: [74451556878858357930341858472239287995027739531008324162404728337741523963708631534956761744073136772481024000000000000000000000000, -72401902046575413874676914009090025416746715032283898847664322774282651865773542888310926779680763565572096000000000000000000000, 18666525502907083773773369603872208149829678057836603517983157224813671531392415065483591886377876730150912000000000000000000, 109982946609666544190741452225176208939237415889959851147259019047288537400343014119759999568531557449728000000000000000, 2373420198806203108729622584981089993681680866475340403596106758052547780248097410121026092285296640000000000000, 2076487033965971123287650701427363261603110988785404728353447993139298318602830180137228969181184000000000, -32065291388412329510792278111684947399910942510183603909999869467509120790824526611048562688000000, 133097975550897513114435362322399792779122613008920019625172341017386913697137225371648000, 1],
+    -4323: [1035829790873885945486905714737650611320078040535736114331807188004497031063333217579801192301098116101464016496886733078528000000000000000000000000, 12272752368655226310963738851122409579619096297530506399492982080408614457413664105802203438666300514506459991316476159066112000000000000000000000, -3251117954142100911218422838036814936508492646948371379190528966209144594355384861606908428930901550925566357271449616515072000000000000000000, 263786544523912198450588588612543890773791955784110812507649203224701666494167153509974313020537635823464303761157802426368000000000000000, -6472571281926255721517197837071955238525446402710676972909678823281546154769807520253765426666602342765143031124211007488000000000000, 58118238187283403640500691923755775909702589993170989719891822505411394260928557065446577544907907884031169408991756288000000000, 406876299713041485968750863585791510823365800650201488770554560824616833092302953116551931792884377500947509673984000000, 509444402615947340498217015199348761426012105739352186197913157704804243056566695669760000, 1],
+    -4387: [-4816107447579563529151622472662641095166827699925676081511663556459193652827398237887348204687529065257480749056000000000000000000000000, 480880911462440394528950879815238219742234394062217911879029893489446230510609319756848348331197629099695308537856000000000000000000000, -14040582569049560240418209121833860582678655103397380073271710702613524711691854358172126937597177911204170956800000000000000000000, 6457262378374207543540875047969270157969980852614428934634346208852185526793591324008111651860839491685534662656000000000000000, 46545364993902786342030348445207942198967296659326598578736471469666407564991874243261593169437493219725148160000000000000, 154283534806011725936156800125982226421021135696896977918200665646000979755952772003377654521005530473824256000000000, -8450981165457667158345138432193195357705743963422755848352196365930125550526653336688936689336320000000, 2337184581573509321482465911659190260226033700944019446013244189724105588321509730656256000, 1],
+    -4603: [999567928035776896764144012463371736014036734555029285186020719392683616343049453450285517477911724032000000000000000000000, 3155613267791228848705589768383992569774810222768919421508739940552702842062255889719477042312669822976000000000000000000, 4984087660967334907848563141201064351260702400532225684215712042118065707096825587933128071173973737472000000000000000, 33057363741934828049848873043552478038955317661845619451011245355416676274483454363413951081554640896000000000000, 62465163248953933767089871281305645579927759330213313638887532014549719543799080995476844799066112000000000, -3260400817708198372051210801966046569994345521358237786422350291968839494771014454873396609024000000, 368702904515385196213321391123001604368218148072510990774525868804376967991599586642010112000, 1],
+    -4747: [-124571251126378025990773168006401840633423143256545377400823999301998556507578110239516116558145413709824000000000000000000000000000, 1030887770050274220578872935712983720081426976926333016885750223608278690544241072823052042054292085562933248000000000000000000000, -733936950022051142296738024757787662571701083840262731124448742820488039313340681191193787261721633083097088000000000000000000, 142190646457360555502233200654540164458700085574531322988273345648630788560295570472060130708636995000729600000000000000000, 69820736914301359556337525999742707731345041914432572299605638160505579060192157966237203627943852507136000000000000, 1244643937954479620702348721164361057752058677662757226824780842616027741600045147461164102653457727488000000000, 2943153159055964492674212650285347113219967257974799490262136667569837526632189896539838707924992000000, 10079790794212230798921466643648133276535197088103911681618034794555822192306449873313505280000, 1],
+    -4843: [8762014198501223170015488647293628564372275982487762690129006099444102333741011338327972891146597513421651968000000000000000000000000000000, 476716470364279144416069926777764897573289960500715626127858253975540897258109587674463305520517191836757959639040000000000000000000000000, 22200806373663297624278302396456297476685890203454120680865494966540474985873998412046258875927137838803353491266863104000000000000000000, 17724775930572006225623573449134424462737972102085418255713250580300762128993189223366359502557279602721991221248524288000000000000000, 40986301986646095913807388754459568732261751373942986408867037639750571373678358975973823980565235675091461809897472000000000000, 119556550876238954751569363981988762257543444403949238505856706000499402766110902252522993989846843876540963356672000000000, -5876765240384518437265255266056242671459452931553519860360507863593888078997464753155428645231275278336000000, 88965934243394416432479370250797253131848088325368717263407842102392783084030572536136269824000, 1],
+    -4867: [970081063012608130779398757483980894943616805133539540418175782082349483603929487438503510013902848000000000000000000000000, 977117188170650949808133940096830958494356625950381042921976896023721645678673972169552668752084992000000000000000000000, -907447934920671587250498385837283106357283958784748008226468346916278710523368479664427441722490880000000000000000000, 421813980262398384423357600030000075286738510787958704688278400111773395837071599831854419743342592000000000000000, -39371278703786617301194565227933671846343450220349419612620971552691117931396421318524017676648448000000000000, 909980792102855068832953332458107785985107731974705794130395872724946467959404312216445009264640000000000, 19985325035631977928663982014599482188137458558652846826427287231959597362676214896462716207104000000, 152826429147088159627803974564490662046444574788244058505454919807720098811732701585346174976000, 1],
+    -5083: [438849227599087925058659265838057861813405831494242357026256520023861973733881065559475876600933310263197696000000000000000000000000, -364386979550172034995177210501579843386556585303893582088682095322329171619195025500437224516169215357485056000000000000000000000, 65602208628790277986697856755454578952831192054199035811698087106640972971300013859554188159186440000897024000000000000000000, 4549016230263205175964600832518742345108647889820113927401189102246588191421179388611183909943872461996032000000000000000, -57933561300475574509843844136255718038265204079547686193360650418594419334208854177509398044839440809984000000000000, 171961189766795443231700798159702574723653555362708164069426224495570379789834359882374534272777191424000000000, 575878763640836965728328284001269532493485186702480696774959376072298725710632498364642297397641216000000, 18768604545646372556555360347639911058437540921922563485908446288876177064488390480437315715072000, 1],
+    -5107: [8527054577405938480196323194126799088882269261661976055065270057007428596293672006062571159289856000000000000000000000, -80102039318451991931960332550173340945366689906141736129909396058328273466591145681175253706866688000000000000000000, 1344762279601679567899573906683268527077265657932174997645110685371348630318467659770911329525694464000000000000000, -951325239335122490745901434319719149707620644090477565284446149153063119519996945671069312418316288000000000000, 564214717908986837275659514155325729097764699149824600190962081308008183362933811810601611017846784000000000, 8053258314914098654863093724116989813429301328763587768771460914247746992193732374121586689572864000000, 31827732015327881860796967385624471725179544763870463822461757923504674088942287024469248552960000, 1],
+    -5467: [-5143868255067531718174308996897799372986491173008697261357743533227261904901669588503533794708042184902579968802816000000000000000000000000000000, 3368271912756607973631400055851845445573069808508741764875432897955087613635182981864318151194064962764364407436738560000000000000000000000000, -2231595527464747861660293799119198780038114488942338306751079213386793224596005300821809158524022642739837311739632812032000000000000000000, 1211676356269790171402027531928123641205565547900053952183035626625524208123094232124686088092822578786964005268184104960000000000000000, -1075029136104426915497988144167621227304887749688473645225635709499522660012085852143526072188051764298528557140803584000000000000, 29065104496422008665364592757547141785388532609622746407341758841830207233952923619239671619915417219916178925813760000000000, 19606466602123343890842232781078379572658768444243246288360516206630497478205035205515975480373782472239874048000000, 76005887299932002216382994305208898808664314900963961100473621255916153985429945007555871465594880000, 1],
+    -5587: [1385911335855796894984074869988077634418678365791959234743326990373407511410925164718767887987533303488107688703217071292416000000000000000000000000, 12515008378980555613193707474740920755231606883260644295422033130501567644728640749464374861586440394008318181489813412118528000000000000000000000, -711889779073333652216207109000430343282367578031179599743614959007296946717348971152995653132464304752694679391170696577024000000000000000000, 16346548852289146495704150329583052195979502509484003351182834878916151519068813935499190819577848707129209951813418090496000000000000000, 248737776115460932354069629560065783224691443891710780670888285544170165129750088595214394320944504479184019580256256000000000000, 3075063542315438410862662874251109267923778668552027336798277112936226053902770511988108336560658879545163644928000000000, -3360658797623162337649606903593339160883791471487403508967789423297021559268403818939692562195282265112576000000, 959397974860003243867789159978962110403062384649400242966690874413324959158397673990449326100791296000, 1],
+    -5707: [30954269538635083476976680852208871783924792802240363774052041930775350635251010103992855411698272080756736000000000000000000000000, -85975013535011670946830242069419505568217967740552669210441532320228773691870033874817980827744525489274880000000000000000000000, 81275511652747910495606983288433972222846475700496056279552470973855921104762237888219646736369696492224512000000000000000000, -20257413103828890099384220384764340685855149946885193215114607835057001892620660919814891078236576373800960000000000000000, 5772922951063272846643687019293050555540042287509822079587285845101187838274777544785512545039436335808512000000000000, -1497761170047447227471018406511941893805362842235553909974098746246716408188273617401872773039243625758720000000000, 999870504579001898346353026834915647737877286572758384809797646658244724049007841804596705657824489766912000000, 11786558169328428673328769534653819860883267483364491148742877602782698614483464151061835482995138560000, 1],
+    -5923: [828296234587947681647731323356552289509842797369624081590012417954132251797327293083196734397367475689750528000000000000000000000, -2014825342931772718454576881432417885973020606127095672755501283191722235622589219369577199647865018760822784000000000000000000, 2134964950885694227084310997499879235435502023772591139394118820906415407575928428550597289622169469690314752000000000000000, -232137218522248428704558664801149536142609340306106059680532016660575896442925734422261470199074177457061888000000000000, 114160402540513182606915542140612817244362014492543454606127219807903690487227942911225400470491434011590656000000000, -59550186177406865656374742920562786209855745884123917550432584794071490116285089405717931037911171465216000000, 1008807425352411827957611931120396568392385794983197138710542565650915200785461322664285456684004847616000, 1],
+    -5947: [51286967578071867180282242094460113872763443945823400451627933304264969127706525326789107653815982174298529940348338176000000000000000000000000, -37060865515549246445951531852765762961449337931620237496270383871372013163527228485832979276173231073182682030337425408000000000000000000000, -12167650273957216024336214200516494654230727996894368834515238995679215600566364279598524139678251299706440038423199744000000000000000000, 613650178382575106554181689768171398010113973626843134325111728610811031639406462141628121844441473988072773196447744000000000000000, 7646177963474206753331455033249832717039854144936168967561745575122483601908710674227875663918768648432157691568193536000000000000, 22214741305017918279591302917751845360895855338888061754745159296280343290165981661607253070090374430936944368156672000000000, 10172622476658941778850680271823189401344450263384672278179725398675487270590607391580366233932261607440646144000000, 1645625291402024952597440474316323880354141172815236158636572088144436500791478818821854850513692975104000, 1],
+    -6307: [-946060473629579631302997276791878050756536704603830007202449314695682031741656429438041818091286908098621276487458557308046409728000000000000000000000000, 10708380705308995484268167405909648710961226090785457263314348575777070305259588839277994653958236216536434985398502563389611442176000000000000000000000, 150719803407936789685190331220037438080690748080781022605885429749540839292979348926321800279482146131285263670785074343605960704000000000000000000, 3480535178754631257050349797051971951994100795102534631671700140634461406559554490941211694892619432039361351087401874852151296000000000000000, -13869409179928010886577361143848604286421747391385974835910312202588247752233102708661063238439451877671482173148133173755904000000000000, 9626377107355470957569597502459284842051270987688513892962070732123237553326546188690970471857746587746868695726630633472000000000, 6812845064504076959956767430063924929567470337773391328261100931931939097995575014793292125349648876432713729693450240000000, 2260281072235910786548935440488896666818113830292937055017171689785045605057527218148882195926234558087168000, 1],
+}
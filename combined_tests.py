@@ -0,0 +1,49 @@
+import random
+from math import gcd
+from gmpy2 import powmod, jacobi
+
+TEST_NAMES = ("fermat", "solovay_strassen", "miller_rabin")
+
+def combined_probable_prime_tests(n, k):
+    """
+    Fermat, Solovay-Strassen and Miller-Rabin on the same k random bases.
+    With n - 1 = 2^s * t, each base costs one chain a^t, a^2t, ..., a^(n-1):
+    a^(n-1) gives the Fermat verdict, a^((n-1)/2) the Euler-Jacobi one, and the
+    whole chain the strong one. Returns (fermat, solovay_strassen, miller_rabin).
+    """
+    if n <= 3:
+        return (n >= 2,) * 3
+    if n % 2 == 0:
+        return (False,) * 3
+
+    s = ((n - 1) & -(n - 1)).bit_length() - 1
+    t = (n - 1) >> s
+    fermat = solovay_strassen = miller_rabin = True
+
+    for _ in range(k):
+        a = random.randint(2, n - 2)
+        if gcd(a, n) > 1:
+            # Solovay-Strassen and Miller-Rabin reject this base, Fermat draws a coprime one
+            solovay_strassen = miller_rabin = False
+            if not fermat:
+                break
+            while gcd(a, n) > 1:
+                a = random.randint(2, n - 2)
+            fermat = powmod(a, n - 1, n) == 1
+            continue
+
+        # chain[i] = a^(t * 2^i), so chain[s - 1] = a^((n-1)/2) and chain[s] = a^(n-1)
+        chain = [powmod(a, t, n)]
+        for _ in range(s):
+            chain.append(powmod(chain[-1], 2, n))
+
+        if miller_rabin and chain[0] != 1 and (n - 1) not in chain[:s]:
+            miller_rabin = False
+        if solovay_strassen and chain[s - 1] != jacobi(a, n) % n:
+            solovay_strassen = False
+        if fermat and chain[s] != 1:
+            fermat = False
+        if not (fermat or solovay_strassen or miller_rabin):
+            break
+
+    return fermat, solovay_strassen, miller_rabin
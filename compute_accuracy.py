@@ -1,8 +1,17 @@
+import argparse
 import math
 import random
 import csv
+import time
+import numpy as np
 from gmpy2 import powmod, jacobi
 from math import gcd
+from batch_primality import batch_is_probable_prime
+from bpsw import bpsw_test
+from numberset import is_numberset, load_numberset
+from prime_bitmap import default_bitmap, is_prime
+from combined_tests import combined_probable_prime_tests, TEST_NAMES
+from verdict_cache import VerdictCache, method_key
 
 # Fermat Primality Test
 def fermat_primality_test(n, k):
@@ -77,8 +86,10 @@ def solovay_strassen_test(n, k):
             return False
     return True
 
-# Read numbers from CSV file
+# Read numbers from CSV file, or memory-map them from a number set (see numberset.py)
 def read_from_lists(file_path):
+    if is_numberset(file_path):
+        return load_numberset(file_path)
     with open(file_path, mode='r') as file:
         reader = csv.reader(file)
         numbers = []
@@ -89,27 +100,67 @@ def read_from_lists(file_path):
     return numbers
 
 
-# Compute Accuracy, Precision, Recall, Error Rate, and Confusion Matrix
-def compute_accuracy(algorithm, primes, composites, k):
+# Whether the prime bitmap answers for every one of the numbers
+def bitmap_covers(numbers):
+    bitmap = default_bitmap()
+    return bitmap is not None and (not len(numbers) or int(np.max(numbers)) < bitmap.limit)
+
+
+# Ground truth: the prime bitmap when it covers the numbers, the deterministic tests otherwise
+def true_primality(numbers):
+    if bitmap_covers(numbers):
+        return default_bitmap().are_prime(numbers)
+    return np.array([is_prime(int(n)) for n in numbers], dtype=bool)
+
+
+# Numbers filed in the wrong list, as (wrongly listed primes, wrongly listed composites)
+def mislabelled(primes, composites):
+    not_prime = [int(p) for p, prime in zip(primes, true_primality(primes)) if not prime]
+    not_composite = [int(c) for c, prime in zip(composites, true_primality(composites)) if prime]
+    return not_prime, not_composite
+
+
+# Verdicts of test on every number, computing only those the cache has no verdict of method for.
+# Numbers are passed on as Python ints, since those of a memory-mapped number set are numpy.uint64
+def cached_verdicts(numbers, method, test, cache=None):
+    if cache is None:
+        return [test(int(n)) for n in numbers]
+    found = cache.get_many(numbers, method)
+    fresh = {}
+    for n in numbers:
+        if int(n) not in found and int(n) not in fresh:
+            start = time.perf_counter()
+            result = test(int(n))
+            verdict = [bool(r) for r in result] if isinstance(result, tuple) else bool(result)
+            fresh[int(n)] = (verdict, time.perf_counter() - start)
+    if fresh:
+        cache.put_many([(n, verdict, seconds, None) for n, (verdict, seconds) in fresh.items()], method)
+    return [found[int(n)].verdict if int(n) in found else fresh[int(n)][0] for n in numbers]
+
+
+# Compute Accuracy, Precision, Recall, Error Rate, and Confusion Matrix. With a cache, the
+# numbers already tested under the same method (default: the function name and k) are not
+# tested again. Only pass one for deterministic tests such as BPSW: cached verdicts of a
+# randomized test would replay its first bases instead of measuring its error rate.
+def compute_accuracy(algorithm, primes, composites, k, cache=None, method=None):
     TP = TN = FP = FN = 0
     false_positives = []
+    method = method or method_key(algorithm.__name__, k)
 
     # Test primes
-    for p in primes:
-        result = algorithm(p, k)
+    for p, result in zip(primes, cached_verdicts(primes, method, lambda n: algorithm(n, k), cache)):
         if result:  # Predict prime
             TP += 1
         else:       # Predict composite
             FN += 1
 
     # Test composites
-    for c in composites:
-        result = algorithm(c, k)
+    for c, result in zip(composites, cached_verdicts(composites, method, lambda n: algorithm(n, k), cache)):
         if not result:  # Predict composite
             TN += 1
         else:           # Predict prime
             FP += 1
-            false_positives.append(c)
+            false_positives.append(int(c))
 
     # Calculate metrics
     total = TP + TN + FP + FN  # Total numbers tested
@@ -121,47 +172,98 @@ def compute_accuracy(algorithm, primes, composites, k):
     return accuracy, precision, recall, error_rate, TP, FP, TN, FN, false_positives
 
 
+def accuracy_metrics(TP, FP, TN, FN, false_positives):
+    """The tuple returned by compute_accuracy, from the confusion matrix."""
+    total = TP + TN + FP + FN
+    accuracy = (TP + TN) / total if total > 0 else 0
+    precision = TP / (TP + FP) if (TP + FP) > 0 else 0
+    recall = TP / (TP + FN) if (TP + FN) > 0 else 0
+    error_rate = (FP + FN) / total if total > 0 else 0
+
+    return accuracy, precision, recall, error_rate, TP, FP, TN, FN, false_positives
+
+
+# Same metrics as compute_accuracy, but every list is tested in one batch call
+def compute_batch_accuracy(method, primes, composites, k):
+    # As integer arrays, lists of 63-bit numbers go through the vectorised kernels
+    prime_verdicts = batch_is_probable_prime(np.asarray(primes), method=method, k=k, chunk_size=1 << 16)
+    composite_verdicts = batch_is_probable_prime(np.asarray(composites), method=method, k=k, chunk_size=1 << 16)
+
+    TP = int(prime_verdicts.sum())
+    FN = len(primes) - TP
+    FP = int(composite_verdicts.sum())
+    TN = len(composites) - FP
+    false_positives = [int(c) for c, verdict in zip(composites, composite_verdicts) if verdict]
+
+    return accuracy_metrics(TP, FP, TN, FN, false_positives)
+
+
+# Fermat, Solovay-Strassen and Miller-Rabin in one pass, on identical bases
+def compute_combined_accuracy(primes, composites, k):
+    TP = dict.fromkeys(TEST_NAMES, 0)
+    FP = dict.fromkeys(TEST_NAMES, 0)
+    false_positives = {name: [] for name in TEST_NAMES}
+    test = lambda n: combined_probable_prime_tests(n, k)
+
+    for p, results in zip(primes, cached_verdicts(primes, None, test)):
+        for name, result in zip(TEST_NAMES, results):
+            TP[name] += result
+
+    for c, results in zip(composites, cached_verdicts(composites, None, test)):
+        for name, result in zip(TEST_NAMES, results):
+            if result:
+                FP[name] += 1
+                false_positives[name].append(int(c))
+
+    return {name: accuracy_metrics(TP[name], FP[name], len(composites) - FP[name], len(primes) - TP[name],
+                                   false_positives[name])
+            for name in TEST_NAMES}
+
+
+def print_results(title, results):
+    accuracy, precision, recall, error_rate, TP, FP, TN, FN, false_positives = results
+    print(f"\n{title} Results:")
+    print(f"Accuracy: {accuracy:.5f}, Precision: {precision:.2f}, Recall: {recall:.2f}, Error Rate: {error_rate:.2f}")
+    print(f"TP: {TP}, FP: {FP}, TN: {TN}, FN: {FN}")
+    print("\nFalse Positives (Composites incorrectly identified as primes):")
+    print(false_positives)
+
+
 def main():
-    # Paths to CSV files
-    primes_file = 'primes.csv'
-    composites_file = 'composites_with_carmichaels.csv'
+    parser = argparse.ArgumentParser(description="Accuracy of the probabilistic primality tests.")
+    parser.add_argument("primes_file", nargs="?", default="primes.csv", help="CSV file or number set of primes")
+    parser.add_argument("composites_file", nargs="?", default="composites_with_carmichaels.csv",
+                        help="CSV file or number set of composites")
+    parser.add_argument("--check-labels", action="store_true",
+                        help="check the lists even where the prime bitmap does not cover them, which is slow")
+    args = parser.parse_args()
+    primes_file, composites_file = args.primes_file, args.composites_file
 
-    # Read numbers from the CSV files
+    # Read numbers from the files
     primes = read_from_lists(primes_file)
     composites = read_from_lists(composites_file)
 
     # Number of iterations for probabilistic tests
     k = 40
 
-    # Test Fermat Primality Test
-    fermat_accuracy, fermat_precision, fermat_recall, fermat_error_rate, TP, FP, TN, FN, false_positives = compute_accuracy(
-        fermat_primality_test, primes, composites, k
-    )
-    print("\nFermat Primality Test Results:")
-    print(f"Accuracy: {fermat_accuracy:.5f}, Precision: {fermat_precision:.2f}, Recall: {fermat_recall:.2f}, Error Rate: {fermat_error_rate:.2f}")
-    print(f"TP: {TP}, FP: {FP}, TN: {TN}, FN: {FN}")
-    print("\nFalse Positives (Composites incorrectly identified as primes):")
-    print(false_positives)
+    # Without the bitmap, checking the labels costs about as much as the measurements themselves
+    if args.check_labels or (bitmap_covers(primes) and bitmap_covers(composites)):
+        not_prime, not_composite = mislabelled(primes, composites)
+        if not_prime or not_composite:
+            print(f"Warning: listed as primes but composite: {not_prime}")
+            print(f"Warning: listed as composites but prime: {not_composite}")
 
-    # Test Miller-Rabin Primality Test
-    mr_accuracy, mr_precision, mr_recall, mr_error_rate, TP, FP, TN, FN, false_positives = compute_accuracy(
-        miller_rabin_test, primes, composites, k
-    )
-    print("\nMiller-Rabin Primality Test Results:")
-    print(f"Accuracy: {mr_accuracy:.5f}, Precision: {mr_precision:.2f}, Recall: {mr_recall:.2f}, Error Rate: {mr_error_rate:.2f}")
-    print(f"TP: {TP}, FP: {FP}, TN: {TN}, FN: {FN}")
-    print("\nFalse Positives (Composites incorrectly identified as primes):")
-    print(false_positives)
+    # Fermat, Miller-Rabin and Solovay-Strassen share their bases and exponentiations,
+    # drawn afresh on every run
+    combined = compute_combined_accuracy(primes, composites, k)
+    print_results("Fermat Primality Test", combined["fermat"])
+    print_results("Miller-Rabin Primality Test", combined["miller_rabin"])
+    print_results("Solovay-Strassen Primality Test", combined["solovay_strassen"])
 
-    # Test Solovay-Strassen Primality Test
-    ss_accuracy, ss_precision, ss_recall, ss_error_rate, TP, FP, TN, FN, false_positives = compute_accuracy(
-        solovay_strassen_test, primes, composites, k
-    )
-    print("\nSolovay-Strassen Primality Test Results:")
-    print(f"Accuracy: {ss_accuracy:.5f}, Precision: {ss_precision:.2f}, Recall: {ss_recall:.2f}, Error Rate: {ss_error_rate:.2f}")
-    print(f"TP: {TP}, FP: {FP}, TN: {TN}, FN: {FN}")
-    print("\nFalse Positives (Composites incorrectly identified as primes):")
-    print(false_positives)
+    # Test Baillie-PSW Primality Test (k is ignored). It is deterministic, so verdicts from
+    # earlier runs are reused and only new numbers are tested
+    print_results("Baillie-PSW Primality Test",
+                  compute_accuracy(bpsw_test, primes, composites, k, VerdictCache(), "bpsw"))
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,124 @@
+from math import gcd
+from gmpy2 import mpz
+
+class JacobianPoint:
+    """
+    Point (X : Y : Z) on y^2 = x^3 + a*x + b in Jacobian coordinates, i.e. the affine
+    point (X / Z^2, Y / Z^3). Z = 0 is the point at infinity. No inversions are needed.
+    """
+    __slots__ = ("X", "Y", "Z")
+
+    def __init__(self, X, Y, Z=1):
+        self.X = mpz(X)
+        self.Y = mpz(Y)
+        self.Z = mpz(Z)
+
+    @classmethod
+    def from_affine(cls, P):
+        """Convert an affine (x, y) tuple, None being the point at infinity."""
+        if P is None:
+            return INFINITY
+        return cls(P[0], P[1], 1)
+
+    def is_infinity(self, n):
+        return self.Z % n == 0
+
+    def negate(self, n):
+        return JacobianPoint(self.X, -self.Y % n, self.Z)
+
+INFINITY = JacobianPoint(1, 1, 0)
+
+def to_affine(P, n):
+    """Back to an affine (x, y) tuple with a single inversion; None if Z is not invertible mod n."""
+    if gcd(P.Z, n) != 1:
+        return None
+    z_inv = pow(int(P.Z), -1, n)
+    z_inv2 = z_inv * z_inv % n
+    return int(P.X * z_inv2 % n), int(P.Y * z_inv2 * z_inv % n)
+
+def jacobian_double(P, n, a):
+    """2P, in 4 multiplications and 6 squarings."""
+    if P.Z % n == 0 or P.Y % n == 0:
+        return INFINITY
+    XX = P.X * P.X % n
+    YY = P.Y * P.Y % n
+    ZZ = P.Z * P.Z % n
+    S = 4 * P.X * YY % n
+    M = (3 * XX + a * ZZ * ZZ) % n
+    X3 = (M * M - 2 * S) % n
+    Y3 = (M * (S - X3) - 8 * YY * YY) % n
+    Z3 = 2 * P.Y * P.Z % n
+    return JacobianPoint(X3, Y3, Z3)
+
+def jacobian_add(P, Q, n, a):
+    """P + Q, falling back to doubling when P = Q."""
+    if P.Z % n == 0:
+        return Q
+    if Q.Z % n == 0:
+        return P
+    Z1Z1 = P.Z * P.Z % n
+    Z2Z2 = Q.Z * Q.Z % n
+    U1 = P.X * Z2Z2 % n
+    U2 = Q.X * Z1Z1 % n
+    S1 = P.Y * Q.Z * Z2Z2 % n
+    S2 = Q.Y * P.Z * Z1Z1 % n
+    H = (U2 - U1) % n
+    R = (S2 - S1) % n
+    if H == 0:
+        return jacobian_double(P, n, a) if R == 0 else INFINITY
+    HH = H * H % n
+    HHH = H * HH % n
+    V = U1 * HH % n
+    X3 = (R * R - HHH - 2 * V) % n
+    Y3 = (R * (V - X3) - S1 * HHH) % n
+    Z3 = P.Z * Q.Z * H % n
+    return JacobianPoint(X3, Y3, Z3)
+
+def wnaf(k, w):
+    """Width-w non-adjacent form of k, least significant digit first."""
+    digits = []
+    while k > 0:
+        if k & 1:
+            d = k & ((1 << w) - 1)
+            if d >= 1 << (w - 1):
+                d -= 1 << w
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+def wnaf_multiplication(k, P, n, a, w=4):
+    """k * P with a width-w NAF and the precomputed odd multiples P, 3P, ..., (2^(w-1) - 1)P."""
+    P2 = jacobian_double(P, n, a)
+    odd_multiples = [P]
+    for _ in range((1 << (w - 2)) - 1):
+        odd_multiples.append(jacobian_add(odd_multiples[-1], P2, n, a))
+
+    R = INFINITY
+    for d in reversed(wnaf(k, w)):
+        R = jacobian_double(R, n, a)
+        if d > 0:
+            R = jacobian_add(R, odd_multiples[d >> 1], n, a)
+        elif d < 0:
+            R = jacobian_add(R, odd_multiples[-d >> 1].negate(n), n, a)
+    return R
+
+def montgomery_ladder(k, P, n, a):
+    """k * P with the Montgomery ladder: one addition and one doubling for every bit."""
+    R0, R1 = INFINITY, P
+    for bit in bin(k)[2:]:
+        if bit == '1':
+            R0, R1 = jacobian_add(R0, R1, n, a), jacobian_double(R1, n, a)
+        else:
+            R0, R1 = jacobian_double(R0, n, a), jacobian_add(R0, R1, n, a)
+    return R0
+
+def jacobian_scalar_multiplication(k, P, n, a, method="wnaf"):
+    """k * P for a JacobianPoint P, with method "wnaf" or "ladder"."""
+    if k == 0:
+        return INFINITY
+    if method == "ladder":
+        return montgomery_ladder(k, P, n, a)
+    return wnaf_multiplication(k, P, n, a)
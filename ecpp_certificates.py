@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from math import gcd
+from ecpp_cm import SMALL_PROVEN_BOUND, is_proven_small_prime
+from perfect_power import integer_root
+from testEC import ecpp_cm_chain, validate_point_multiplication
+
+# One Atkin-Goldwasser-Kilian step: the curve y^2 = x^3 + a*x + b over Z/nZ, a multiple
+# m = k * q of the order of P = (x, y), and the prime q it reduces n to
+CertificateStep = namedtuple("CertificateStep", ["n", "a", "b", "m", "q", "x", "y"])
+Certificate = namedtuple("Certificate", ["n", "steps"])
+
+DEFAULT_CACHE_DIR = "certificate_cache"
+
+def verify_step(step):
+    """Check one step: if q is prime, the curve and point prove that n is prime."""
+    n, a, b, m, q, x, y = step
+    if n < 2 or gcd(n, 6) != 1:
+        return False
+    if gcd(4 * a ** 3 + 27 * b ** 2, n) != 1:
+        return False  # singular curve
+    if (y * y - x ** 3 - a * x - b) % n != 0:
+        return False  # P is not on the curve
+    if m % q != 0 or q <= (integer_root(n, 4)[0] + 2) ** 2:
+        return False
+    return validate_point_multiplication((x, y), m // q, q, n, a)
+
+def verify_certificate(certificate, processes=1):
+    """
+    Verify an ECPP certificate: the chain must link n to a q below SMALL_PROVEN_BOUND,
+    and every step must hold. With processes > 1 the steps are checked in parallel.
+    """
+    n, steps = certificate
+    chain = [n] + [step.q for step in steps]
+    for step, expected_n in zip(steps, chain):
+        if step.n != expected_n:
+            return False
+    if chain[-1] >= SMALL_PROVEN_BOUND or not is_proven_small_prime(chain[-1]):
+        return False
+
+    if processes > 1 and len(steps) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            return all(executor.map(verify_step, steps))
+    return all(verify_step(step) for step in steps)
+
+def certificate_to_json(certificate):
+    """Compact serialisation, with every number written in hexadecimal."""
+    n, steps = certificate
+    return json.dumps({"n": hex(n), "steps": [[hex(v) for v in step] for step in steps]},
+                      separators=(",", ":"))
+
+def certificate_from_json(text):
+    data = json.loads(text)
+    steps = [CertificateStep(*(int(v, 16) for v in step)) for step in data["steps"]]
+    return Certificate(int(data["n"], 16), steps)
+
+def _cache_path(n, cache_dir):
+    # Short numbers name their own file, huge ones go by a hash
+    key = format(n, "x")
+    if len(key) > 64:
+        key = hashlib.sha256(key.encode()).hexdigest()
+    return os.path.join(cache_dir, key + ".json")
+
+def load_cached_certificate(n, cache_dir=DEFAULT_CACHE_DIR):
+    """Return the cached certificate for n, or None if there is none."""
+    try:
+        with open(_cache_path(n, cache_dir)) as file:
+            certificate = certificate_from_json(file.read())
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return certificate if certificate.n == n else None
+
+def save_certificate(certificate, cache_dir=DEFAULT_CACHE_DIR):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _cache_path(certificate.n, cache_dir)
+    # Write then rename, so concurrent readers never see half a file
+    with open(path + ".tmp", "w") as file:
+        file.write(certificate_to_json(certificate))
+    os.replace(path + ".tmp", path)
+
+def ecpp_prove(n, max_attempts=10, cache_dir=None, processes=None, progress=None, verdict_cache=None):
+    """
+    Return a verified ECPP certificate for n, or None if n could not be proven prime.
+    With a cache_dir, a cached certificate is verified and reused instead of re-proving;
+    a verdict_cache.VerdictCache is used the same way, and also records the proof's cost.
+    processes and progress are passed on to the descent (see testEC.ecpp_cm_chain).
+    """
+    if cache_dir is not None:
+        certificate = load_cached_certificate(n, cache_dir)
+        if certificate is not None and verify_certificate(certificate):
+            return certificate
+    if verdict_cache is not None:
+        entry = verdict_cache.get(n, "ecpp")
+        if entry is not None and entry.certificate is not None:
+            certificate = certificate_from_json(entry.certificate)
+            if certificate.n == n and verify_certificate(certificate):
+                return certificate
+
+    start = time.perf_counter()
+    chain = ecpp_cm_chain(n, max_attempts, processes, progress)
+    if chain is None:
+        return None
+    certificate = Certificate(n, [CertificateStep(*step) for step in chain])
+    if cache_dir is not None:
+        save_certificate(certificate, cache_dir)
+    if verdict_cache is not None:
+        verdict_cache.put(n, "ecpp", True, time.perf_counter() - start, certificate_to_json(certificate))
+    return certificate
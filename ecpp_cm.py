@@ -0,0 +1,161 @@
+import random
+from math import isqrt
+from gmpy2 import jacobi
+from bpsw import strong_probable_prime
+from class_polynomials import HILBERT_CLASS_POLYNOMIALS
+
+# Discriminants in order of increasing class number, so the cheapest root findings come first
+DISCRIMINANTS = sorted(HILBERT_CLASS_POLYNOMIALS, key=lambda D: (len(HILBERT_CLASS_POLYNOMIALS[D]), -D))
+
+# Below this bound the strong tests to the first 12 prime bases are a proof of primality
+SMALL_PROVEN_BOUND = 3317044064679887385961981
+SMALL_PROVEN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+def is_proven_small_prime(n):
+    """Deterministic primality test for n < SMALL_PROVEN_BOUND."""
+    if n < 2:
+        return False
+    for p in SMALL_PROVEN_BASES:
+        if n % p == 0:
+            return n == p
+    return all(strong_probable_prime(n, a) for a in SMALL_PROVEN_BASES)
+
+def sqrt_mod_prime(a, p):
+    """Tonelli-Shanks square root of a modulo an odd prime p, None if a is not a square."""
+    a %= p
+    if a == 0:
+        return 0
+    if jacobi(a, p) != 1:
+        return None
+    if p % 4 == 3:
+        r = pow(a, (p + 1) // 4, p)
+        return r if r * r % p == a else None
+
+    s = ((p - 1) & -(p - 1)).bit_length() - 1
+    q = (p - 1) >> s
+    z = 2
+    while jacobi(z, p) != -1:
+        z += 1
+    m, c, t, r = s, pow(z, q, p), pow(a, q, p), pow(a, (q + 1) // 2, p)
+    while t != 1:
+        i, t2 = 0, t
+        while t2 != 1:
+            t2 = t2 * t2 % p
+            i += 1
+            if i == m:
+                return None  # only possible if p is not prime
+        b = pow(c, 1 << (m - i - 1), p)
+        m, c, t, r = i, b * b % p, t * b * b % p, r * b % p
+    return r
+
+def cornacchia(D, p):
+    """Solve u^2 + |D| v^2 = 4p for a discriminant D < 0 (modified Cornacchia), or return None."""
+    x0 = sqrt_mod_prime(D % p, p)
+    if x0 is None:
+        return None
+    if (x0 - D) % 2:
+        x0 = p - x0
+    a, b = 2 * p, x0
+    limit = isqrt(4 * p)
+    while b > limit:
+        a, b = b, a % b
+    rest = 4 * p - b * b
+    if rest % -D:
+        return None
+    v = isqrt(rest // -D)
+    if v * v != rest // -D:
+        return None
+    return b, v
+
+def cm_group_orders(D, p, u, v):
+    """Possible orders of the curves with CM by discriminant D over F_p, given 4p = u^2 + |D| v^2."""
+    if D == -4:
+        traces = [u, -u, 2 * v, -2 * v]
+    elif D == -3:
+        traces = [u, -u, (u + 3 * v) // 2, -(u + 3 * v) // 2, (u - 3 * v) // 2, -(u - 3 * v) // 2]
+    else:
+        traces = [u, -u]
+    return [p + 1 - t for t in traces]
+
+# Polynomials modulo p, as coefficient lists from the constant term up
+
+def _trim(f):
+    while f and f[-1] == 0:
+        f.pop()
+    return f
+
+def _poly_sub(f, g, p):
+    size = max(len(f), len(g))
+    f, g = f + [0] * (size - len(f)), g + [0] * (size - len(g))
+    return _trim([(x - y) % p for x, y in zip(f, g)])
+
+def _poly_divmod(f, g, p):
+    f = f[:]
+    inv = pow(g[-1], -1, p)
+    quotient = [0] * max(len(f) - len(g) + 1, 0)
+    for i in range(len(f) - len(g), -1, -1):
+        c = f[i + len(g) - 1] * inv % p
+        quotient[i] = c
+        if c:
+            for j, gj in enumerate(g):
+                f[i + j] = (f[i + j] - c * gj) % p
+    return _trim(quotient), _trim(f[:len(g) - 1])
+
+def _poly_mulmod(f, g, m, p):
+    if not f or not g:
+        return []
+    product = [0] * (len(f) + len(g) - 1)
+    for i, x in enumerate(f):
+        for j, y in enumerate(g):
+            product[i + j] += x * y
+    return _poly_divmod([c % p for c in product], m, p)[1]
+
+def _poly_powmod(base, e, m, p):
+    result = [1]
+    for bit in bin(e)[2:]:
+        result = _poly_mulmod(result, result, m, p)
+        if bit == '1':
+            result = _poly_mulmod(result, base, m, p)
+    return result
+
+def _poly_gcd(f, g, p):
+    while g:
+        f, g = g, _poly_divmod(f, g, p)[1]
+    inv = pow(f[-1], -1, p)
+    return [c * inv % p for c in f]
+
+def poly_root_mod_prime(coeffs, p):
+    """One root of the polynomial modulo the prime p (Cantor-Zassenhaus), or None."""
+    f = _trim([c % p for c in coeffs])
+    if len(f) < 2:
+        return None
+    # g is the product of the linear factors of f
+    g = _poly_gcd(f, _poly_sub(_poly_powmod([0, 1], p, f, p), [0, 1], p), p)
+    if len(g) < 2:
+        return None
+    while len(g) > 2:
+        delta = random.randrange(p)
+        h = _poly_sub(_poly_powmod([delta, 1], (p - 1) // 2, g, p), [1], p)
+        if not h:
+            continue
+        d = _poly_gcd(g, h, p)
+        if 1 < len(d) < len(g):
+            g = d if 2 * len(d) <= len(g) + 1 else _poly_divmod(g, d, p)[0]
+    return -g[0] * pow(g[1], -1, p) % p
+
+def curve_twists(j, p):
+    """Yield the coefficients (a, b) of every twist of a curve with j-invariant j over F_p."""
+    g = 2
+    while jacobi(g, p) != -1 or (p % 3 == 1 and pow(g, (p - 1) // 3, p) == 1):
+        g += 1
+    if j == 0:
+        for i in range(6):
+            yield 0, pow(g, i, p)
+    elif j == 1728:
+        for i in range(4):
+            yield pow(g, i, p), 0
+    else:
+        k = j * pow(1728 - j, -1, p) % p
+        a, b = 3 * k % p, 2 * k % p
+        yield a, b
+        yield a * g * g % p, b * g * g * g % p
@@ -1,11 +1,8 @@
-import random
 import csv
-
-# Carmichael numbers
-carmichael_numbers = [
-    561, 1105, 1729, 2465, 2821, 6601, 8911, 10585, 15841, 29341,
-    41041, 46657, 52633, 62745, 63973, 75361, 101101, 115921
-]
+import sys
+from numberset import is_numberset, iter_number_chunks, load_numberset
+from pseudoprimes import iter_carmichael_numbers
+from stratified_sampler import stratified_sample, log_spaced_strata
 
 # Sampling distribution and target samples
 ranges = [
@@ -19,7 +16,9 @@ ranges = [
 ]
 
 def read_composites(file_path):
-    """Read composites from a CSV file."""
+    """Read composites from a CSV file, or memory-map them from a number set."""
+    if is_numberset(file_path):
+        return load_numberset(file_path)
     composites = []
     with open(file_path, mode='r') as file:
         reader = csv.reader(file)
@@ -28,31 +27,14 @@ def read_composites(file_path):
             composites.append(int(row[0]))
     return composites
 
-def sample_composites_with_carmichael(composites, carmichaels, ranges, total_samples):
-    """Sample composites proportionally, ensuring Carmichael numbers are included."""
-    sampled_composites = []
-    remaining_carmichaels = set(carmichaels)
-
-    for start, end, num_samples in ranges:
-        # Filter composites within the current range
-        range_composites = [x for x in composites if start <= x <= end]
-        # Ensure Carmichael numbers within this range are included
-        range_carmichaels = [x for x in remaining_carmichaels if start <= x <= end]
-        remaining_carmichaels -= set(range_carmichaels)
-
-        # Calculate how many more composites are needed after adding Carmichael numbers
-        additional_samples = num_samples - len(range_carmichaels)
-        if additional_samples < 0:
-            raise ValueError("Too many Carmichael numbers in range!")
-
-        # Sample remaining composites proportionally
-        sampled = random.sample(range_composites, additional_samples)
-        sampled_composites.extend(range_carmichaels + sampled)
-
-    # Ensure total matches the target
-    if len(sampled_composites) != total_samples:
+def sample_composites_with_carmichael(composites, carmichaels, ranges, total_samples, seed=None):
+    """
+    Sample composites range by range, ensuring Carmichael numbers are included.
+    composites is a sorted list, array or stream, read once (see stratified_sampler).
+    """
+    if sum(target for _, _, target in ranges) != total_samples:
         raise ValueError("Sampling error: total samples do not match target.")
-    return sampled_composites
+    return stratified_sample(composites, ranges, carmichaels, seed)
 
 def save_composites_to_csv(file_path, composites):
     """Save the list of composites to a CSV file."""
@@ -61,24 +43,39 @@ def save_composites_to_csv(file_path, composites):
         writer.writerows([[x] for x in composites])
 
 def main():
-    # File paths
-    input_file = "composites.csv"  # Path to the input composites file
-    output_file = "balanced_composites_with_carmichaels.csv"  # Path to the output file
-
-    # Read composites from the CSV
-    composites = read_composites(input_file)
-
-    # Target number of samples
-    num_samples = 78498
+    # Usage: python generate_balanced_composites.py [input] [output] [samples] [log-spaced bins] [seed]
+    input_file = sys.argv[1] if len(sys.argv) > 1 else "composites.csv"  # CSV or number set
+    output_file = sys.argv[2] if len(sys.argv) > 2 else "balanced_composites_with_carmichaels.csv"
+    num_samples = int(sys.argv[3]) if len(sys.argv) > 3 else 78498
+    bins = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    seed = int(sys.argv[5]) if len(sys.argv) > 5 else None
+
+    # Number sets are sampled in place, CSV files streamed once
+    if is_numberset(input_file):
+        composites = load_numberset(input_file)
+        largest = int(composites[-1]) if len(composites) else 0
+    else:
+        composites = (n for chunk, _ in iter_number_chunks(input_file) for n in chunk)
+        largest = ranges[-1][1]
+
+    if bins is None:
+        strata = ranges
+    else:
+        # Starting the bins at 1000 keeps the first ones populous enough to fill
+        strata = log_spaced_strata(num_samples, hi=largest, bins=bins, lo=1000)
+        if len(strata) != bins:
+            print(f"Warning: only {len(strata)} distinct bins below {largest}")
+    carmichaels = iter_carmichael_numbers(max(end for _, end, _ in strata))
 
     # Generate the balanced sample
-    balanced_composites = sample_composites_with_carmichael(composites, carmichael_numbers, ranges, num_samples)
+    balanced_composites = sample_composites_with_carmichael(composites, carmichaels, strata, num_samples, seed)
 
     # Save to CSV
     save_composites_to_csv(output_file, balanced_composites)
 
     print(f"Balanced composite list saved to {output_file}")
-    print(f"Total composites: {len(balanced_composites)} (includes {len(carmichael_numbers)} Carmichael numbers)")
+    print(f"Total composites: {len(balanced_composites)}")
 
 # Run the program
-main()
+if __name__ == "__main__":
+    main()
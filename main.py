@@ -1,8 +1,191 @@
+import argparse
+import ast
+import collections
+import importlib
+import json
+import operator
+import re
+import sys
 from Trial_division import compare_algorithms
 from sympy import sympify
 from math import gcd
+from benchmark import ALGORITHMS
+from measurement import BudgetedRun, run_with_budgets
+from verdict_cache import DEFAULT_CACHE_PATH, VerdictCache, method_key
+
+BATCH_DEFAULT_ALGORITHMS = ("miller_rabin", "bpsw", "ecpp")
+
+# Inputs come from files and pipes, so expressions are evaluated from their syntax tree
+# rather than by sympify, which evals them. Powers may not give numbers over MAX_INPUT_BITS.
+MAX_INPUT_BITS = 1 << 20
+
+_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+}
+
+def _evaluate(node):
+    if isinstance(node, ast.Expression):
+        return _evaluate(node.body)
+    if isinstance(node, ast.Constant) and type(node.value) is int:
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value = _evaluate(node.operand)
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+        base, exponent = _evaluate(node.left), _evaluate(node.right)
+        if exponent < 0:
+            raise ValueError("negative exponents do not give integers")
+        if exponent * max(abs(base).bit_length() - 1, 0) > MAX_INPUT_BITS:
+            raise ValueError(f"{base}^{exponent} has more than {MAX_INPUT_BITS} bits")
+        return base ** exponent
+    if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+        return _OPERATORS[type(node.op)](_evaluate(node.left), _evaluate(node.right))
+    raise ValueError(f"unsupported syntax {ast.unparse(node)!r}")
+
+def parse_number(text):
+    """
+    An integer greater than 1 from a decimal literal or an expression of integers with
+    + - * ** ^ and parentheses, such as 2^127-1, 10**50 + 447 or 1e5.
+    """
+    text = text.strip()
+    if text.isdigit():
+        n = int(text)
+    else:
+        # 1e5 is read as 1*10**5, so that large values stay exact
+        expression = re.sub(r"\b(\d+)[eE]\+?(\d+)\b", r"(\1*10**\2)", text.replace('^', '**'))
+        try:
+            tree = ast.parse(expression, mode="eval")
+        except SyntaxError:
+            raise ValueError(f"{text} is not an integer expression")
+        n = _evaluate(tree)
+    if n < 2:
+        raise ValueError(f"{text} is not an integer greater than 1")
+    return n
+
+def read_inputs(stream):
+    """Yield (line number, text) for every non-blank, non-comment line."""
+    for line_number, line in enumerate(stream, 1):
+        text = line.split('#', 1)[0].strip()
+        if text:
+            yield line_number, text
+
+def batch_method(algorithm, k):
+    """The verdict cache name of an algorithm run with k rounds."""
+    return method_key(algorithm, k if ALGORITHMS[algorithm][2] else None)
+
+def batch_tasks(inputs, algorithms, k, order, records, cache=None):
+    """
+    (key, function, args) for every valid input and algorithm. Every input read is
+    appended to order as (line number, records expected). The records of unparsable
+    inputs, and of the runs answered from the cache, go straight to records[line number].
+    """
+    functions = {name: getattr(importlib.import_module(ALGORITHMS[name][0]), ALGORITHMS[name][1])
+                 for name in algorithms}
+    for line_number, text in inputs:
+        records[line_number] = {}
+        try:
+            n = parse_number(text)
+        except Exception as e:
+            order.append((line_number, 1))
+            records[line_number][None] = {"line": line_number, "input": text, "status": "invalid input",
+                                          "detail": str(e)}
+            continue
+        order.append((line_number, len(algorithms)))
+        for name in algorithms:
+            key = (line_number, text, n, name)
+            entry = cache.get(n, batch_method(name, k)) if cache is not None else None
+            if entry is not None and (name != "combined" or isinstance(entry.verdict, list)):
+                seconds = entry.seconds if entry.method == batch_method(name, k) else None
+                run = BudgetedRun(key, "cached", entry.verdict, seconds, None, None)
+                records[line_number][name] = dict(batch_record(run, k), confidence=entry.confidence,
+                                                  cached_method=entry.method)
+                continue
+            args = (n, k) if ALGORITHMS[name][2] else (n,)
+            yield key, functions[name], args
+
+def batch_record(run, k):
+    """The JSON-ready dictionary reported for one finished or stopped run."""
+    line_number, text, n, algorithm = run.key
+    record = {"line": line_number, "input": text, "digits": len(str(n)), "algorithm": algorithm,
+              "k": k if ALGORITHMS[algorithm][2] else None, "status": run.status}
+    if run.status in ("ok", "cached"):
+        if algorithm == "combined":
+            record["verdict"] = dict(zip(("fermat", "solovay_strassen", "miller_rabin"), map(bool, run.result)))
+        else:
+            record["verdict"] = "prime" if run.result else "composite"
+    record["seconds"] = run.seconds
+    record["memory_mb"] = run.memory
+    if run.detail is not None:
+        record["detail"] = run.detail
+    return record
+
+def run_batch(stream, output, algorithms=BATCH_DEFAULT_ALGORITHMS, k=10, processes=None, time_budget=60,
+              memory_budget=2048, cache=None):
+    """
+    Test every number or expression read from stream with each algorithm, in a pool of
+    budgeted worker processes, writing one JSON line to output per result. Results are
+    written in input order, each input's in the order of algorithms, as soon as an input
+    and every input before it are complete.
+    With a verdict_cache.VerdictCache, runs it already holds are reported with status
+    "cached" and their stored cost, and new verdicts are added to it.
+    """
+    algorithms = list(dict.fromkeys(algorithms))
+    order = collections.deque()  # (line number, records expected) of the inputs not written yet
+    records = {}  # line number -> {algorithm, or None for an invalid input: record}
+
+    def write_completed():
+        while order and len(records[order[0][0]]) == order[0][1]:
+            line_number, _ = order.popleft()
+            finished = records.pop(line_number)
+            for slot in algorithms + [None]:
+                if slot in finished:
+                    output.write(json.dumps(finished[slot]) + "\n")
+        output.flush()
+
+    tasks = batch_tasks(read_inputs(stream), algorithms, k, order, records, cache)
+    for run in run_with_budgets(tasks, time_budget, memory_budget, processes):
+        line_number, _, n, algorithm = run.key
+        if run.status == "ok" and cache is not None:
+            verdict = [bool(r) for r in run.result] if algorithm == "combined" else bool(run.result)
+            cache.put(n, batch_method(algorithm, k), verdict, run.seconds)
+        records[line_number][algorithm] = batch_record(run, k)
+        write_completed()
+    write_completed()
+
+def batch_main(argv):
+    parser = argparse.ArgumentParser(description="Test numbers or expressions (one per line) and stream JSON lines.")
+    parser.add_argument("--batch", metavar="FILE", required=True, help="input file, or - for stdin")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS), default=list(BATCH_DEFAULT_ALGORITHMS))
+    parser.add_argument("--k", type=int, default=10, help="rounds of the probabilistic tests")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--time-budget", type=float, default=60, help="seconds allowed for each test")
+    parser.add_argument("--memory-budget", type=float, default=2048, help="MB allowed for each test")
+    parser.add_argument("--output", default="-", help="JSON lines file, or - for stdout")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="verdict cache file (default: %(default)s)")
+    parser.add_argument("--no-cache", action="store_true", help="test every number again, and store nothing")
+    parser.add_argument("--reuse-proven", action="store_true",
+                        help="answer any algorithm from a verdict proven by another one")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.batch == "-" else open(args.batch)
+    target = sys.stdout if args.output == "-" else open(args.output, "w")
+    cache = None if args.no_cache else VerdictCache(args.cache, reuse_proven=args.reuse_proven)
+    try:
+        run_batch(source, target, args.algorithms, args.k, args.processes, args.time_budget, args.memory_budget,
+                  cache)
+    finally:
+        if cache is not None:
+            cache.close()
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
 
 def main():
+    # Algorithms already run on a number report their verdict and cost from the cache
+    cache = VerdictCache()
     while True:
         try:
             print("\n=== Prime Number Testing ===")
@@ -67,7 +250,7 @@ def main():
 
             # Compare all algorithms, including ECPP
             try:
-                compare_algorithms(n, k, 1, 1, 22, 11)  # ECPP is now included in this call
+                compare_algorithms(n, k, 1, 1, 22, 11, cache=cache)  # ECPP is now included in this call
             except Exception as e:
                 print(f"Error during algorithm comparison: {e}")
 
@@ -85,4 +268,8 @@ def main():
             break
 
 if __name__ == "__main__":
-    main()
+    # python main.py --batch numbers.txt [--algorithms ...]; without arguments, the interactive menu
+    if len(sys.argv) > 1:
+        batch_main(sys.argv[1:])
+    else:
+        main()
@@ -0,0 +1,234 @@
+import multiprocessing
+import os
+import resource
+import statistics
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait as wait_futures
+from multiprocessing.connection import wait
+import psutil
+
+# Timing and memory are measured in separate passes: tracemalloc hooks every allocation,
+# which slows allocation-heavy code (the sympy AKS, big-int arithmetic) severalfold.
+
+RSS_SAMPLING_INTERVAL = 0.002
+
+def time_calls(func, *args, repetitions=1, warmup=0):
+    """Run func(*args) untraced; returns (last result, list of durations in nanoseconds)."""
+    for _ in range(warmup):
+        func(*args)
+    durations = []
+    result = None
+    for _ in range(repetitions):
+        start = time.perf_counter_ns()
+        result = func(*args)
+        durations.append(time.perf_counter_ns() - start)
+    return result, durations
+
+def traced_peak_memory(func, *args):
+    """Peak Python heap allocation of one call, in bytes, measured with tracemalloc."""
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    try:
+        result = func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    return result, max(peak - start, 0)
+
+class RSSSampler(threading.Thread):
+    """Background thread recording the highest resident set size of this process."""
+
+    def __init__(self, interval=RSS_SAMPLING_INTERVAL):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.process = psutil.Process()
+        self.peak = self.process.memory_info().rss
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.is_set():
+            self.peak = max(self.peak, self.process.memory_info().rss)
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        self.peak = max(self.peak, self.process.memory_info().rss)
+        return self.peak
+
+def _isolated_call(connection, func, args, interval):
+    baseline = psutil.Process().memory_info().rss
+    sampler = RSSSampler(interval)
+    sampler.start()
+    start = time.perf_counter_ns()
+    try:
+        result = func(*args)
+        error = None
+    except Exception as e:  # reported to the parent rather than lost with the process
+        result, error = None, repr(e)
+    elapsed = time.perf_counter_ns() - start
+    peak = sampler.stop()
+    # ru_maxrss (KiB on Linux) catches spikes shorter than the sampling interval
+    peak = max(peak, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024)
+    connection.send((result, error, elapsed, baseline, peak))
+    connection.close()
+
+def _start_isolated(func, args, interval):
+    """Start _isolated_call in a new process; returns (process, receiving end of its pipe)."""
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    try:
+        process = multiprocessing.Process(target=_isolated_call, args=(sender, func, args, interval))
+        process.start()
+    except BaseException:
+        receiver.close()
+        raise
+    finally:
+        # The child holds its own copy; the parent only reads
+        sender.close()
+    return process, receiver
+
+def _reap(process, receiver):
+    """Kill the process if it still runs, wait for it, and release both of its handles."""
+    try:
+        if process.is_alive():
+            process.kill()
+        process.join()
+        process.close()
+    finally:
+        receiver.close()
+
+def isolated_peak_rss(func, *args, interval=RSS_SAMPLING_INTERVAL, timeout=None):
+    """
+    Run func(*args) in a fresh process while a thread samples its RSS.
+    Returns (result, duration in ns, baseline RSS, peak RSS), in bytes; raises TimeoutError
+    if the call outlives timeout seconds and RuntimeError if it raised.
+    """
+    process, receiver = _start_isolated(func, args, interval)
+    try:
+        if not receiver.poll(timeout):
+            raise TimeoutError(f"{getattr(func, '__name__', func)} ran for more than {timeout} seconds")
+        result, error, elapsed, baseline, peak = receiver.recv()
+    except EOFError:
+        raise RuntimeError(f"{getattr(func, '__name__', func)} died in its measurement process")
+    finally:
+        _reap(process, receiver)
+    if error is not None:
+        raise RuntimeError(f"{getattr(func, '__name__', func)} raised {error}")
+    return result, elapsed, baseline, peak
+
+def measure(func, *args, repetitions=1, warmup=0, memory="traced"):
+    """
+    Time func(*args) over untraced repetitions, then measure its memory in a separate pass:
+    memory="traced" gives the tracemalloc peak, "rss" the peak RSS growth of an isolated
+    process, None skips it. Returns (result, median seconds, memory in MB or None).
+    """
+    result, durations = time_calls(func, *args, repetitions=repetitions, warmup=warmup)
+    seconds = statistics.median(durations) / 1e9
+
+    if memory == "traced":
+        peak = traced_peak_memory(func, *args)[1]
+    elif memory == "rss":
+        _, _, baseline, peak_rss = isolated_peak_rss(func, *args)
+        peak = peak_rss - baseline
+    elif memory is None:
+        return result, seconds, None
+    else:
+        raise ValueError(f"Unknown memory mode {memory!r}, expected 'traced', 'rss' or None")
+    return result, seconds, peak / (1024 * 1024)
+
+# Outcome of one budgeted call: status is "ok", "exceeded budget" or "error"; detail says
+# which budget was exceeded or what was raised. Times in seconds, memory in MB of RSS growth.
+BudgetedRun = namedtuple("BudgetedRun", ["key", "status", "result", "seconds", "memory", "detail"])
+
+def run_with_budgets(tasks, time_budget=None, memory_budget=None, processes=None, interval=0.01):
+    """
+    Run each (key, func, args) task in its own process, up to processes at a time, and yield
+    a BudgetedRun for each as soon as it finishes. A task running longer than time_budget
+    seconds, or whose RSS grows past memory_budget MB, is killed and reported as
+    "exceeded budget". Closing the generator kills whatever is still running.
+    """
+    # Tasks are pulled lazily, so they can come from an unbounded stream
+    tasks = iter(tasks)
+    next_task = next(tasks, None)
+    processes = processes or os.cpu_count() or 1
+    running = {}  # receiver -> (key, process, psutil handle, start time, RSS at start)
+
+    try:
+        while next_task is not None or running:
+            while next_task is not None and len(running) < processes:
+                key, func, args = next_task
+                next_task = next(tasks, None)
+                process, receiver = _start_isolated(func, args, RSS_SAMPLING_INTERVAL)
+                running[receiver] = (key, process, None, time.perf_counter(), 0)
+                try:
+                    handle = psutil.Process(process.pid)
+                    running[receiver] = (key, process, handle, time.perf_counter(), handle.memory_info().rss)
+                except psutil.NoSuchProcess:
+                    pass  # already done, nothing left to watch
+
+            for receiver in wait(list(running), timeout=interval):
+                key, process, _, _, _ = running.pop(receiver)
+                try:
+                    result, error, elapsed, baseline, peak = receiver.recv()
+                except EOFError:
+                    yield BudgetedRun(key, "error", None, None, None, "the worker process died")
+                else:
+                    memory = (peak - baseline) / (1024 * 1024)
+                    if error is None:
+                        yield BudgetedRun(key, "ok", result, elapsed / 1e9, memory, None)
+                    else:
+                        yield BudgetedRun(key, "error", None, elapsed / 1e9, memory, error)
+                finally:
+                    _reap(process, receiver)
+
+            now = time.perf_counter()
+            for receiver, (key, process, handle, start, baseline) in list(running.items()):
+                detail = None
+                if time_budget is not None and now - start > time_budget:
+                    detail = f"time, over {time_budget:g} s"
+                elif memory_budget is not None and handle is not None:
+                    try:
+                        if handle.memory_info().rss - baseline > memory_budget * 1024 * 1024:
+                            detail = f"memory, over {memory_budget:g} MB"
+                    except psutil.NoSuchProcess:
+                        pass  # finished; its result is picked up by the next wait
+                if detail is not None:
+                    del running[receiver]
+                    _reap(process, receiver)
+                    yield BudgetedRun(key, "exceeded budget", None, now - start, None, detail)
+    finally:
+        for receiver, (_, process, _, _, _) in running.items():
+            _reap(process, receiver)
+
+def completed_results(executor, fn, arg_tuples, in_flight):
+    """
+    Run fn(*args) for each args in the executor, keeping in_flight calls running, and
+    yield the non-empty results in completion order. Closing the generator cancels
+    every call that has not started yet.
+    """
+    arg_tuples = iter(arg_tuples)
+    pending = set()
+    try:
+        while True:
+            for args in arg_tuples:
+                pending.add(executor.submit(fn, *args))
+                if len(pending) >= in_flight:
+                    break
+            if not pending:
+                return
+            done, pending = wait_futures(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result:
+                    yield result
+    finally:
+        for future in pending:
+            future.cancel()
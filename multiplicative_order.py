@@ -0,0 +1,104 @@
+from math import gcd, log, ceil
+from sympy import factorint
+
+# Smallest-prime-factor table, grown on demand and shared by every caller
+_spf = [0, 1]
+
+def smallest_prime_factor_table(limit):
+    """Return a list spf with spf[m] the smallest prime factor of m, for m <= limit."""
+    global _spf
+    if limit < len(_spf):
+        return _spf
+    size = max(limit + 1, 2 * len(_spf))
+    spf = list(range(size))
+    for p in range(2, int(size ** 0.5) + 1):
+        if spf[p] == p:
+            for multiple in range(p * p, size, p):
+                if spf[multiple] == multiple:
+                    spf[multiple] = p
+    _spf = spf
+    return spf
+
+def factorize(m):
+    """Return the factorisation of m as a {prime: exponent} dict."""
+    if m > 1 << 22:
+        return factorint(m)
+    spf = smallest_prime_factor_table(m)
+    factors = {}
+    while m > 1:
+        p = spf[m]
+        factors[p] = factors.get(p, 0) + 1
+        m //= p
+    return factors
+
+def totient_factors(m, factors=None):
+    """Return the factorisation of φ(m), built from the factorisation of m."""
+    factors = factors or factorize(m)
+    result = {}
+    for p, e in factors.items():
+        if e > 1:
+            result[p] = result.get(p, 0) + e - 1
+        for q, f in factorize(p - 1).items():
+            result[q] = result.get(q, 0) + f
+    return result
+
+def euler_totient(r):
+    """
+    Computes Euler's Totient function φ(r).
+    """
+    result = r
+    for p in factorize(r):
+        result -= result // p
+    return result
+
+def _divisors(factors):
+    divisors = [1]
+    for p, e in factors.items():
+        divisors = [d * p ** i for d in divisors for i in range(e + 1)]
+    return sorted(divisors)
+
+def multiplicative_order(a, m, limit=None, group_order_factors=None):
+    """
+    Order of a modulo m, from the factorisation of φ(m) (or of group_order_factors,
+    the factorisation of any multiple of the order).
+    With a limit, returns None as soon as the order is known to exceed it.
+    """
+    if m == 1:
+        return 1
+    if gcd(a, m) != 1:
+        raise ValueError(f"{a} is not invertible modulo {m}")
+    factors = group_order_factors or totient_factors(m)
+
+    if limit is not None:
+        # The order is the smallest divisor d of φ(m) with a^d = 1
+        for d in _divisors(factors):
+            if d > limit:
+                return None
+            if pow(a, d, m) == 1:
+                return d
+        return None
+
+    order = 1
+    for p, e in factors.items():
+        order *= p ** e
+    for p, e in factors.items():
+        for _ in range(e):
+            if pow(a, order // p, m) != 1:
+                break
+            order //= p
+    return order
+
+def find_r(n):
+    """
+    Finds the smallest r such that the order of n modulo r is greater than log(n, 2)^2.
+    """
+    max_k = ceil(log(n, 2) ** 2)
+    for r in range(2, n):
+        if gcd(n, r) > 1:
+            return r  # n has no order modulo r
+        # ord_r(n) divides φ(r), so small φ(r) rules r out without any exponentiation
+        if euler_totient(r) <= max_k:
+            continue
+        if multiplicative_order(n % r, r, limit=max_k) is None:
+            return r
+    return n
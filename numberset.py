@@ -0,0 +1,115 @@
+import os
+import shutil
+import sys
+import numpy as np
+
+# A number set is a .npy file holding one flat little-endian uint64 array, so np.load
+# can memory-map it: nothing is parsed or copied until a slice is actually read.
+NUMBERSET_SUFFIX = ".npy"
+NUMBERSET_DTYPE = np.dtype("<u8")
+
+DEFAULT_CHUNK_SIZE = 20000
+
+def is_numberset(path):
+    return str(path).endswith(NUMBERSET_SUFFIX)
+
+def iter_csv_chunks(file_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Stream the numbers of a CSV file in lists of at most chunk_size.
+    Yields (chunk, bytes_read) so callers can report progress against the file size.
+    """
+    chunk, bytes_read = [], 0
+    with open(file_path, newline='') as file:
+        for line in file:
+            bytes_read += len(line)
+            for field in line.strip().split(','):
+                if field.isdigit():
+                    chunk.append(int(field))
+            if len(chunk) >= chunk_size:
+                yield chunk, bytes_read
+                chunk = []
+    if chunk:
+        yield chunk, bytes_read
+
+def iter_numberset_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Same as iter_csv_chunks for a number set; chunks are lists of Python ints."""
+    numbers = load_numberset(path)
+    for i in range(0, len(numbers), chunk_size):
+        chunk = numbers[i:i + chunk_size]
+        yield chunk.tolist(), (i + len(chunk)) * NUMBERSET_DTYPE.itemsize
+
+def iter_number_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Chunks of a number set or of a CSV file, with the bytes of data read so far."""
+    if is_numberset(path):
+        return iter_numberset_chunks(path, chunk_size)
+    return iter_csv_chunks(path, chunk_size)
+
+def numbers_file_size(path):
+    """Bytes of data in a numbers file, the total that iter_number_chunks counts up to."""
+    if is_numberset(path):
+        return len(load_numberset(path)) * NUMBERSET_DTYPE.itemsize
+    return os.path.getsize(path)
+
+def save_numberset(numbers, path, chunk_size=1 << 20):
+    """
+    Write the numbers of an iterable to a number set without holding them in memory.
+    The values are streamed to a raw file first, since the .npy header needs the count.
+    Returns the number of values written.
+    """
+    raw_path = path + ".raw"
+    count = 0
+    try:
+        with open(raw_path, "wb") as raw:
+            chunk = []
+            for n in numbers:
+                if not 0 <= n < 1 << 64:
+                    raise ValueError(f"{n} does not fit in a uint64 number set")
+                chunk.append(n)
+                if len(chunk) == chunk_size:
+                    raw.write(np.array(chunk, dtype=NUMBERSET_DTYPE).tobytes())
+                    count += len(chunk)
+                    chunk = []
+            if chunk:
+                raw.write(np.array(chunk, dtype=NUMBERSET_DTYPE).tobytes())
+                count += len(chunk)
+    except BaseException:
+        os.remove(raw_path)
+        raise
+
+    header = {"descr": np.lib.format.dtype_to_descr(NUMBERSET_DTYPE), "fortran_order": False, "shape": (count,)}
+    with open(path + ".tmp", "wb") as file:
+        np.lib.format.write_array_header_1_0(file, header)
+        with open(raw_path, "rb") as raw:
+            shutil.copyfileobj(raw, file, 1 << 24)
+    os.remove(raw_path)
+    os.replace(path + ".tmp", path)
+    return count
+
+def csv_to_numberset(csv_path, path=None):
+    """Convert a CSV file of numbers (as written by save_to_csv) to a number set."""
+    if path is None:
+        path = os.path.splitext(csv_path)[0] + NUMBERSET_SUFFIX
+
+    def numbers():
+        for chunk, _ in iter_csv_chunks(csv_path):
+            yield from chunk
+
+    save_numberset(numbers(), path)
+    return path
+
+def load_numberset(path):
+    """Memory-map a number set as a read-only uint64 array."""
+    numbers = np.load(path, mmap_mode="r")
+    if numbers.dtype != NUMBERSET_DTYPE or numbers.ndim != 1:
+        raise ValueError(f"{path} is not a number set")
+    return numbers
+
+def main():
+    if len(sys.argv) < 2:
+        print("usage: python numberset.py numbers.csv [numbers.npy]")
+        return
+    path = csv_to_numberset(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None)
+    print(f"{len(load_numberset(path))} numbers written to {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import random
+import time
+from functools import lru_cache
+from gmpy2 import mpz, gcd
+from small_prime_filter import primes_up_to, primorial
+
+# Factors below this bound are stripped by trial division guided by one gcd
+TRIAL_DIVISION_BOUND = 1 << 16
+
+@lru_cache(maxsize=None)
+def _trial_primes(bound):
+    return tuple(primes_up_to(bound))
+
+def strip_small_factors(m, bound=TRIAL_DIVISION_BOUND):
+    """Return m with every prime factor p <= bound divided out."""
+    g = gcd(m, primorial(bound))
+    if g == 1:
+        return m
+    for p in _trial_primes(bound):
+        if g % p == 0:
+            while m % p == 0:
+                m //= p
+            g //= p
+            if g == 1:
+                break
+    return m
+
+def pollard_brent(n, max_iterations=20000, seed=None):
+    """
+    Brent's variant of Pollard's rho with batched gcds.
+    Returns a nontrivial factor of n, or None once max_iterations steps are spent.
+    """
+    n = mpz(n)
+    rng = random.Random(seed)
+    y, c, m = mpz(rng.randrange(1, n)), mpz(rng.randrange(1, n)), 128
+    g = r = q = mpz(1)
+    iterations = 0
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % n
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(m, r - k)):
+                y = (y * y + c) % n
+                q = q * abs(x - y) % n
+            g = gcd(q, n)
+            k += m
+        iterations += r
+        r *= 2
+        if iterations > max_iterations and g == 1:
+            return None
+    if g == n:
+        # The batch overshot: retrace it one step at a time
+        g = mpz(1)
+        while g == 1:
+            ys = (ys * ys + c) % n
+            g = gcd(abs(x - ys), n)
+    return int(g) if g != n else None
+
+def large_prime_cofactor(m, lower_bound, is_probable_prime, rho_rounds=4, max_iterations=20000, time_budget=None):
+    """
+    Try to write m = k * q with k > 1 and q > lower_bound a probable prime, spending at most
+    rho_rounds rounds of Pollard rho (and time_budget seconds) on the cofactor.
+    Returns (k, q) or (None, None) as soon as the budget is spent.
+    """
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+    q = strip_small_factors(m)
+    for _ in range(rho_rounds + 1):
+        if q <= lower_bound:
+            return None, None
+        if is_probable_prime(q):
+            return (m // q, q) if q < m else (None, None)
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        factor = pollard_brent(q, max_iterations)
+        if factor is None:
+            break
+        # Keep the larger part, it is the one that can still be above the bound
+        q = max(factor, q // factor)
+        q = strip_small_factors(q)
+    return None, None
@@ -0,0 +1,70 @@
+from functools import lru_cache
+from small_prime_filter import primes_up_to
+
+try:
+    from gmpy2 import iroot
+except ImportError:
+    iroot = None
+
+def integer_root(n, k):
+    """Return (r, exact) with r = floor(n^(1/k)) and exact True when r^k == n."""
+    if iroot is not None:
+        r, exact = iroot(n, k)
+        return int(r), bool(exact)
+    if n < 2:
+        return n, True
+    # Newton's iteration from an upper bound taken from the bit length
+    r = 1 << -(-n.bit_length() // k)
+    while True:
+        s = ((k - 1) * r + n // r ** (k - 1)) // k
+        if s >= r:
+            break
+        r = s
+    return r, r ** k == n
+
+# Residues of squares modulo a few small moduli, as in the classic isqrt prefilter
+_SQUARE_FILTERS = [(m, frozenset(x * x % m for x in range(m))) for m in (64, 63, 65, 11)]
+
+@lru_cache(maxsize=None)
+def _power_residue_filters(p, count=4):
+    """Small primes q = 1 (mod p) with the set of p-th powers modulo q."""
+    filters = []
+    q = p + 1
+    while len(filters) < count and q < 100000:
+        if q % p == 1 and all(q % d for d in range(2, int(q ** 0.5) + 1)):
+            filters.append((q, frozenset(pow(x, p, q) for x in range(q))))
+        q += p
+    return filters
+
+def _may_be_power(n, p):
+    """Cheap necessary condition for n being a p-th power, from residues modulo small primes."""
+    if p == 2:
+        return all(n % m in squares for m, squares in _SQUARE_FILTERS)
+    # Only q = 1 (mod p) make p-th powers rare modulo q
+    if p < 64:
+        return all(n % q in powers for q, powers in _power_residue_filters(p))
+    return True
+
+def perfect_power(n):
+    """
+    Return (a, b) with n = a^b, b >= 2 maximal and a not a perfect power, or None.
+    Only prime exponents up to log2(n) are tried, each after residue filters.
+    """
+    if n < 4:
+        return None
+    for p in primes_up_to(n.bit_length()):
+        if not _may_be_power(n, p):
+            continue
+        root, exact = integer_root(n, p)
+        if exact:
+            inner = perfect_power(root)
+            if inner is None:
+                return root, p
+            return inner[0], inner[1] * p
+    return None
+
+def is_perfect_power(n):
+    """
+    Checks if n is a perfect power (n = a^b for a > 1 and b > 1).
+    """
+    return perfect_power(n) is not None
@@ -0,0 +1,147 @@
+import os
+import sys
+import numpy as np
+from ecpp_cm import SMALL_PROVEN_BOUND, is_proven_small_prime
+from sieve import WHEEL, SEGMENT_BYTES, wheel_segments
+
+# Byte w of the bitmap describes 30w + 1, ..., 30w + 29: bit j is set when 30w + WHEEL[j]
+# is prime. Only 2, 3 and 5 fall outside the wheel. Stored as a .npy uint8 array so that
+# every process can memory-map the same copy; 10^10 takes about 333 MB.
+DEFAULT_BITMAP_PATH = "prime_bitmap.npy"
+
+# Bit of n % 30 in its byte, -1 for residues sharing a factor with 30
+RESIDUE_BIT = [-1] * 30
+for _j, _r in enumerate(WHEEL):
+    RESIDUE_BIT[_r] = _j
+_RESIDUE_BIT_ARRAY = np.array(RESIDUE_BIT, dtype=np.int8)
+
+# For every byte value, the residues of its set bits in increasing order
+_BYTE_RESIDUES = [[WHEEL[j] for j in range(8) if b >> j & 1] for b in range(256)]
+
+def build_prime_bitmap(limit, path=DEFAULT_BITMAP_PATH, segment_bytes=SEGMENT_BYTES):
+    """
+    Sieve the primes below limit (rounded up to a multiple of 30) into a bitmap file,
+    one segment at a time. Returns the path.
+    """
+    length = (limit + 29) // 30
+    bitmap = np.lib.format.open_memmap(path + ".tmp", mode="w+", dtype=np.uint8, shape=(length,))
+    for w0, flags in wheel_segments(0, 30 * length, segment_bytes):
+        rows = np.frombuffer(flags, dtype=np.uint8).reshape(-1, 8)
+        bitmap[w0:w0 + len(rows)] = np.packbits(rows, axis=1, bitorder="little")[:, 0]
+    bitmap.flush()
+    del bitmap
+    os.replace(path + ".tmp", path)
+    return path
+
+class PrimeBitmap:
+    """Read-only view of a bitmap file, answering primality questions below its limit."""
+
+    def __init__(self, path=DEFAULT_BITMAP_PATH):
+        self.bits = np.load(path, mmap_mode="r")
+        self.limit = 30 * len(self.bits)
+
+    def _check(self, n):
+        if not 0 <= n < self.limit:
+            raise ValueError(f"{n} is outside the bitmap, which stops at {self.limit}")
+
+    def is_prime(self, n):
+        """A single bit read below the limit, a deterministic test above it."""
+        if n >= self.limit:
+            if n < SMALL_PROVEN_BOUND:
+                return is_proven_small_prime(n)
+            raise ValueError(f"{n} is beyond both the bitmap and the deterministic tests")
+        if n < 7:
+            return n in (2, 3, 5)
+        bit = RESIDUE_BIT[n % 30]
+        return bit >= 0 and bool(self.bits[n // 30] >> bit & 1)
+
+    def are_prime(self, numbers):
+        """Vectorised is_prime for an array of numbers below the limit."""
+        n = np.asarray(numbers, dtype=np.uint64)
+        if n.size and int(n.max()) >= self.limit:
+            raise ValueError(f"numbers must be below the bitmap limit {self.limit}")
+        bit = _RESIDUE_BIT_ARRAY[n % np.uint64(30)]
+        verdicts = (self.bits[n // np.uint64(30)] >> np.maximum(bit, 0).astype(np.uint8)) & 1
+        verdicts = verdicts.astype(bool) & (bit >= 0)
+        return verdicts | (n == 2) | (n == 3) | (n == 5)
+
+    def next_prime(self, n):
+        """The smallest prime greater than n."""
+        for p in (2, 3, 5, 7):
+            if n < p:
+                return p
+        self._check(n)
+        w, r = divmod(n, 30)
+        for residue in _BYTE_RESIDUES[self.bits[w]]:
+            if residue > r:
+                return 30 * w + residue
+        # Scan ahead in growing windows of whole bytes
+        start, window = w + 1, 64
+        while start < len(self.bits):
+            nonzero = np.flatnonzero(self.bits[start:start + window])
+            if nonzero.size:
+                w = start + int(nonzero[0])
+                return 30 * w + _BYTE_RESIDUES[self.bits[w]][0]
+            start, window = start + window, 2 * window
+        raise ValueError(f"no prime after {n} below the bitmap limit {self.limit}")
+
+    def prev_prime(self, n):
+        """The largest prime smaller than n."""
+        if n <= 7:
+            smaller = [p for p in (2, 3, 5) if p < n]
+            if not smaller:
+                raise ValueError(f"no prime below {n}")
+            return smaller[-1]
+        self._check(n - 1)
+        w, r = divmod(n, 30)
+        if w < len(self.bits):
+            for residue in reversed(_BYTE_RESIDUES[self.bits[w]]):
+                if residue < r:
+                    return 30 * w + residue
+        end, window = w, 64
+        while end > 0:
+            start = max(end - window, 0)
+            nonzero = np.flatnonzero(self.bits[start:end])
+            if nonzero.size:
+                w = start + int(nonzero[-1])
+                return 30 * w + _BYTE_RESIDUES[self.bits[w]][-1]
+            end, window = start, 2 * window
+        return 5
+
+_default_bitmap = None
+
+def default_bitmap():
+    """The bitmap at DEFAULT_BITMAP_PATH, opened once per process; None if it was never built."""
+    global _default_bitmap
+    if _default_bitmap is None and os.path.exists(DEFAULT_BITMAP_PATH):
+        _default_bitmap = PrimeBitmap(DEFAULT_BITMAP_PATH)
+    return _default_bitmap
+
+def is_prime(n):
+    """is_prime from the default bitmap, or the deterministic tests when there is no bitmap."""
+    bitmap = default_bitmap()
+    if bitmap is None:
+        if n >= SMALL_PROVEN_BOUND:
+            raise ValueError(f"{n} is beyond the deterministic tests")
+        return is_proven_small_prime(n)
+    return bitmap.is_prime(n)
+
+def next_prime(n):
+    return PrimeBitmap.next_prime(_require_default_bitmap(), n)
+
+def prev_prime(n):
+    return PrimeBitmap.prev_prime(_require_default_bitmap(), n)
+
+def _require_default_bitmap():
+    bitmap = default_bitmap()
+    if bitmap is None:
+        raise FileNotFoundError(f"{DEFAULT_BITMAP_PATH} not found, build it with build_prime_bitmap")
+    return bitmap
+
+def main():
+    limit = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 9
+    path = build_prime_bitmap(limit)
+    print(f"Bitmap of the primes below {PrimeBitmap(path).limit} written to {path}")
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,25 @@
-import sympy
+from sieve import iter_primes, iter_composites
+from numberset import save_numberset
 
 # Generate primes up to a limit
 def generate_primes(limit):
-    return list(sympy.primerange(2, limit))
+    return iter_primes(2, limit)
 
 # Save to CSV
 def save_to_csv(numbers, filename):
     import csv
     with open(filename, 'w', newline='') as file:
         writer = csv.writer(file)
-        writer.writerows([[num] for num in numbers])
+        writer.writerows([num] for num in numbers)
 
-primes = generate_primes(1_000_000_000)
-save_to_csv(primes, 'primes10b.csv')
+# Generate composites up to a limit, streamed from the same segmented sieve
+def generate_composites(limit):
+    return iter_composites(4, limit)
 
-def generate_composites(primes, limit):
-    composites = set(range(4, limit))
-    composites -= set(primes)  # Remove primes from the list
-    return sorted(composites)
+def main():
+    # Billion-entry sets are written as memory-mappable number sets rather than CSV
+    save_numberset(generate_primes(1_000_000_000), 'primes10b.npy')
+    save_numberset(generate_composites(1_000_000_000), 'composites1b.npy')
 
-primes = generate_primes(1_000_000_000)
-composites = generate_composites(primes, 1_000_000_000)
-save_to_csv(composites, 'composites1b.csv')
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import sys
+from math import isqrt
+import numpy as np
+from multiplicative_order import factorize, multiplicative_order
+from numberset import save_numberset
+from small_prime_filter import primes_up_to
+from vector_primality import vector_fermat, vector_miller_rabin
+
+# Odd numbers per segment; a segment costs a few int64 arrays of this length
+SEGMENT_ODDS = 1 << 21
+
+KINDS = ("carmichael", "fermat_psp2", "strong_psp2")
+
+def _odd_prime_table(hi):
+    """(p, order of 2 mod p) for the odd primes p <= sqrt(hi)."""
+    table = []
+    for p in primes_up_to(isqrt(hi)):
+        if p > 2:
+            table.append((p, multiplicative_order(2, p, group_order_factors=factorize(p - 1))))
+    return table
+
+def pseudoprime_segments(lo, hi, segment_odds=SEGMENT_ODDS):
+    """
+    Yield, segment after segment in increasing order, the arrays
+    (Carmichael numbers, base-2 Fermat pseudoprimes, base-2 strong pseudoprimes) in [lo, hi).
+
+    Every odd number is factored by a segmented sieve over the primes up to sqrt(hi), which
+    leaves at most one larger prime cofactor. Korselt's criterion (n squarefree and p - 1 | n - 1
+    for every p | n) then decides Carmichael numbers exactly. For the pseudoprimes, the sieve
+    keeps the composites with ord_p(2) | n - 1 for every small p | n, a necessary condition,
+    and the few survivors are confirmed with one vectorised exponentiation.
+    """
+    table = _odd_prime_table(hi)
+    lo = max(lo, 3) | 1
+    for start in range(lo, hi, 2 * segment_odds):
+        n = np.arange(start, min(start + 2 * segment_odds, hi), 2, dtype=np.int64)
+        if n.size == 0:
+            break
+        n_minus_1 = n - 1
+        rest = n.copy()
+        composite = np.zeros(n.size, dtype=bool)
+        korselt = np.ones(n.size, dtype=bool)
+        fermat = np.ones(n.size, dtype=bool)
+
+        for p, order in table:
+            # n = start + 2i is a multiple of p when i = -start / 2 (mod p); p itself is skipped
+            first = (-start * pow(2, -1, p)) % p
+            if start + 2 * first == p:
+                first += p
+            if first >= n.size:
+                continue
+            view = slice(first, None, p)
+            composite[view] = True
+            korselt[view] &= n_minus_1[view] % (p - 1) == 0
+            fermat[view] &= n_minus_1[view] % order == 0
+            rest[view] //= p
+            # Square factors: not Carmichael, and only Fermat pseudoprimes if p is a Wieferich prime
+            square = rest[view] % p == 0
+            if square.any():
+                korselt[view] &= ~square
+                multiples = np.flatnonzero(square) * p + first
+                while multiples.size:
+                    rest[multiples] //= p
+                    multiples = multiples[rest[multiples] % p == 0]
+
+        # What is left above 1 is a single prime factor larger than sqrt(hi)
+        large = rest > 1
+        korselt[large] &= n_minus_1[large] % (rest[large] - 1) == 0
+
+        carmichael = n[composite & korselt]
+        candidates = n[composite & fermat]
+        fermat_psp = candidates[vector_fermat(candidates, [2], trial_division=False)]
+        strong_psp = fermat_psp[vector_miller_rabin(fermat_psp, [2], trial_division=False)]
+        yield carmichael, fermat_psp, strong_psp
+
+def _iter_kind(index, bound, lo):
+    for segment in pseudoprime_segments(lo, bound + 1):
+        yield from segment[index].tolist()
+
+def iter_carmichael_numbers(bound, lo=3):
+    """Yield the Carmichael numbers lo <= n <= bound in increasing order."""
+    return _iter_kind(0, bound, lo)
+
+def iter_fermat_pseudoprimes(bound, lo=3):
+    """Yield the base-2 Fermat pseudoprimes lo <= n <= bound in increasing order."""
+    return _iter_kind(1, bound, lo)
+
+def iter_strong_pseudoprimes(bound, lo=3):
+    """Yield the base-2 strong pseudoprimes lo <= n <= bound in increasing order."""
+    return _iter_kind(2, bound, lo)
+
+def hard_composite_sets(bound):
+    """The three populations up to bound in one sieve pass, as {kind: set of numbers}."""
+    sets = {kind: set() for kind in KINDS}
+    for segment in pseudoprime_segments(3, bound + 1):
+        for kind, numbers in zip(KINDS, segment):
+            sets[kind].update(numbers.tolist())
+    return sets
+
+def main():
+    bound = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 9
+    sets = hard_composite_sets(bound)
+    for kind in KINDS:
+        path = f"{kind}_{bound}.npy"
+        save_numberset(sorted(sets[kind]), path)
+        print(f"{len(sets[kind])} {kind.replace('_', ' ')} numbers up to {bound} written to {path}")
+
+if __name__ == "__main__":
+    main()
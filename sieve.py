@@ -0,0 +1,65 @@
+from itertools import compress
+from math import isqrt
+from small_prime_filter import primes_up_to
+
+# Residues modulo 30 that are coprime to 2, 3 and 5: the only places a prime > 5 can sit
+WHEEL = (1, 7, 11, 13, 17, 19, 23, 29)
+
+# Bytes per residue class in one segment; 8 classes of 128 KiB keep a segment in L2 cache
+SEGMENT_BYTES = 1 << 17
+
+def _sieving_primes(hi):
+    """Primes 7 <= p <= sqrt(hi) with, per wheel residue, the wheel index of p * m."""
+    table = []
+    for p in primes_up_to(isqrt(hi)):
+        if p < 7:
+            continue
+        inv30 = pow(30, -1, p)
+        # 30 * w + r is a multiple of p exactly when w = -r / 30 (mod p)
+        table.append((p, [(-r * inv30) % p for r in WHEEL]))
+    return table
+
+def wheel_segments(lo, hi, segment_bytes=SEGMENT_BYTES):
+    """Yield (w0, flags) where flags[8 * i + j] marks 30 * (w0 + i) + WHEEL[j] as prime."""
+    sieving_primes = _sieving_primes(hi)
+    w_lo, w_hi = lo // 30, (hi + 29) // 30
+    for w0 in range(w_lo, w_hi, segment_bytes):
+        w1 = min(w0 + segment_bytes, w_hi)
+        length = w1 - w0
+        flags = bytearray(8 * length)
+        for j, r in enumerate(WHEEL):
+            row = bytearray([1]) * length
+            for p, residues in sieving_primes:
+                # Start at p * p so that p itself stays marked as prime
+                first = max(w0, (p * p - r + 29) // 30)
+                start = first + (residues[j] - first) % p
+                if start < w1:
+                    row[start - w0::p] = bytes(len(range(start - w0, length, p)))
+            flags[j::8] = row
+        if w0 == 0:
+            flags[0] = 0  # 1 is not prime
+        yield w0, flags
+
+def iter_primes(lo, hi, segment_bytes=SEGMENT_BYTES):
+    """Yield the primes p with lo <= p < hi in increasing order, in constant memory."""
+    for p in (2, 3, 5):
+        if lo <= p < hi:
+            yield p
+    if hi <= 7:
+        return
+    for w0, flags in wheel_segments(max(lo, 7), hi, segment_bytes):
+        base = 30 * w0
+        for c in compress(range(len(flags)), flags):
+            p = base + 30 * (c >> 3) + WHEEL[c & 7]
+            if p >= hi:
+                return
+            if p >= lo:
+                yield p
+
+def iter_composites(lo, hi, segment_bytes=SEGMENT_BYTES):
+    """Yield the composites n with lo <= n < hi in increasing order, in constant memory."""
+    start = max(lo, 4)
+    for p in iter_primes(start, hi, segment_bytes):
+        yield from range(start, p)
+        start = p + 1
+    yield from range(start, hi)
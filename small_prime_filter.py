@@ -0,0 +1,57 @@
+from functools import lru_cache
+from gmpy2 import mpz, gcd
+
+# Primes up to this bound are divided out before any probabilistic test
+DEFAULT_PREFILTER_BOUND = 10000
+_prefilter_bound = DEFAULT_PREFILTER_BOUND
+
+def primes_up_to(bound):
+    """Sieve of Eratosthenes returning all primes p <= bound."""
+    if bound < 2:
+        return []
+    sieve = bytearray([1]) * (bound + 1)
+    sieve[0] = sieve[1] = 0
+    for p in range(2, int(bound ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, bound + 1, p)))
+    return [p for p in range(bound + 1) if sieve[p]]
+
+@lru_cache(maxsize=None)
+def _small_primes(bound):
+    return frozenset(primes_up_to(bound))
+
+@lru_cache(maxsize=None)
+def primorial(bound):
+    """Product of all primes p <= bound, built with a product tree."""
+    level = [mpz(p) for p in primes_up_to(bound)] or [mpz(1)]
+    while len(level) > 1:
+        level = [level[i] * level[i + 1] if i + 1 < len(level) else level[i]
+                 for i in range(0, len(level), 2)]
+    return level[0]
+
+def set_prefilter_bound(bound):
+    """Change the default small-prime bound used by the primality tests."""
+    global _prefilter_bound
+    if bound < 2:
+        raise ValueError("Prefilter bound must be at least 2")
+    _prefilter_bound = bound
+
+def get_prefilter_bound():
+    return _prefilter_bound
+
+def small_prime_prefilter(n, bound=None):
+    """
+    Decide n with a single gcd against the primorial of the primes up to bound.
+    Returns False if n has a small prime factor (or n < 2), True if n is a small
+    prime or too small to have a larger factor, and None if a full test is needed.
+    """
+    bound = bound or _prefilter_bound
+    if n < 2:
+        return False
+    if n <= bound:
+        return n in _small_primes(bound)
+    if gcd(n, primorial(bound)) != 1:
+        return False
+    if n < bound * bound:
+        return True
+    return None
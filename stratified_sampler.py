@@ -0,0 +1,100 @@
+import random
+from bisect import bisect_right
+from collections import namedtuple
+import numpy as np
+
+# Numbers start <= n <= end, of which target are to be drawn
+Stratum = namedtuple("Stratum", ["start", "end", "target"])
+
+def strata_from_ranges(ranges):
+    """Strata from (start, end, target) triples such as generate_balanced_composites.ranges."""
+    strata = sorted(Stratum(*r) for r in ranges)
+    for previous, stratum in zip(strata, strata[1:]):
+        if stratum.start <= previous.end:
+            raise ValueError(f"strata {previous} and {stratum} overlap")
+    return strata
+
+def log_spaced_strata(total, hi=10 ** 12, bins=12, lo=4):
+    """
+    bins strata with logarithmically spaced bounds covering lo..hi, sharing the total
+    target equally (the first strata take the remainder).
+    """
+    edges = sorted(set(int(round(x)) for x in np.geomspace(lo, hi + 1, bins + 1)))
+    targets = [total // (len(edges) - 1)] * (len(edges) - 1)
+    for i in range(total - sum(targets)):
+        targets[i] += 1
+    return [Stratum(start, end - 1, target) for start, end, target in zip(edges, edges[1:], targets)]
+
+def _forced_by_stratum(strata, forced):
+    """Split the forced numbers by stratum, dropping those outside every stratum."""
+    starts = [stratum.start for stratum in strata]
+    by_stratum = [[] for _ in strata]
+    for n in forced:
+        i = bisect_right(starts, n) - 1
+        if i >= 0 and n <= strata[i].end:
+            by_stratum[i].append(int(n))
+    for stratum, numbers in zip(strata, by_stratum):
+        if len(numbers) > stratum.target:
+            raise ValueError(f"{len(numbers)} forced numbers do not fit in {stratum}")
+    return by_stratum
+
+def _sample_array(numbers, strata, forced, rng):
+    """Sorted array: every stratum is a slice found by binary search, sampled without copying."""
+    sample = []
+    for stratum, included in zip(strata, forced):
+        lo = int(np.searchsorted(numbers, stratum.start, side="left"))
+        hi = int(np.searchsorted(numbers, stratum.end, side="right"))
+        window = numbers[lo:hi]
+        # Positions of the forced numbers present in the slice, which must not be drawn again
+        wanted = np.array(included, dtype=numbers.dtype)
+        positions = np.minimum(np.searchsorted(window, wanted), max(hi - lo - 1, 0))
+        present = np.unique(positions[window[positions] == wanted]) if hi > lo else positions[:0]
+        needed = stratum.target - len(included)
+        available = hi - lo - len(present)
+        if needed > available:
+            raise ValueError(f"only {available} numbers available for {stratum}")
+        # Draw among the other positions, then shift each past the forced positions before it
+        drawn = np.sort(rng.choice(available, size=needed, replace=False))
+        drawn += np.searchsorted(present - np.arange(len(present)), drawn, side="right")
+        sample.extend(sorted(included + window[drawn].tolist()))
+    return sample
+
+def _sample_stream(numbers, strata, forced, rng):
+    """Any iterable: one reservoir per stratum, filled in a single pass (algorithm R)."""
+    starts = [stratum.start for stratum in strata]
+    excluded = set(n for included in forced for n in included)
+    sizes = [stratum.target - len(included) for stratum, included in zip(strata, forced)]
+    reservoirs = [[] for _ in strata]
+    seen = [0] * len(strata)
+    for n in numbers:
+        i = bisect_right(starts, n) - 1
+        if i < 0 or n > strata[i].end or n in excluded:
+            continue
+        seen[i] += 1
+        if len(reservoirs[i]) < sizes[i]:
+            reservoirs[i].append(int(n))
+        else:
+            j = rng.randrange(seen[i])
+            if j < sizes[i]:
+                reservoirs[i][j] = int(n)
+
+    sample = []
+    for stratum, included, reservoir, size in zip(strata, forced, reservoirs, sizes):
+        if len(reservoir) < size:
+            raise ValueError(f"only {len(reservoir)} numbers available for {stratum}")
+        sample.extend(sorted(included + reservoir))
+    return sample
+
+def stratified_sample(numbers, strata, forced=(), seed=None):
+    """
+    Draw stratum.target numbers uniformly from each stratum, always including the forced
+    numbers (any iterable, e.g. pseudoprimes.iter_carmichael_numbers) that fall in it.
+    A sorted array, memory-mapped or not, is sampled by binary search on the stratum
+    bounds; any other iterable is read once, holding only the reservoirs in memory.
+    The same seed gives the same sample. Returns a list sorted within each stratum.
+    """
+    strata = strata_from_ranges(strata)
+    forced = _forced_by_stratum(strata, forced)
+    if isinstance(numbers, np.ndarray):
+        return _sample_array(numbers, strata, forced, np.random.default_rng(seed))
+    return _sample_stream(numbers, strata, forced, random.Random(seed))
@@ -1,5 +1,5 @@
 from math import gcd, isqrt, log, ceil
-from sympy import symbols, Poly
+from aks_ring import CyclicPolyRing
 
 def is_perfect_power(n):
     """
@@ -40,32 +40,17 @@ def euler_totient(r):
         result -= result // r
     return result
 
-def poly_mod_exp(base, exp, mod_poly, modulus):
-    """
-    Modular exponentiation for polynomials.
-    """
-    result = Poly(1, symbols('x'), modulus=modulus)
-    base = base % mod_poly
-    while exp > 0:
-        if exp % 2 == 1:
-            result = (result * base) % mod_poly
-        base = (base * base) % mod_poly
-        exp //= 2
-    return result
-
 def optimized_polynomial_mod_check(n, r):
     """
     Optimized polynomial congruence check:
     Verifies (x + a)^n ≡ x^n + a (mod x^r - 1, n) for 1 ≤ a ≤ √φ(r) log(n).
     """
-    x = symbols('x')
-    mod_poly = Poly(x ** r - 1, x, modulus=n)
+    ring = CyclicPolyRing(n, r)
     max_a = ceil(isqrt(euler_totient(r)) * log(n, 2))
-    
+
     for a in range(1, max_a + 1):
-        base = Poly(x + a, x, modulus=n)
-        lhs = poly_mod_exp(base, n, mod_poly, n)
-        rhs = Poly(x ** n + a, x, modulus=n) % mod_poly
+        lhs = ring.pow_x_plus_a(a, n)
+        rhs = ring.x_power_plus_a(n, a)
         if lhs != rhs:
             return False
     return True
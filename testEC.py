@@ -1,8 +1,21 @@
 import random
+from concurrent.futures import ProcessPoolExecutor
 from sympy import isprime, mod_inverse, sqrt_mod
-import sage.all as sage
-from sympy.ntheory import factorint
 from math import gcd
+from gmpy2 import jacobi
+from bpsw import bpsw_test
+from measurement import completed_results
+from perfect_power import integer_root
+from partial_factor import large_prime_cofactor
+from class_polynomials import HILBERT_CLASS_POLYNOMIALS
+from ec_arith import JacobianPoint, jacobian_scalar_multiplication, to_affine
+from ecpp_cm import (DISCRIMINANTS, SMALL_PROVEN_BOUND, is_proven_small_prime, cornacchia,
+                     cm_group_orders, poly_root_mod_prime, curve_twists)
+
+try:
+    import sage.all as sage
+except ImportError:  # only the Schoof point-counting path needs Sage
+    sage = None
 
 def is_valid_curve(a, b, n):
     """Check if the elliptic curve is valid."""
@@ -34,20 +47,23 @@ def random_point_on_curve(n, a, b, max_retries=10):
 
 def compute_group_order_schoof(n, a, b):
     """Compute group order using Schoof's algorithm."""
+    if sage is None:
+        return None
     try:
         E = sage.EllipticCurve(sage.FiniteField(n), [a, b])
         return E.cardinality()
     except Exception as e:
         return None
 
-def decompose_group_order(m, n):
-    """Decompose m = k * q where q is a probable prime and k > 1."""
-    factors = factorint(m)
-    for q in factors:
-        k = m // q
-        if k > 1 and isprime(q) and q > (n**(1/4) + 1)**2:
-            return k, q
-    return None, None
+def decompose_group_order(m, n, rho_rounds=4, max_iterations=20000, time_budget=None):
+    """
+    Decompose m = k * q where q is a probable prime and k > 1, with bounded effort:
+    strip small factors, spend a few rounds of Pollard rho on the cofactor, and give
+    up on this m as soon as the budget is spent.
+    """
+    # q > (n^(1/4) + 1)^2, in integers so that n may exceed the float range
+    bound = (integer_root(n, 4)[0] + 2) ** 2
+    return large_prime_cofactor(m, bound, bpsw_test, rho_rounds, max_iterations, time_budget)
 
 def point_addition(P, Q, n, a):
     """Perform point addition on the elliptic curve."""
@@ -83,35 +99,150 @@ def scalar_multiplication(k, P, n, a):
                 R = point_addition(R, P, n, a)
     return R
 
-def validate_point_multiplication(P, k, q, n, a):
-    """Validate point multiplication."""
-    kP = scalar_multiplication(k, P, n, a)
+def validate_point_multiplication(P, k, q, n, a, method="wnaf"):
+    """Validate point multiplication in Jacobian coordinates (method "wnaf" or "ladder")."""
+    kP = jacobian_scalar_multiplication(k, JacobianPoint.from_affine(P), n, a, method)
+    kP = to_affine(kP, n)  # the only inversion
     if kP is None:
-        return False  # Invalid: (m/q) * P = O
-    qP = scalar_multiplication(q, kP, n, a)
-    return qP is None  # Must be true for valid curve
-
-def ecpp_certificate(n, max_attempts=10):
-    """ECPP test that returns True for prime numbers and False for composite numbers."""
-    def ecpp_recursive_internal(n):
-        for _ in range(max_attempts):
-            # Step 1: Select a valid elliptic curve
-            a, b = random.randint(0, n - 1), random.randint(0, n - 1)
-            if not is_valid_curve(a, b, n):
-                continue
+        return False  # Invalid: (m/q) * P = O modulo some prime factor of n
+    qP = jacobian_scalar_multiplication(q, JacobianPoint.from_affine(kP), n, a, method)
+    # Must be O modulo n, and not the degenerate (0 : 0 : 0) modulo a factor of n
+    return qP.Z % n == 0 and gcd(qP.Y, n) == 1
 
-            # Step 2: Compute group order using Schoof's algorithm
-            m = compute_group_order_schoof(n, a, b)
-            if m is None:
-                continue
+def cm_discriminant_candidates(n, D):
+    """
+    Atkin-Morain for one discriminant D: the list of (a, b, m, k, q) for curves with
+    complex multiplication by D whose order m = k * q decomposes.
+    Orders come from Cornacchia, not from point counting.
+    """
+    candidates = []
+    uv = cornacchia(D, n)
+    if uv is None:
+        return candidates
+    j = None
+    for m in cm_group_orders(D, n, *uv):
+        k, q = decompose_group_order(m, n)
+        if k is None or q is None:
+            continue
 
-            # Step 3: Decompose group order
-            k, q = decompose_group_order(m, n)
-            if k is None or q is None:
+        # Only now find a root of H_D, and the twist of that curve with order m
+        if j is None:
+            j = poly_root_mod_prime(HILBERT_CLASS_POLYNOMIALS[D], n)
+            if j is None:
+                break
+        for a, b in curve_twists(j, n):
+            P = random_point_on_curve(n, a, b)
+            if P is not None and jacobian_scalar_multiplication(m, JacobianPoint.from_affine(P), n, a).is_infinity(n):
+                candidates.append((a, b, m, k, q))
+                break
+    return candidates
+
+def cm_curve_candidates(n, executor=None, in_flight=4):
+    """Yield (a, b, m, k, q) over all discriminants, concurrently when given an executor."""
+    discriminants = (D for D in DISCRIMINANTS if jacobi(D % n, n) == 1)
+    if executor is None:
+        for D in discriminants:
+            yield from cm_discriminant_candidates(n, D)
+        return
+    results = completed_results(executor, cm_discriminant_candidates, ((n, D) for D in discriminants), in_flight)
+    try:
+        for candidates in results:
+            yield from candidates
+    finally:
+        results.close()
+
+def print_descent(depth, n):
+    print(f"ECPP descent level {depth}: {len(str(n))} digits")
+
+def _ecpp_cm_descent(n, max_attempts, executor, in_flight, progress, depth):
+    if progress is not None:
+        progress(depth, n)
+    if n < SMALL_PROVEN_BOUND:
+        return [] if is_proven_small_prime(n) else None
+    if not bpsw_test(n):
+        return None
+
+    candidates = cm_curve_candidates(n, executor, in_flight)
+    try:
+        for a, b, m, k, q in candidates:
+            # Step 1: Recursively prove q
+            chain = _ecpp_cm_descent(q, max_attempts, executor, in_flight, progress, depth + 1)
+            if chain is None:
                 continue
 
+            # Step 2: Find a point with (m/q) * P != O and m * P = O
+            for _ in range(max_attempts):
+                P = random_point_on_curve(n, a, b)
+                if P is not None and validate_point_multiplication(P, k, q, n, a):
+                    return [(n, a, b, m, q, P[0], P[1])] + chain
+    finally:
+        candidates.close()  # cancel the curves still queued for this level
+    return None
+
+def ecpp_cm_chain(n, max_attempts=10, processes=None, progress=None):
+    """
+    ECPP with the CM method. Returns the descent as a list of (n, a, b, m, q, x, y)
+    steps, each one reducing the primality of n to that of q, ending below
+    SMALL_PROVEN_BOUND; or None if n could not be proven prime.
+    processes > 1 searches the curves of each level in a process pool, and
+    progress(depth, n) is called as the descent goes down.
+    """
+    if processes is None or processes <= 1:
+        return _ecpp_cm_descent(n, max_attempts, None, 0, progress, 0)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        # Keep a second batch queued so that no worker waits between results
+        return _ecpp_cm_descent(n, max_attempts, executor, 2 * processes, progress, 0)
+
+def ecpp_cm(n, max_attempts=10, processes=None, progress=None):
+    """ECPP with the CM method: True if n is proven prime, False otherwise."""
+    return ecpp_cm_chain(n, max_attempts, processes, progress) is not None
+
+def schoof_curve_attempt(n, seed):
+    """Steps 1-3 of the Schoof path for one random curve: (a, b, k, q) or None."""
+    rng = random.Random(seed)
+    # Step 1: Select a valid elliptic curve
+    a, b = rng.randint(0, n - 1), rng.randint(0, n - 1)
+    if not is_valid_curve(a, b, n):
+        return None
+
+    # Step 2: Compute group order using Schoof's algorithm
+    m = compute_group_order_schoof(n, a, b)
+    if m is None:
+        return None
+
+    # Step 3: Decompose group order
+    k, q = decompose_group_order(m, n)
+    if k is None or q is None:
+        return None
+    return a, b, k, q
+
+def ecpp_certificate(n, max_attempts=10, method="cm", processes=None, progress=None):
+    """
+    ECPP test that returns True for prime numbers and False for composite numbers.
+    method="cm" uses the Atkin-Morain CM method, method="schoof" counts points with Sage.
+    processes > 1 tries the candidate curves of each descent level concurrently,
+    progress(depth, n) reports the descent depth.
+    """
+    if method == "cm":
+        return ecpp_cm(n, max_attempts, processes, progress)
+
+    def curve_attempts(n, executor):
+        seeds = [random.getrandbits(64) for _ in range(max_attempts)]
+        if executor is None:
+            return (schoof_curve_attempt(n, seed) for seed in seeds)
+        return completed_results(executor, schoof_curve_attempt, ((n, seed) for seed in seeds), len(seeds))
+
+    def ecpp_recursive_internal(n, executor, depth):
+        if progress is not None:
+            progress(depth, n)
+        attempts = curve_attempts(n, executor)
+        for attempt in attempts:
+            if attempt is None:
+                continue  # only the sequential attempts can come back empty
+            a, b, k, q = attempt
+
             # Step 4: Recursively verify q
-            if not isprime(q) and not ecpp_recursive_internal(q):
+            if not isprime(q) and not ecpp_recursive_internal(q, executor, depth + 1):
                 continue
 
             # Step 5: Select a point on the elliptic curve
@@ -123,9 +254,12 @@ def ecpp_certificate(n, max_attempts=10):
             if not validate_point_multiplication(P, k, q, n, a):
                 continue
 
+            attempts.close()
             return True  # ECPP proves n is prime
 
         return False  # ECPP could not prove primality (composite)
 
-    return ecpp_recursive_internal(n)
-
+    if processes is None or processes <= 1:
+        return ecpp_recursive_internal(n, None, 0)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return ecpp_recursive_internal(n, executor, 0)
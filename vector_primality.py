@@ -0,0 +1,243 @@
+import numpy as np
+
+# Vectorised Fermat and Miller-Rabin over numpy arrays of odd moduli n < 2^63.
+# Products are formed from 32-bit limbs and reduced with Montgomery multiplication
+# (R = 2^64), so every intermediate value fits in a uint64.
+
+MAX_VECTOR_MODULUS = 1 << 63
+
+# Sinclair's bases: the strong tests to these seven bases are exact for every n < 2^64
+DETERMINISTIC_BASES = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+# Enough for every n below 4,759,123,141 (Jaeschke), so in particular below 2^32
+SMALL_DETERMINISTIC_BASES = (2, 7, 61)
+
+# Numbers are tested in blocks of this many, so temporaries stay in cache
+BLOCK_SIZE = 1 << 16
+
+# Small primes divided out before any exponentiation
+TRIAL_PRIMES = (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61)
+
+_MASK32 = np.uint64(0xFFFFFFFF)
+_SHIFT32 = np.uint64(32)
+_ONE = np.uint64(1)
+
+def _mul_wide(a, b):
+    """Full 128-bit products of two uint64 arrays, as (high, low) words."""
+    a0, a1 = a & _MASK32, a >> _SHIFT32
+    b0, b1 = b & _MASK32, b >> _SHIFT32
+    p00, p01, p10, p11 = a0 * b0, a0 * b1, a1 * b0, a1 * b1
+    middle = (p00 >> _SHIFT32) + (p01 & _MASK32) + (p10 & _MASK32)
+    high = p11 + (p01 >> _SHIFT32) + (p10 >> _SHIFT32) + (middle >> _SHIFT32)
+    return high, a * b
+
+class MontgomeryContext:
+    """Montgomery constants for an array of odd moduli below 2^63."""
+
+    def __init__(self, n, constants=None):
+        self.n = n
+        if constants is not None:
+            self.n_prime, self.one, self.r2 = constants
+        else:
+            # -n^-1 mod 2^64 by Newton's iteration: n * n = 1 (mod 8), each step doubles the bits
+            inverse = n.copy()
+            for _ in range(5):
+                inverse *= np.uint64(2) - n * inverse
+            self.n_prime = np.uint64(0) - inverse
+            # R mod n, then R^2 mod n by doubling R mod n 64 more times
+            self.one = (np.uint64(0) - n) % n
+            r2 = self.one.copy()
+            for _ in range(64):
+                r2 = r2 << _ONE
+                r2 = np.where(r2 >= n, r2 - n, r2)
+            self.r2 = r2
+        self.minus_one = n - self.one
+
+    def take(self, indices):
+        """The context of the moduli n[indices], without recomputing the constants."""
+        return MontgomeryContext(self.n[indices], (self.n_prime[indices], self.one[indices], self.r2[indices]))
+
+    def mul(self, a, b):
+        """a * b / R mod n for a, b < n."""
+        high, low = _mul_wide(a, b)
+        m = low * self.n_prime
+        # low + (m * n mod 2^64) is 0 mod 2^64, so it carries exactly when low != 0
+        t = high + _mul_wide(m, self.n)[0] + (low != 0).astype(np.uint64)
+        return np.where(t >= self.n, t - self.n, t)
+
+    def to_residue(self, a):
+        return self.mul(a % self.n, self.r2)
+
+    def from_residue(self, a):
+        return self.mul(a, np.ones_like(self.n))
+
+    def pow(self, a, e):
+        return _vector_pow(self, a, e)
+
+class DirectContext:
+    """
+    Same interface for moduli below 2^32, where a product of two residues fits in
+    a uint64 and a plain remainder is cheaper than a Montgomery reduction.
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.one = np.ones_like(n)
+        self.minus_one = n - _ONE
+
+    def take(self, indices):
+        return DirectContext(self.n[indices])
+
+    def mul(self, a, b):
+        return a * b % self.n
+
+    def to_residue(self, a):
+        return a % self.n
+
+    def from_residue(self, a):
+        return a
+
+    def pow(self, a, e):
+        return _vector_pow(self, a, e)
+
+def _vector_pow(context, a, e):
+    """a^e for a residue array a and a per-modulus exponent array e."""
+    result = context.one.copy()
+    top = int(e.max()).bit_length() if e.size else 0
+    for bit in range(top - 1, -1, -1):
+        result = context.mul(result, result)
+        set_bit = ((e >> np.uint64(bit)) & _ONE).astype(bool)
+        result = np.where(set_bit, context.mul(result, a), result)
+    return result
+
+def make_context(n):
+    """The cheapest context able to multiply modulo every element of n."""
+    if n.size == 0 or int(n.max()) < 1 << 32:
+        return DirectContext(n)
+    return MontgomeryContext(n)
+
+def vector_powmod(a, e, n):
+    """a^e mod n elementwise, for odd n < 2^63."""
+    n = np.asarray(n, dtype=np.uint64)
+    context = make_context(n)
+    a = np.broadcast_to(np.asarray(a, dtype=np.uint64), n.shape)
+    e = np.broadcast_to(np.asarray(e, dtype=np.uint64), n.shape)
+    return context.from_residue(context.pow(context.to_residue(a), e))
+
+def _prepare(numbers, trial_division=True):
+    """
+    Split the input into exact verdicts for small, even and (with trial_division)
+    trial-divisible numbers, and the indices of the odd numbers still to test.
+    """
+    n = np.asarray(numbers, dtype=np.uint64)
+    if n.size and int(n.max()) >= MAX_VECTOR_MODULUS:
+        raise ValueError("vector kernels need every number below 2^63")
+    verdicts = np.zeros(n.shape, dtype=bool)
+    undecided = (n >= 2) & ((n & _ONE) == 1)
+    verdicts[n == 2] = True
+    if not trial_division:
+        return n, verdicts, np.flatnonzero(undecided)
+    for p in TRIAL_PRIMES:
+        divisible = undecided & (n % np.uint64(p) == 0)
+        verdicts[divisible & (n == p)] = True
+        undecided &= ~divisible
+    # Odd numbers with no factor up to 61 and below 67^2 are prime
+    small = undecided & (n < 67 * 67)
+    verdicts[small] = True
+    undecided &= ~small
+    return n, verdicts, np.flatnonzero(undecided)
+
+def _split_by_size(m):
+    """Index arrays of the moduli below 2^32 and of the larger ones."""
+    small = m < np.uint64(1 << 32)
+    return np.flatnonzero(small), np.flatnonzero(~small)
+
+def _run_tests(m, bases, test):
+    """
+    Apply test(context, base, positions) base after base, each time only to the moduli
+    m[positions] that passed every previous base. Returns the boolean verdicts for m.
+    """
+    alive = np.ones(m.shape, dtype=bool)
+    for group in _split_by_size(m):
+        if group.size == 0:
+            continue
+        context = make_context(m[group])
+        indices = np.arange(group.size)
+        for a in bases:
+            base = np.uint64(a) % context.n
+            passed = test(context, base, group[indices])
+            # A base that reduces to 0, 1 or -1 says nothing about the modulus
+            passed |= (base <= _ONE) | (base == context.n - _ONE)
+            if not passed.all():
+                alive[group[indices[~passed]]] = False
+                keep = np.flatnonzero(passed)
+                indices = indices[keep]
+                context = context.take(keep)
+            if indices.size == 0:
+                break
+    return alive
+
+def _fermat_block(numbers, bases, trial_division):
+    n, verdicts, todo = _prepare(numbers, trial_division)
+    m = n[todo]
+
+    def test(context, base, positions):
+        power = context.pow(context.to_residue(base), context.n - _ONE)
+        return power == context.one
+
+    verdicts[todo] = _run_tests(m, bases, test)
+    return verdicts
+
+def _miller_rabin_block(numbers, bases, trial_division=True):
+    n, verdicts, todo = _prepare(numbers, trial_division)
+    m = n[todo]
+    # m - 1 = 2^s * t, one (s, t) per modulus
+    t = m - _ONE
+    s = np.zeros(m.shape, dtype=np.uint64)
+    even = (t & _ONE) == 0
+    while even.any():
+        t = np.where(even, t >> _ONE, t)
+        s += even
+        even = (t & _ONE) == 0
+
+    def test(context, base, positions):
+        group_t, group_s = t[positions], s[positions]
+        x = context.pow(context.to_residue(base), group_t)
+        passed = (x == context.one) | (x == context.minus_one)
+        for i in range(1, int(group_s.max())):
+            x = context.mul(x, x)
+            passed |= (np.uint64(i) < group_s) & (x == context.minus_one)
+        return passed
+
+    verdicts[todo] = _run_tests(m, bases, test)
+    return verdicts
+
+def _by_block(kernel, numbers, *args):
+    numbers = np.asarray(numbers, dtype=np.uint64)
+    if numbers.size <= BLOCK_SIZE:
+        return kernel(numbers, *args)
+    return np.concatenate([kernel(numbers[i:i + BLOCK_SIZE], *args) for i in range(0, numbers.size, BLOCK_SIZE)])
+
+def vector_fermat(numbers, bases, trial_division=True):
+    """
+    Fermat test of every number to every base; returns a boolean array.
+    trial_division=False skips the small prime divisions, so that the verdicts are those
+    of the bare test (as compute_accuracy measures them).
+    """
+    return _by_block(_fermat_block, numbers, bases, trial_division)
+
+def vector_miller_rabin(numbers, bases=DETERMINISTIC_BASES, trial_division=True):
+    """
+    Strong probable prime test of every number to every base; returns a boolean array.
+    With the default bases the verdicts are exact for all numbers below 2^63.
+    """
+    return _by_block(_miller_rabin_block, numbers, bases, trial_division)
+
+def vector_is_prime(numbers):
+    """Exact primality of every number below 2^63, as a boolean array."""
+    numbers = np.asarray(numbers, dtype=np.uint64)
+    verdicts = np.empty(numbers.shape, dtype=bool)
+    small = numbers < np.uint64(1 << 32)
+    verdicts[small] = _by_block(_miller_rabin_block, numbers[small], SMALL_DETERMINISTIC_BASES)
+    verdicts[~small] = _by_block(_miller_rabin_block, numbers[~small], DETERMINISTIC_BASES)
+    return verdicts
@@ -0,0 +1,202 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import namedtuple
+from bpsw import bpsw_test
+
+# Verdicts, certificates and costs of past primality tests, in one SQLite file shared by
+# every process: WAL mode lets readers proceed while a writer commits, and each process
+# opens its own connection. Least recently used entries are evicted past max_entries.
+DEFAULT_CACHE_PATH = "verdict_cache.sqlite3"
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+# Methods whose verdicts are proofs either way. ECPP only proves primality: it also says
+# False when it fails to find a certificate.
+PROVING_METHODS = ("trial_division", "aks")
+
+# The tests' answers for 0, 1 and 2 vary (Trial_division.miller_rabin_test(2) is False),
+# so numbers below this are never cached
+SMALLEST_CACHED = 3
+
+# BPSW has no pseudoprimes below 2^64, so a verdict stored as proven is checked against it there
+BPSW_EXACT_BOUND = 1 << 64
+
+PROVEN, PROBABLE = "proven", "probable"
+
+# Which proven verdict answers for another method, most trusted first: a certificate can
+# be checked again, ECPP and AKS only report that they succeeded
+_PROOF_PRECEDENCE = ("ecpp", "aks", "trial_division")
+
+CachedVerdict = namedtuple("CachedVerdict", ["n_key", "method", "verdict", "confidence", "certificate", "seconds"])
+
+# Eviction is checked once every this many writes
+_EVICTION_INTERVAL = 1000
+# SQLite limits the number of parameters of one statement
+_BATCH = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    n_key TEXT NOT NULL,
+    method TEXT NOT NULL,
+    verdict TEXT NOT NULL,
+    confidence TEXT NOT NULL,
+    certificate TEXT,
+    seconds REAL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (n_key, method)
+);
+CREATE INDEX IF NOT EXISTS verdicts_last_used ON verdicts (last_used);
+"""
+
+def number_key(n):
+    """n in hexadecimal, or the SHA-256 of that for numbers over 256 bits."""
+    key = format(n, "x")
+    if len(key) > 64:
+        key = "sha256:" + hashlib.sha256(key.encode()).hexdigest()
+    return key
+
+def method_key(name, k=None):
+    """Cache name of a method; probabilistic tests are keyed by their number of rounds too."""
+    return name if k is None else f"{name}:k={k}"
+
+def confidence_of(method, verdict, certificate=None, n=None):
+    """
+    Proven for the verdicts of trial division and AKS, and for ECPP primes or certificates,
+    unless n is small enough to check and the verdict is wrong.
+    """
+    base = method.split(":", 1)[0]
+    if base in PROVING_METHODS or (base == "ecpp" and (verdict is True or certificate is not None)):
+        if n is not None and n < BPSW_EXACT_BOUND and verdict != bpsw_test(n):
+            return PROBABLE
+        return PROVEN
+    return PROBABLE
+
+class VerdictCache:
+    """
+    On-disk cache of primality verdicts keyed by (n, method).
+    With reuse_proven, a proven verdict for n answers a lookup for any method: callers
+    that want the truth about n get it for free, but callers measuring what a given
+    test answers (compute_accuracy) must leave it off.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES, reuse_proven=False):
+        self.path = path
+        self.max_entries = max_entries
+        self.reuse_proven = reuse_proven
+        self._connection = None
+        self._pid = None
+        self._writes = 0
+
+    def _connect(self):
+        # A connection must not cross a fork, so every process opens its own
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection, self._pid = connection, os.getpid()
+        return self._connection
+
+    def close(self):
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _touch(self, connection, rows):
+        now = time.time()
+        connection.executemany("UPDATE verdicts SET last_used = ? WHERE n_key = ? AND method = ?",
+                               [(now, row[0], row[1]) for row in rows])
+
+    @staticmethod
+    def _entry(row):
+        n_key, method, verdict, confidence, certificate, seconds = row
+        return CachedVerdict(n_key, method, json.loads(verdict), confidence, certificate, seconds)
+
+    def get(self, n, method):
+        """The cached verdict of method on n (or a proven one, with reuse_proven), else None."""
+        if n < SMALLEST_CACHED:
+            return None
+        connection = self._connect()
+        key = number_key(n)
+        row = connection.execute("SELECT n_key, method, verdict, confidence, certificate, seconds FROM verdicts "
+                                 "WHERE n_key = ? AND method = ?", (key, method)).fetchone()
+        if row is None and self.reuse_proven:
+            row = self._proven_row(connection, key)
+        if row is None:
+            return None
+        self._touch(connection, [row])
+        return self._entry(row)
+
+    @staticmethod
+    def _proven_row(connection, key):
+        """The most trusted proven verdict for n, or None if there is none or they disagree."""
+        rows = connection.execute("SELECT n_key, method, verdict, confidence, certificate, seconds FROM verdicts "
+                                  "WHERE n_key = ? AND confidence = ? AND verdict IN ('true', 'false')",
+                                  (key, PROVEN)).fetchall()
+        if len({row[2] for row in rows}) != 1:
+            return None
+
+        def precedence(row):
+            base = row[1].split(":", 1)[0]
+            rank = _PROOF_PRECEDENCE.index(base) if base in _PROOF_PRECEDENCE else len(_PROOF_PRECEDENCE)
+            return row[4] is None, rank, row[1]
+        return min(rows, key=precedence)
+
+    def get_many(self, numbers, method):
+        """{n: CachedVerdict} for the numbers with a cached verdict of this exact method."""
+        connection = self._connect()
+        keys = {number_key(int(n)): int(n) for n in numbers if n >= SMALLEST_CACHED}
+        found = {}
+        key_list = list(keys)
+        for i in range(0, len(key_list), _BATCH):
+            batch = key_list[i:i + _BATCH]
+            rows = connection.execute(
+                "SELECT n_key, method, verdict, confidence, certificate, seconds FROM verdicts "
+                f"WHERE method = ? AND n_key IN ({','.join('?' * len(batch))})", [method] + batch).fetchall()
+            self._touch(connection, rows)
+            for row in rows:
+                found[keys[row[0]]] = self._entry(row)
+        return found
+
+    def put(self, n, method, verdict, seconds=None, certificate=None, confidence=None):
+        self.put_many([(n, verdict, seconds, certificate)], method, confidence)
+
+    def put_many(self, entries, method, confidence=None):
+        """Store (n, verdict, seconds, certificate) tuples for one method in a single transaction."""
+        now = time.time()
+        rows = [(number_key(int(n)), method, json.dumps(verdict),
+                 confidence or confidence_of(method, verdict, certificate, int(n)), certificate, seconds, now, now)
+                for n, verdict, seconds, certificate in entries if n >= SMALLEST_CACHED]
+        if not rows:
+            return
+        connection = self._connect()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany("INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        self._writes += len(rows)
+        if self._writes >= _EVICTION_INTERVAL:
+            self._writes = 0
+            self.evict()
+
+    def evict(self):
+        """Drop the least recently used entries beyond max_entries."""
+        connection = self._connect()
+        count = connection.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
+        if count > self.max_entries:
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                connection.execute("DELETE FROM verdicts WHERE rowid IN "
+                                   "(SELECT rowid FROM verdicts ORDER BY last_used LIMIT ?)",
+                                   (count - self.max_entries,))
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]